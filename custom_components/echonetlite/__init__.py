@@ -25,6 +25,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 
 # Throttle removed - UpdateCoordinator handles update intervals
 from pychonet import ECHONETAPIClient
@@ -32,10 +33,16 @@ from pychonet.lib.const import VERSION
 from pychonet.lib.epc import EPC_CODE, EPC_SUPER
 from pychonet.lib.udpserver import UDPServer
 
-from .config_flow import ErrorConnect, async_discover_newhost, enumerate_instances
+from .config_flow import (
+    ErrorConnect,
+    async_discover_newhost,
+    enumerate_instances,
+    verify_instances,
+)
 from .const import (
     DOMAIN,
     MISC_OPTIONS,
+    SIGNAL_INSTANCE_ADDED,
     TEMP_OPTIONS,
     USER_OPTIONS,
 )
@@ -43,6 +50,11 @@ from .connectors import (
     ECHONETConnector,
     DeviceTimeoutError,
 )
+from .classread import async_release_class_read_groups
+from .group import async_setup_services
+from .liveness import async_release_liveness
+from .orchestrator import SetupSlotTimeout, async_get_setup_orchestrator
+from .scheduler import async_release_host_scheduler
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
 _LOGGER = logging.getLogger(__name__)
@@ -68,6 +80,9 @@ DISCOVERY_MIN_BUDGET = 8.0
 INSTANCE_MAX_BUDGET = 30.0
 INSTANCE_MIN_BUDGET = 4.0
 INSTANCE_RETRY_DELAY = 0.3
+# Backoff of the background retries of instances that failed setup
+DEFERRED_RETRY_INITIAL = 30.0
+DEFERRED_RETRY_MAX = 900.0
 
 
 def _remaining_setup_budget(started: float) -> float:
@@ -192,6 +207,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         if server is not None and host is not None:
             _LOGGER.debug("ECHONETLite: unloading host %s from server state", host)
             server.unregister_host(host)
+            async_release_host_scheduler(hass, host)
+            async_release_liveness(hass, host)
+            async_release_class_read_groups(hass, host)
 
     entry.async_on_unload(unload_config_entry)
 
@@ -237,10 +255,28 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
             discovery_budget = min(remaining, DISCOVERY_MAX_BUDGET)
 
-            instances = await _run_with_timeout(
-                enumerate_instances(hass, host),
-                discovery_budget,
-            )
+            # Fast path: one request confirms the stored property maps
+            # still describe the node
+            stored = entry.data.get("instances", [])
+            if await _run_with_timeout(
+                verify_instances(hass, host, stored), discovery_budget
+            ):
+                _LOGGER.debug(
+                    "ECHONETLite: %s unchanged, reusing %d stored instance(s)",
+                    host,
+                    len(stored),
+                )
+                instances = None  # keep the stored configuration
+            else:
+                remaining = _remaining_setup_budget(started)
+                if remaining < DISCOVERY_MIN_BUDGET:
+                    raise ConfigEntryNotReady(
+                        f"Not enough setup time left for ECHONET Lite discovery on {host}"
+                    )
+                instances = await _run_with_timeout(
+                    enumerate_instances(hass, host),
+                    min(remaining, DISCOVERY_MAX_BUDGET),
+                )
 
         except ErrorConnect as ex:
             raise ConfigEntryNotReady(
@@ -253,150 +289,205 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         except asyncio.CancelledError:
             raise
 
-        # Maintain old entity configuration types to avoid duplicate creation of new entities
-        _registed_instances = {}
-        for _instance in entry.data["instances"]:
-            _uidi = f"{_instance['uid']}-{_instance['eojgc']}-{_instance['eojcc']}-{_instance['eojci']}"
-            _registed_instances[_uidi] = _instance
-        for _instance in instances:
-            _uidi = _instance["uidi"]
-            _registed = _registed_instances.get(_uidi)
-            if _registed and _registed.get("uidi") == None:
-                # keep old type config (echonetlite < 3.6.0) # legacy uses _instance['uid']. Shoould be removed in the future
-                del _instance["uidi"]
-
-        hass.config_entries.async_update_entry(
-            entry, title=entry.title, data={"host": host, "instances": instances}
-        )
+        if instances is not None:
+            # Maintain old entity configuration types to avoid duplicate creation of new entities
+            _registed_instances = {}
+            for _instance in entry.data["instances"]:
+                _uidi = f"{_instance['uid']}-{_instance['eojgc']}-{_instance['eojcc']}-{_instance['eojci']}"
+                _registed_instances[_uidi] = _instance
+            for _instance in instances:
+                _uidi = _instance["uidi"]
+                _registed = _registed_instances.get(_uidi)
+                if _registed and _registed.get("uidi") == None:
+                    # keep old type config (echonetlite < 3.6.0) # legacy uses _instance['uid']. Shoould be removed in the future
+                    del _instance["uidi"]
+
+            hass.config_entries.async_update_entry(
+                entry, title=entry.title, data={"host": host, "instances": instances}
+            )
 
     # Pass 1: fetch initial data for all instances without starting any polling
     # schedulers. Keeping all coordinators unregistered during this phase means
     # the _waiting[host] queue is only used by setup batches, preventing
     # earlier instances from blocking later ones (especially important for
     # devices like Panasonic SmartCosmo with many instances on a single IP).
+    # Hosts initialise concurrently through the setup orchestrator, each with
+    # its own budget counted from when it gets its slot; instances sharing a
+    # host still go one after another.
     coordinators: list[tuple[dict, ECHONETConnector]] = []
+    # Instances started from their snapshot, fetched after setup
+    restored: list[ECHONETConnector] = []
+    # Instances that did not answer, retried in the background after setup
+    deferred: list[tuple[dict, ECHONETConnector]] = []
     instance_count = len(entry.data["instances"])
     _LOGGER.debug(
         "ECHONETLite setup Pass 1 starting: %d instance(s) to initialise",
         instance_count,
     )
 
-    for instance in entry.data["instances"]:
-        # auto update to new style
-        if "ntfmap" not in instance:
-            instance["ntfmap"] = []
-        echonetlite = None
-        host = instance["host"]
-        eojgc = instance["eojgc"]
-        eojcc = instance["eojcc"]
-        eojci = instance["eojci"]
-        ntfmap = instance["ntfmap"]
-        getmap = instance["getmap"]
-        setmap = instance["setmap"]
-        uid = instance["uid"]
-
-        # Pre-populate instance state from stored configuration.
-        server.register_instance(
-            host,
-            eojgc,
-            eojcc,
-            eojci,
-            ntfmap=ntfmap,
-            setmap=setmap,
-            getmap=getmap,
-            uid=uid,
-        )
-        _LOGGER.debug(
-            "ECHONETLite Pass 1: instantiating %s-%s-%s at %s (budget remaining: %.1fs)",
-            eojgc,
-            eojcc,
-            eojci,
-            host,
-            _remaining_setup_budget(started),
-        )
-        echonetlite = ECHONETConnector(instance, hass, entry)
-        await echonetlite.startup()
-
-        try:
-            for retry in range(1, 4):
-                remaining = _remaining_setup_budget(started)
-                if remaining < INSTANCE_MIN_BUDGET:
-                    raise ConfigEntryNotReady(
-                        f"Not enough setup time left to initialize ECHONET Lite instances for {host}"
-                    )
-
-                per_try_budget = min(remaining, INSTANCE_MAX_BUDGET)
+    async def _async_init_host(host_instances: list[dict], wait: float) -> None:
+        """Initialise the instances of one host, one after another."""
+        async with orchestrator.host(host_instances[0]["host"], wait) as started:
+            for instance in host_instances:
+                # auto update to new style
+                if "ntfmap" not in instance:
+                    instance["ntfmap"] = []
+                echonetlite = None
+                host = instance["host"]
+                eojgc = instance["eojgc"]
+                eojcc = instance["eojcc"]
+                eojci = instance["eojci"]
+                ntfmap = instance["ntfmap"]
+                getmap = instance["getmap"]
+                setmap = instance["setmap"]
+                uid = instance["uid"]
+
+                # Pre-populate instance state from stored configuration.
+                server.register_instance(
+                    host,
+                    eojgc,
+                    eojcc,
+                    eojci,
+                    ntfmap=ntfmap,
+                    setmap=setmap,
+                    getmap=getmap,
+                    uid=uid,
+                )
                 _LOGGER.debug(
-                    "ECHONETLite Pass 1: fetching data for %s-%s-%s at %s "
-                    "(attempt %s/3, budget %.1fs/%.1fs remaining)",
+                    "ECHONETLite Pass 1: instantiating %s-%s-%s at %s (budget remaining: %.1fs)",
                     eojgc,
                     eojcc,
                     eojci,
                     host,
-                    retry,
-                    per_try_budget,
-                    remaining,
+                    _remaining_setup_budget(started),
                 )
+                echonetlite = ECHONETConnector(instance, hass, entry)
+                await echonetlite.startup()
 
-                try:
-                    await _run_with_timeout(
-                        echonetlite.async_setup_data_fetch(),
-                        per_try_budget,
-                    )
+                if echonetlite.warm_starting:
                     _LOGGER.debug(
-                        "ECHONETLite Pass 1: data fetch succeeded for %s-%s-%s at %s",
+                        "ECHONETLite Pass 1: %s-%s-%s at %s starts from its last known "
+                        "values, fetching after setup",
                         eojgc,
                         eojcc,
                         eojci,
                         host,
                     )
-                    break
-
-                except (
-                    TimeoutError,
-                    asyncio.TimeoutError,
-                    UpdateFailed,
-                    DeviceTimeoutError,
-                ) as ex:
-                    _LOGGER.warning(
-                        "Setting up ECHONET instance %s-%s-%s on %s timed out "
-                        "(retry %s/3, remaining %.1fs)",
-                        eojgc,
-                        eojcc,
-                        eojci,
-                        host,
-                        retry,
-                        _remaining_setup_budget(started),
-                    )
-                    if retry == 3:
-                        raise ConfigEntryNotReady(
-                            f"Initial update timed out for {host}"
-                        ) from ex
+                    coordinators.append((instance, echonetlite))
+                    restored.append(echonetlite)
+                    continue
 
-                    await asyncio.sleep(INSTANCE_RETRY_DELAY)
+                fetched = False
+                try:
+                    for retry in range(1, 4):
+                        remaining = _remaining_setup_budget(started)
+                        if remaining < INSTANCE_MIN_BUDGET:
+                            _LOGGER.warning(
+                                "Not enough setup time left to initialize ECHONET Lite "
+                                "instance %s-%s-%s on %s, retrying it after setup",
+                                eojgc,
+                                eojcc,
+                                eojci,
+                                host,
+                            )
+                            break
+
+                        per_try_budget = min(remaining, INSTANCE_MAX_BUDGET)
+                        _LOGGER.debug(
+                            "ECHONETLite Pass 1: fetching data for %s-%s-%s at %s "
+                            "(attempt %s/3, budget %.1fs/%.1fs remaining)",
+                            eojgc,
+                            eojcc,
+                            eojci,
+                            host,
+                            retry,
+                            per_try_budget,
+                            remaining,
+                        )
 
-        except asyncio.CancelledError:
-            raise
-        except KeyError as ex:
-            raise ConfigEntryNotReady(
-                f"IP address change was detected during setup of {host}"
-            ) from ex
+                        try:
+                            await _run_with_timeout(
+                                echonetlite.async_setup_data_fetch(),
+                                per_try_budget,
+                            )
+                            _LOGGER.debug(
+                                "ECHONETLite Pass 1: data fetch succeeded for %s-%s-%s at %s",
+                                eojgc,
+                                eojcc,
+                                eojci,
+                                host,
+                            )
+                            fetched = True
+                            break
+
+                        except (
+                            TimeoutError,
+                            asyncio.TimeoutError,
+                            UpdateFailed,
+                            DeviceTimeoutError,
+                        ):
+                            _LOGGER.warning(
+                                "Setting up ECHONET instance %s-%s-%s on %s timed out "
+                                "(retry %s/3, remaining %.1fs)",
+                                eojgc,
+                                eojcc,
+                                eojci,
+                                host,
+                                retry,
+                                _remaining_setup_budget(started),
+                            )
+                            if retry < 3:
+                                await asyncio.sleep(INSTANCE_RETRY_DELAY)
 
-        # Data fetched successfully — hold the coordinator until pass 2.
-        _LOGGER.debug(
-            "ECHONETLite Pass 1: %s-%s-%s at %s complete, holding for pass 2",
-            eojgc,
-            eojcc,
-            eojci,
-            host,
-        )
-        coordinators.append((instance, echonetlite))
+                except asyncio.CancelledError:
+                    raise
+                except KeyError as ex:
+                    raise ConfigEntryNotReady(
+                        f"IP address change was detected during setup of {host}"
+                    ) from ex
+
+                if not fetched:
+                    deferred.append((instance, echonetlite))
+                    continue
+
+                # Data fetched successfully — hold the coordinator until pass 2.
+                _LOGGER.debug(
+                    "ECHONETLite Pass 1: %s-%s-%s at %s complete, holding for pass 2",
+                    eojgc,
+                    eojcc,
+                    eojci,
+                    host,
+                )
+                coordinators.append((instance, echonetlite))
+
+    orchestrator = async_get_setup_orchestrator(hass)
+    by_host: dict[str, list[dict]] = {}
+    for instance in entry.data["instances"]:
+        by_host.setdefault(instance["host"], []).append(instance)
+    # Queueing for a slot is bounded by what is left of the entry's budget;
+    # each host's own budget only starts once its slot is granted
+    wait = max(_remaining_setup_budget(started), 0.0)
+    # Wait for every host before failing so none is left initialising
+    results = await asyncio.gather(
+        *(
+            _async_init_host(host_instances, wait)
+            for host_instances in by_host.values()
+        ),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, SetupSlotTimeout):
+            raise ConfigEntryNotReady(str(result)) from result
+        if isinstance(result, BaseException):
+            raise result
 
     _LOGGER.info(
         "ECHONETLite: %d/%d instance(s) initialised, starting scheduler registration",
         len(coordinators),
         instance_count,
     )
+    if not coordinators:
+        raise ConfigEntryNotReady(f"Initial update timed out for {host}")
 
     # Pass 2: all instances have data — register coordinators with HA's
     # scheduling engine without triggering another network poll.
@@ -413,6 +504,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             instance["eojci"],
             instance["host"],
         )
+        echonetlite.join_class_group()
         echonetlite.async_set_updated_data(echonetlite.data)
         _LOGGER.debug(
             "ECHONETLite Pass 2: scheduler started for %s-%s-%s at %s",
@@ -435,16 +527,92 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
     for h, inst_list in hosts.items():
         _LOGGER.info(
-            "ECHONETLite: loaded %d instance(s) on %s: %s",
+            "ECHONETLite: loaded %d instance(s) on %s in %.1fs: %s",
             len(inst_list),
             h,
+            orchestrator.timings.get(h, 0.0),
             ", ".join(inst_list),
         )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    async_setup_services(hass)
+
+    if restored:
+
+        async def _async_fetch_restored():
+            # One instance after another, as Pass 1 would have
+            for echonetlite in restored:
+                await echonetlite.async_warm_start_fetch()
+
+        entry.async_create_background_task(
+            hass, _async_fetch_restored(), f"{DOMAIN} warm start fetch {host}"
+        )
+    if deferred:
+        _LOGGER.warning(
+            "ECHONETLite: %d instance(s) on %s did not answer, retrying in the background",
+            len(deferred),
+            host,
+        )
+        entry.async_create_background_task(
+            hass,
+            _async_setup_deferred(hass, entry, deferred),
+            f"{DOMAIN} deferred setup {host}",
+        )
     return True
 
 
+async def _async_setup_deferred(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    deferred: list[tuple[dict, ECHONETConnector]],
+) -> None:
+    """Retry instances that failed setup until they answer.
+
+    Each round waits twice as long as the previous one, up to
+    DEFERRED_RETRY_MAX. An instance that answers is registered like in Pass 2
+    and announced with SIGNAL_INSTANCE_ADDED so the platforms add its
+    entities.
+    """
+    delay = DEFERRED_RETRY_INITIAL
+    while deferred:
+        await asyncio.sleep(delay)
+        for instance, echonetlite in list(deferred):
+            try:
+                await _run_with_timeout(
+                    echonetlite.async_setup_data_fetch(), INSTANCE_MAX_BUDGET
+                )
+            except Exception as err:
+                # Whatever went wrong, keep retrying: ending the task would
+                # leave the instance without entities until a reload
+                _LOGGER.debug(
+                    "ECHONETLite: deferred %s-%s-%s at %s still failing (%r), "
+                    "next try in %.0fs",
+                    instance["eojgc"],
+                    instance["eojcc"],
+                    instance["eojci"],
+                    instance["host"],
+                    err,
+                    min(delay * 2, DEFERRED_RETRY_MAX),
+                )
+                continue
+            deferred.remove((instance, echonetlite))
+            _LOGGER.info(
+                "ECHONETLite: deferred instance %s-%s-%s at %s answered, adding it",
+                instance["eojgc"],
+                instance["eojcc"],
+                instance["eojci"],
+                instance["host"],
+            )
+            echonetlite.join_class_group()
+            echonetlite.async_set_updated_data(echonetlite.data)
+            added = {"instance": instance, "echonetlite": echonetlite}
+            hass.data[DOMAIN][entry.entry_id].append(added)
+            async_dispatcher_send(
+                hass, SIGNAL_INSTANCE_ADDED.format(entry.entry_id), added
+            )
+        delay = min(delay * 2, DEFERRED_RETRY_MAX)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -1,21 +1,68 @@
 """Base entity for ECHONETLite."""
 
-from .const import DOMAIN
+from collections.abc import Awaitable, Callable
+
+from .const import DOMAIN, SIGNAL_INSTANCE_ADDED
 from . import get_device_name
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 
+async def async_setup_instances(
+    hass, config, add_instances: Callable[[list[dict]], Awaitable[None]]
+) -> None:
+    """Add entities for the entry's instances, now and as they come up later.
+
+    Instances that did not answer during setup are retried in the background.
+    add_instances is called with the instances loaded so far, then again with
+    each deferred instance once it has been set up.
+
+    Args:
+        hass: The Home Assistant instance.
+        config: The config entry.
+        add_instances: Creates and adds the platform's entities for a list of
+            {"instance", "echonetlite"} entries.
+    """
+    await add_instances(list(hass.data[DOMAIN][config.entry_id]))
+
+    async def _async_instance_added(added: dict) -> None:
+        await add_instances([added])
+
+    config.async_on_unload(
+        async_dispatcher_connect(
+            hass,
+            SIGNAL_INSTANCE_ADDED.format(config.entry_id),
+            _async_instance_added,
+        )
+    )
+
+
 class EchonetEntity(CoordinatorEntity):
     """Base class for ECHONETLite entities."""
 
     _attr_translation_key = DOMAIN
 
-    def __init__(self, coordinator, config, **kwargs) -> None:
-        super().__init__(coordinator)
+    def __init__(self, coordinator, config, epcs=None, **kwargs) -> None:
+        # Entities that name the EPCs they read are only notified when one of
+        # those changes; without epcs they are notified on every update.
+        super().__init__(
+            coordinator, context=frozenset(epcs) if epcs is not None else None
+        )
         name = get_device_name(coordinator, config)
         self._attr_name = name
         self._device_name = name
 
+    async def async_update(self) -> None:
+        """Update the entity, unless it is showing restored values.
+
+        Entities are added with update_before_add. During a warm start that
+        would read every device before setup can finish, which is exactly
+        what the restored values are there to avoid.
+        """
+        if self.coordinator.warm_starting:
+            return
+        await super().async_update()
+
     @property
     def device_info(self):
         """Return device information for this entity."""
@@ -1,5 +1,6 @@
 """Support for ECHONETLite sensors."""
 
+from functools import partial
 import logging
 import voluptuous as vol
 
@@ -10,7 +11,7 @@ from homeassistant.const import (
     CONF_TYPE,
 )
 from homeassistant.helpers import config_validation as cv, entity_platform
-from .base_entity import EchonetEntity
+from .base_entity import EchonetEntity, async_setup_instances
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
 
@@ -34,7 +35,6 @@ from .connectors import (
 
 
 from .const import (
-    DOMAIN,
     ENABLE_SUPER_ENERGY_DEFAULT,
     ENL_OP_CODES,
     CONF_STATE_CLASS,
@@ -52,6 +52,7 @@ from .const import (
     TYPE_DATA_ARRAY_WITH_SIZE_OPCODE,
     CONF_DISABLED_DEFAULT,
 )
+from .scheduler import PRIORITY_VERIFY
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -70,9 +71,18 @@ MAP_BINARY_STATE = {
 
 
 async def async_setup_entry(hass, config, async_add_entities, discovery_info=None):
-    entities = []
     platform = entity_platform.async_get_current_platform()
-    for entity in hass.data[DOMAIN][config.entry_id]:
+    await async_setup_instances(
+        hass,
+        config,
+        partial(_async_add_instances, hass, config, async_add_entities, platform),
+    )
+
+
+async def _async_add_instances(hass, config, async_add_entities, platform, instances):
+    """Add the entities of instances."""
+    entities = []
+    for entity in instances:
         _LOGGER.debug(f"Configuring ECHONETLite binary sensor {entity}")
         _LOGGER.debug(
             f"Update flags for this binary sensor are {entity['echonetlite']._update_flags_full_list}"
@@ -176,8 +186,9 @@ async def async_setup_entry(hass, config, async_add_entities, discovery_info=Non
                     array_size_op_code = _enl_op_codes[op_code][
                         TYPE_DATA_ARRAY_WITH_SIZE_OPCODE
                     ]
-                    array_max_size = await entity["echonetlite"]._instance.update(
-                        array_size_op_code
+                    array_max_size = await entity["echonetlite"].async_send(
+                        entity["echonetlite"]._instance.update(array_size_op_code),
+                        PRIORITY_VERIFY,
                     )
                     for x in range(0, array_max_size):
                         attr = _enl_op_codes[op_code].copy()
@@ -224,7 +235,7 @@ class EchonetBinarySensor(EchonetEntity, BinarySensorEntity):
     def __init__(self, coordinator, config, epc_code, attributes) -> None:
         """Initialize the sensor."""
         # Initialize coordinator first - must call parent before setting other properties
-        super().__init__(coordinator, config)
+        super().__init__(coordinator, config, epcs=[epc_code])
 
         self._op_code = epc_code
         self._sensor_attributes = attributes
@@ -0,0 +1,231 @@
+"""Class-wide reads shared by sibling instances on one host."""
+
+import asyncio
+import logging
+import time
+
+from homeassistant.core import HomeAssistant
+from pychonet.lib.const import GET, GET_SNA, GETRES
+from pychonet.lib.functions import buildEchonetMsg, decodeEchonetMsg
+
+from .const import DOMAIN
+from .monitor import ECHONET_PORT, FrameMonitor
+from .scheduler import PRIORITY_POLL, HostScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+# Instance code addressing every instance of a class on a node
+ALL_INSTANCES = 0x00
+# How long answers are collected, in multiples of the host's RTO
+CLASS_READ_WAIT_RTOS = 2
+
+
+class ClassReadGroup:
+    """Read the same EPCs from every instance of a class with one Get.
+
+    Gateways such as lighting controllers or WTY2001 adapters expose many
+    instances of one class behind a single IP. A Get addressed to instance
+    code 0x00 is answered by each of them, so one frame on the wire replaces
+    one per instance. The answers are kept per instance with the time they
+    arrived; a sibling polling shortly after takes its values from there
+    instead of asking again.
+
+    A node that leaves the first class-wide Get completely unanswered is
+    assumed not to support instance code 0x00 and the group stops trying
+    for the rest of the session.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        eoj: tuple[int, int],
+        scheduler: HostScheduler,
+        monitor: FrameMonitor,
+    ):
+        """Initialize the group.
+
+        Args:
+            host: IP address of the node.
+            eoj: (group code, class code) shared by the instances.
+            scheduler: The host's request scheduler.
+            monitor: The frame monitor of the shared API client.
+        """
+        self.host = host
+        self.eoj = eoj
+        self._scheduler = scheduler
+        self._monitor = monitor
+        # instance code -> EPCs in its GETMAP
+        self._members: dict[int, frozenset[int]] = {}
+        # instance code -> EPC -> (monotonic time received, EDT)
+        self._values: dict[int, dict[int, tuple[float, bytes]]] = {}
+        self._answered = False
+        self.disabled = False
+
+    @property
+    def active(self) -> bool:
+        """Return True if class-wide reads are worth trying."""
+        return not self.disabled and len(self._members) > 1
+
+    @property
+    def shared_epcs(self) -> frozenset[int]:
+        """Return the EPCs every member can be read for."""
+        if not self._members:
+            return frozenset()
+        return frozenset.intersection(*self._members.values())
+
+    def is_member(self, instance: int) -> bool:
+        """Return True if instance has joined the group."""
+        return instance in self._members
+
+    def join(self, instance: int, getmap) -> None:
+        """Add an instance with the EPCs of its GETMAP to the group."""
+        self._members[instance] = frozenset(getmap)
+        self._values.setdefault(instance, {})
+
+    def forget(self, instance: int, epcs) -> None:
+        """Drop the values of epcs read for instance.
+
+        Called whenever the instance gets a value of its own: a write, a
+        push or a read. A class-wide answer received before that is older
+        than what the instance has and must not overwrite it.
+        """
+        values = self._values.get(instance)
+        if values:
+            for epc in epcs:
+                values.pop(epc, None)
+
+    def _collect(self, host: str, data: bytes, answered: set, done) -> None:
+        """Store one instance's answer to a class-wide Get."""
+        if host != self.host:
+            return
+        try:
+            message = decodeEchonetMsg(data)
+        except Exception:
+            return
+        eoj = (message["SEOJGC"], message["SEOJCC"])
+        if eoj != self.eoj or message["ESV"] not in (GETRES, GET_SNA):
+            return
+        instance = message["SEOJCI"]
+        if instance not in self._members:
+            return
+        now = time.monotonic()
+        values = self._values[instance]
+        for opc in message["OPC"]:
+            # Get_SNA returns unreadable properties with PDC 0
+            if opc["PDC"]:
+                values[opc["EPC"]] = (now, opc["EDT"])
+        answered.add(instance)
+        if answered >= self._members.keys():
+            done.set()
+
+    async def async_read(
+        self, instance: int, epcs: list[int], max_age: float
+    ) -> dict[int, bytes]:
+        """Return raw EDTs of epcs for instance, reading class-wide if needed.
+
+        Values another member's read fetched less than max_age seconds ago
+        are used as they are. The rest are requested from all instances with
+        one Get to instance code 0x00.
+
+        Args:
+            instance: Instance code of the caller.
+            epcs: EPCs to read, all in shared_epcs.
+            max_age: Oldest a shared value may be, in seconds.
+
+        Returns:
+            EPC -> EDT for the EPCs that could be read. The caller reads the
+            missing ones from its own instance as usual.
+        """
+        if self._fresh(instance, epcs, max_age) != set(epcs) and self.active:
+            async with self._scheduler.slot(PRIORITY_POLL, f"class-{self.eoj}"):
+                # A sibling may have read them while we waited for the slot
+                fresh = self._fresh(instance, epcs, max_age)
+                missing = [epc for epc in epcs if epc not in fresh]
+                if missing and self.active:
+                    await self._async_request(missing)
+        values = self._values[instance]
+        return {epc: values[epc][1] for epc in self._fresh(instance, epcs, max_age)}
+
+    def _fresh(self, instance: int, epcs: list[int], max_age: float) -> set[int]:
+        """Return the epcs with a value for instance at most max_age old."""
+        now = time.monotonic()
+        values = self._values[instance]
+        return {
+            epc for epc in epcs if epc in values and now - values[epc][0] <= max_age
+        }
+
+    async def _async_request(self, epcs: list[int]) -> None:
+        """Send one class-wide Get and collect the answers.
+
+        Must be called holding the host's request slot.
+        """
+        answered: set[int] = set()
+        done = asyncio.Event()
+        tid = self._monitor.next_tid()
+        payload = buildEchonetMsg(
+            {
+                "TID": tid,
+                "DEOJGC": self.eoj[0],
+                "DEOJCC": self.eoj[1],
+                "DEOJCI": ALL_INSTANCES,
+                "ESV": GET,
+                "OPC": [{"EPC": epc} for epc in epcs],
+            }
+        )
+        self._monitor.collect(
+            tid, lambda host, data: self._collect(host, data, answered, done)
+        )
+        try:
+            self._monitor.send_raw(payload, (self.host, ECHONET_PORT))
+            try:
+                await asyncio.wait_for(
+                    done.wait(), self._scheduler.rto * CLASS_READ_WAIT_RTOS
+                )
+            except asyncio.TimeoutError:
+                pass
+        finally:
+            self._monitor.stop_collecting(tid)
+        if not answered:
+            self._scheduler.record_timeout()
+
+        _LOGGER.debug(
+            "ECHONETLite: class-wide read of %s from %s-%s at %s answered by %d/%d instance(s)",
+            [hex(epc) for epc in epcs],
+            self.eoj[0],
+            self.eoj[1],
+            self.host,
+            len(answered),
+            len(self._members),
+        )
+        if answered:
+            self._answered = True
+        elif not self._answered:
+            _LOGGER.debug(
+                "ECHONETLite: %s does not answer instance code 0x00 for %s-%s, "
+                "reading instances one by one",
+                self.host,
+                self.eoj[0],
+                self.eoj[1],
+            )
+            self.disabled = True
+
+
+def async_get_class_read_group(
+    hass: HomeAssistant,
+    host: str,
+    eoj: tuple[int, int],
+    scheduler: HostScheduler,
+    monitor: FrameMonitor,
+) -> ClassReadGroup:
+    """Return the shared read group for a class on host, creating it once."""
+    groups = hass.data[DOMAIN].setdefault("class_groups", {})
+    if (host, *eoj) not in groups:
+        groups[(host, *eoj)] = ClassReadGroup(host, eoj, scheduler, monitor)
+    return groups[(host, *eoj)]
+
+
+def async_release_class_read_groups(hass: HomeAssistant, host: str) -> None:
+    """Drop the read groups of host once it has been unregistered."""
+    groups = hass.data.get(DOMAIN, {}).get("class_groups", {})
+    for key in [key for key in groups if key[0] == host]:
+        del groups[key]
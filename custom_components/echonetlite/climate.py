@@ -1,3 +1,4 @@
+from functools import partial
 import logging
 import math
 
@@ -39,8 +40,8 @@ from pychonet.HomeAirConditioner import (
 from pychonet.lib.eojx import EOJX_CLASS
 
 from . import get_device_name
-from .const import DATA_STATE_ON, DOMAIN, OPTION_HA_UI_SWING
-from .base_entity import EchonetEntity
+from .const import DATA_STATE_ON, OPTION_HA_UI_SWING
+from .base_entity import EchonetEntity, async_setup_instances
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -68,13 +69,11 @@ ATTR_HUMIDITY = "humidity"
 
 async def async_setup_entry(hass, config_entry, async_add_devices):
     """Set up entry."""
-    entities = []
-    for entity in hass.data[DOMAIN][config_entry.entry_id]:
-        if (
-            entity["instance"]["eojgc"] == 0x01 and entity["instance"]["eojcc"] == 0x30
-        ):  # Home Air Conditioner
-            entities.append(EchonetClimate(entity["echonetlite"], config_entry))
-    async_add_devices(entities, True)
+    await async_setup_instances(
+        hass,
+        config_entry,
+        partial(_async_add_instances, hass, config_entry, async_add_devices),
+    )
 
     platform = entity_platform.async_get_current_platform()
 
@@ -88,6 +87,17 @@ async def async_setup_entry(hass, config_entry, async_add_devices):
     )
 
 
+async def _async_add_instances(hass, config_entry, async_add_devices, instances):
+    """Add the entities of instances."""
+    entities = []
+    for entity in instances:
+        if (
+            entity["instance"]["eojgc"] == 0x01 and entity["instance"]["eojcc"] == 0x30
+        ):  # Home Air Conditioner
+            entities.append(EchonetClimate(entity["echonetlite"], config_entry))
+    async_add_devices(entities, True)
+
+
 class EchonetClimate(EchonetEntity, ClimateEntity):
     """Representation of an ECHONETLite climate device."""
 
@@ -326,76 +336,70 @@ class EchonetClimate(EchonetEntity, ClimateEntity):
     async def async_set_fan_mode(self, fan_mode):
         """Set new fan mode with snappy verification."""
         await self.coordinator.async_set_and_verify(
-            [0xA0], self.coordinator._instance.setFanSpeed(fan_mode)
+            [0xA0], self.coordinator._instance.setFanSpeed, fan_mode
         )
 
     async def async_set_preset_mode(self, preset_mode):
         """Set new preset mode - This is normal/high-speed/silent"""
         # Assuming 0xB2 is the EPC for Silent/Preset mode
         await self.coordinator.async_set_and_verify(
-            [0xB2], self.coordinator._instance.setSilentMode(preset_mode)
+            [0xB2], self.coordinator._instance.setSilentMode, preset_mode
         )
 
     async def async_set_swing_mode(self, swing_mode):
         """Set new swing mode with snappy verification."""
         # 1. Determine which EPC we are actually targeting
         if swing_mode in self._opc_data[ENL_AUTO_DIRECTION]:
-            epc, coro = ENL_AUTO_DIRECTION, self.coordinator._instance.setAutoDirection(
-                swing_mode
-            )
+            epc, setter = ENL_AUTO_DIRECTION, self.coordinator._instance.setAutoDirection
         elif swing_mode in self._opc_data[ENL_SWING_MODE]:
-            epc, coro = ENL_SWING_MODE, self.coordinator._instance.setSwingMode(
-                swing_mode
-            )
+            epc, setter = ENL_SWING_MODE, self.coordinator._instance.setSwingMode
         else:
-            epc, coro = ENL_AIR_VERT, self.coordinator._instance.setAirflowVert(
-                swing_mode
-            )
+            epc, setter = ENL_AIR_VERT, self.coordinator._instance.setAirflowVert
 
         # 2. Use the helper for the optimistic update and targeted poll
-        await self.coordinator.async_set_and_verify([epc], coro)
+        await self.coordinator.async_set_and_verify([epc], setter, swing_mode)
 
     async def async_set_swing_horizontal_mode(self, swing_horizontal_mode):
         """Set new horizontal swing mode with snappy verification."""
         if swing_horizontal_mode in self._opc_data[ENL_AUTO_DIRECTION]:
-            epc, coro = ENL_AUTO_DIRECTION, self.coordinator._instance.setAutoDirection(
-                swing_horizontal_mode
-            )
+            epc, setter = ENL_AUTO_DIRECTION, self.coordinator._instance.setAutoDirection
         elif swing_horizontal_mode in self._opc_data[ENL_SWING_MODE]:
-            epc, coro = ENL_SWING_MODE, self.coordinator._instance.setSwingMode(
-                swing_horizontal_mode
-            )
+            epc, setter = ENL_SWING_MODE, self.coordinator._instance.setSwingMode
         else:
-            epc, coro = ENL_AIR_HORZ, self.coordinator._instance.setAirflowHoriz(
-                swing_horizontal_mode
-            )
+            epc, setter = ENL_AIR_HORZ, self.coordinator._instance.setAirflowHoriz
 
-        await self.coordinator.async_set_and_verify([epc], coro)
+        await self.coordinator.async_set_and_verify(
+            [epc], setter, swing_horizontal_mode
+        )
 
     async def async_set_temperature(self, **kwargs):
         """Set new target temperatures with snappy verification."""
-        # 1. Handle HVAC Mode change if present
+        # 1. Collect the HVAC Mode change if present
+        instance = self.coordinator._instance
+        transaction = self.coordinator.write_transaction()
         hvac_mode = kwargs.get(ATTR_HVAC_MODE)
         if hvac_mode is not None:
-            # This will trigger its own async_set_and_verify within async_set_hvac_mode
-            await self.async_set_hvac_mode(hvac_mode)
+            target_mode = "auto" if hvac_mode == "heat_cool" else hvac_mode
+            # Power (0x80) and Mode (0xB0), as async_set_hvac_mode sends them
+            await transaction.add(instance.setMode, target_mode)
 
-        # 2. Handle Temperature change
+        # 2. Collect the Temperature change
         temp_val = kwargs.get(ATTR_TEMPERATURE)
         if temp_val is not None:
             settemp = self._normalize_settemp(temp_val)
-            # Use the helper for the temp EPC (usually 0xB3)
-            await self.coordinator.async_set_and_verify(
-                [ENL_HVAC_SET_TEMP],  # Replace with your actual EPC constant
-                self.coordinator._instance.setOperationalTemperature(settemp),
-            )
+            # Usually 0xB3
+            await transaction.add(instance.setOperationalTemperature, settemp)
+
+        # 3. Send mode and temperature in one SetC frame, then verify them together
+        await self.coordinator.async_commit(transaction, verify=True)
 
     async def async_set_humidity(self, humidity: int) -> None:
         """Set new target humidity."""
         # Use the helper for the humidity EPC (usually 0xB4)
         await self.coordinator.async_set_and_verify(
             [ENL_HVAC_SET_HUMIDITY],  # Replace with your actual EPC constant
-            self.coordinator._instance.setOperationalHumidity(humidity),
+            self.coordinator._instance.setOperationalHumidity,
+            humidity,
         )
 
     async def async_set_hvac_mode(self, hvac_mode):
@@ -405,7 +409,7 @@ class EchonetClimate(EchonetEntity, ClimateEntity):
         # We update both Power (0x80) and Mode (0xB0)
         # because 'off' changes 0x80, and 'heat' changes both.
         await self.coordinator.async_set_and_verify(
-            [0x80, 0xB0], self.coordinator._instance.setMode(target_mode)
+            [0x80, 0xB0], self.coordinator._instance.setMode, target_mode
         )
 
     async def async_turn_on(self):
@@ -414,18 +418,20 @@ class EchonetClimate(EchonetEntity, ClimateEntity):
         # the UI lights up both the power toggle and the mode icon.
         await self.coordinator.async_set_and_verify(
             [0x80, 0xB0],  # Or the appropriate internal state for 'on'
-            self.coordinator._instance.on(),
+            self.coordinator._instance.on,
         )
 
     async def async_turn_off(self):
         """Turn off with snappy verification."""
         await self.coordinator.async_set_and_verify(
-            [0x80, 0xB0], self.coordinator._instance.off()
+            [0x80, 0xB0], self.coordinator._instance.off
         )
 
     async def async_set_humidifier_during_heater(self, state, humidity):
         """Handle boost heating service call."""
-        await self.coordinator._instance.setHeaterHumidifier(state, humidity)
+        await self.coordinator.async_send(
+            self.coordinator._instance.setHeaterHumidifier(state, humidity)
+        )
 
     async def async_added_to_hass(self):
         """Register callbacks."""
@@ -26,9 +26,16 @@ from pychonet.lib.const import (
     ENL_GETMAP,
     ENL_SETMAP,
     ENL_STATMAP,
+    ENL_UID,
     GET,
+    GETRES,
+    INSTANCE_LIST,
 )
-from pychonet.lib.epc_functions import _null_padded_optional_string
+from pychonet.lib.epc_functions import (
+    EPC_SUPER_FUNCTIONS,
+    _null_padded_optional_string,
+)
+from pychonet.lib.functions import buildEchonetMsg, decodeEchonetMsg
 
 # from aioudp import UDPServer
 from pychonet.lib.udpserver import UDPServer
@@ -42,6 +49,8 @@ from .const import (
     TEMP_OPTIONS,
     USER_OPTIONS,
 )
+from .monitor import async_get_frame_monitor
+from .scheduler import PRIORITY_POLL, async_get_host_scheduler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -68,7 +77,9 @@ async def enumerate_instances(
         _LOGGER.debug("API listener actively setup, reusing it for enumeration.")
         server = hass.data[DOMAIN]["api"]
         for key in hass.data[DOMAIN]:
-            if key != "api":
+            # Only config entry ids map to instance lists; shared objects
+            # such as "api" or "schedulers" are skipped.
+            if isinstance(hass.data[DOMAIN][key], list):
                 entries = hass.data[DOMAIN][key]
                 if len(entries):
                     inst = entries[0].get("instance")
@@ -253,6 +264,98 @@ async def enumerate_instances(
         pass  # server is a shared resource — never closed here
 
 
+async def verify_instances(
+    hass: HomeAssistant, host: str, instances: list[dict[str, Any]]
+) -> bool:
+    """Check that the node at host still is what instances describe.
+
+    A single Get of the node profile's identification number (0x83) and
+    instance list (0xD6) is compared with the stored configuration. If both
+    match, the stored property maps can be used without enumerating the
+    node again.
+
+    Args:
+        hass: The Home Assistant instance.
+        host: IP address of the node.
+        instances: The instances stored in the config entry.
+
+    Returns:
+        True if the node answered and nothing changed.
+    """
+    if not instances or any("getmap" not in instance for instance in instances):
+        return False
+    # The answer is parsed here rather than by pychonet, so its node state
+    # is only touched once the node is confirmed unchanged
+    monitor = async_get_frame_monitor(hass)
+    scheduler = async_get_host_scheduler(hass, host)
+    payload = buildEchonetMsg(
+        {
+            "TID": monitor.next_tid(),
+            "DEOJGC": 0x0E,
+            "DEOJCC": 0xF0,
+            "DEOJCI": 0x01,
+            "ESV": GET,
+            "OPC": [{"EPC": ENL_UID}, {"EPC": INSTANCE_LIST}],
+        }
+    )
+    try:
+        async with scheduler.slot(PRIORITY_POLL, "verify"):
+            response = await monitor.async_exchange(host, payload, scheduler)
+        message = decodeEchonetMsg(response)
+    except TimeoutError:
+        return False
+    except Exception:
+        _LOGGER.debug("%s - could not decode the identification answer", host)
+        return False
+    if message["ESV"] != GETRES:
+        return False
+    answer = {opc["EPC"]: opc["EDT"] for opc in message["OPC"]}
+    uid = EPC_SUPER_FUNCTIONS[ENL_UID](answer.get(ENL_UID), host)
+    edt = bytes(answer.get(INSTANCE_LIST) or b"")
+    listed = {
+        (edt[1 + 3 * x], edt[2 + 3 * x], edt[3 + 3 * x])
+        for x in range(edt[0] if edt else 0)
+        if 3 + 3 * x < len(edt) and edt[1 + 3 * x] != 0x0F
+    }
+    stored = {
+        (instance["eojgc"], instance["eojcc"], instance["eojci"])
+        for instance in instances
+    }
+    if uid != instances[0]["uid"] or listed != stored:
+        _LOGGER.debug(
+            "%s - node changed since it was configured, enumerating it again", host
+        )
+        return False
+    server = hass.data[DOMAIN]["api"]
+    # Same shape as ECHONETAPIClient.register_instance() creates
+    state = server._state.setdefault(host, {"instances": {}, "available": True})
+    state["uid"] = uid
+    # Not asked for; keep the node state as complete as a full discovery
+    state["manufacturer"] = instances[0].get("manufacturer")
+    state["product_code"] = instances[0].get("host_product_code")
+    # Instances pychonet already created, e.g. from a discovery, may hold
+    # empty property maps that register_instance() leaves alone and every
+    # Get would be filtered against. Restore the stored maps.
+    for instance in instances:
+        known = (
+            state["instances"]
+            .get(instance["eojgc"], {})
+            .get(instance["eojcc"], {})
+            .get(instance["eojci"])
+        )
+        if known is None:
+            continue
+        known.update(
+            {
+                ENL_STATMAP: instance.get("ntfmap", []),
+                ENL_SETMAP: instance["setmap"],
+                ENL_GETMAP: instance["getmap"],
+                ENL_UID: instance["uid"],
+            }
+        )
+    return True
+
+
 async def async_discover_newhost(hass, host, init_server=None):
     if host not in _detected_hosts.keys():
         try:
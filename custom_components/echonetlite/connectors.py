@@ -2,24 +2,27 @@
 
 import asyncio
 import logging
-import os
+import time
 from functools import partial
-from importlib import import_module
 from typing import Any
 from datetime import timedelta
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from pychonet import ECHONETAPIClient
 from pychonet.echonetapiclient import EchonetMaxOpcError
+from pychonet.lib.const import INF
 from pychonet.lib.epc import EPC_SUPER
 from pychonet.lib.epc_functions import _hh_mm
 
 from .const import (
     CONF_BATCH_SIZE_MAX,
     CONF_FORCE_POLLING,
+    CONF_INF_REQ_POLLING,
+    CONF_PUSH_COALESCE_MS,
+    CONF_PUSH_MAX_AGE,
     CONF_ENABLE_SUPER_ENERGY,
     DOMAIN,
     ENABLE_SUPER_ENERGY_DEFAULT,
@@ -31,7 +34,34 @@ from .const import (
     USER_OPTIONS,
 )
 
+from .classread import async_get_class_read_group
 from .config_flow import ErrorConnect
+from .liveness import async_get_liveness_probe
+from .quirkindex import async_get_quirk
+from .polling import (
+    BatchPacker,
+    BatchSizer,
+    PushReliability,
+    RefreshPlanner,
+    VerifyTimings,
+)
+from .scheduler import (
+    PRIORITY_POLL,
+    PRIORITY_VERIFY,
+    PRIORITY_WRITE,
+    async_get_host_scheduler,
+)
+from .monitor import (
+    ESV_OFFSET,
+    async_get_frame_monitor,
+    build_inf_req,
+    build_setget,
+    parse_epcs,
+    parse_setget,
+    set_results,
+)
+from .storage import async_get_profile_store, async_get_snapshot_store
+from .transaction import WriteTransaction
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -46,14 +76,13 @@ MIN_TIME_BETWEEN_UPDATES = timedelta(seconds=30)
 # this duration. Matches pyhems' RuntimeMonitor threshold.
 ACTIVITY_TIMEOUT = 300  # 5 minutes
 
-# Per-host semaphore to serialise poll cycles across all ECHONETConnector
-# instances sharing the same host IP. Embedded ECHONET devices have limited
-# UDP stacks and can drop frames if polled concurrently. A semaphore(1) ensures
-# only one instance polls a given host at a time — others wait their turn rather
-# than piling up requests. This gives embedded firmware breathing room and
-# naturally staggers requests without any fixed time delays.
-# Shared across all ECHONETConnector instances via a module-level dict.
-_host_semaphores: dict[str, asyncio.Semaphore] = {}
+# Writes landing within the learned settle time of a pending verify read push
+# it back so they are all verified together, but never beyond
+# VERIFY_MAX_DELAY after the first of them.
+VERIFY_MAX_DELAY = 2.4
+
+# Longest a push notification is held back by the push coalescing window.
+PUSH_COALESCE_MAX_LATENCY = 1.0
 
 
 def regist_as_inputs(epc_function_data):
@@ -184,6 +213,66 @@ class ECHONETConnector(DataUpdateCoordinator[dict]):
         self._singleton_poll_epcs: list[int] = (
             []
         )  # EPCs polled individually due to quirk
+        # EPCs eligible for ongoing polling (full list minus singletons and
+        # push-served EPCs), in request order
+        self._poll_list: list[int] = []
+
+        # Per-EPC refresh tiers learned from how often values actually change
+        self._refresh = RefreshPlanner(self._setPropertyMap)
+
+        # Per-instance batch size controller, byte-aware batch packer and the
+        # persisted profile they are learned into - all set up in startup()
+        self._batch_sizer: BatchSizer | None = None
+        self._packer: BatchPacker | None = None
+        self._profile_store = None
+        self._profile: dict[str, Any] = {}
+        # Last known values saved across restarts, see startup()
+        self._snapshot_store = None
+        # Wall-clock time fresh data was last published, for the snapshot
+        self._received_at: float | None = None
+        # True while entities show restored values and the first real fetch
+        # is still pending
+        self.warm_starting = False
+
+        # In-flight reads: EPC -> (time the read was issued, shared result)
+        self._inflight_reads: dict[int, tuple[float, asyncio.Future]] = {}
+
+        # EPCs waiting for the next merged verify read, and the verify task
+        self._verify_epcs: set[int] = set()
+        self._verify_first = 0.0
+        self._verify_due = 0.0
+        self._verify_task: asyncio.Task | None = None
+        # Written values verify reads are compared with: EPC -> (before, after)
+        self._verify_expected: dict[int, tuple[Any, Any]] = {}
+
+        # Coalesced writes not sent yet: EPCs -> (transaction, result), and
+        # the task sending them
+        self._pending_writes: dict[
+            tuple[int, ...], tuple[WriteTransaction, asyncio.Future]
+        ] = {}
+        self._write_senders: dict[tuple[int, ...], asyncio.Task] = {}
+
+        # Written EPCs waiting to be announced: EPC -> time of the write
+        self._push_pending: dict[int, float] = {}
+        self._push_task: asyncio.Task | None = None
+        # EPCs carried by INF frames pychonet has not called back for yet
+        self._push_epcs: set[int] = set()
+        # Pushed EPCs waiting for the coalescing window to close
+        self._coalesced_epcs: set[int] = set()
+        self._coalesce_first = 0.0
+        self._coalesce_due = 0.0
+        self._coalesce_task: asyncio.Task | None = None
+        # Confirmation timings shared by the device class, set up in startup()
+        self._timings: VerifyTimings | None = None
+        # When each EPC last arrived by INF or read, for staleness refresh
+        self._updated_at: dict[int, float] = {}
+        # Which STATMAP EPCs really arrive by INF, set up in startup()
+        self._push_reliability: PushReliability | None = None
+
+        # What the entities were last notified of, to notify only those whose
+        # EPCs changed - see async_update_listeners()
+        self._published: dict[int, Any] = {}
+        self._published_success = True
 
         # Callbacks for push notifications and option updates
         self._update_callbacks: list[callable] = []
@@ -195,6 +284,31 @@ class ECHONETConnector(DataUpdateCoordinator[dict]):
         # Get API instance from Home Assistant data store
         self._api: ECHONETAPIClient = hass.data[DOMAIN]["api"]
 
+        # All requests to the host go through its shared scheduler so writes,
+        # verify reads and poll batches from every instance on the same IP
+        # never collide on the wire.
+        self._scheduler = async_get_host_scheduler(hass, self._host)
+        self._scheduler_key = f"{self._eojgc}-{self._eojcc}-{self._eojci}"
+        # Sees the raw frames of those requests, for RTT and retransmission
+        self._monitor = async_get_frame_monitor(hass)
+        self._monitor.set_push_listener(
+            self._host, (self._eojgc, self._eojcc, self._eojci), self._push_received
+        )
+
+        # Siblings of the same class on the host share class-wide reads,
+        # joined once the instance is set up, see join_class_group()
+        self._class_group = async_get_class_read_group(
+            hass,
+            self._host,
+            (self._eojgc, self._eojcc),
+            self._scheduler,
+            self._monitor,
+        )
+
+        # One multicast probe tells the fleet's hosts apart as alive or down
+        self._liveness = async_get_liveness_probe(hass)
+        self._liveness.watch(self._host, self._host_alive_again)
+
         # Register update callbacks with the API for push notifications
         self._api.register_async_update_callbacks(
             self._host,
@@ -284,6 +398,41 @@ class ECHONETConnector(DataUpdateCoordinator[dict]):
             if entry.options.get(key) is not None:
                 self._user_options[key] = entry.options.get(key, option.get("default"))
 
+        _LOGGER.debug(f"UID for ECHONETLite instance at {self._host} is {self._uid}.")
+        if self._uid is None:
+            self._uid = f"{self._host}-{self._eojgc}-{self._eojcc}-{self._eojci}"
+
+        # Load what was learned about this instance in previous runs
+        profile_key = (
+            self._uidi or f"{self._uid}-{self._eojgc}-{self._eojcc}-{self._eojci}"
+        )
+        self._profile_store = await async_get_profile_store(self.hass)
+        self._profile = self._profile_store.get(profile_key)
+        self._make_batch_sizer()
+        self._update_option_func.append(self._make_batch_sizer)
+        self._make_inf_req_mode()
+        self._update_option_func.append(self._make_inf_req_mode)
+        self._timings = VerifyTimings(
+            self._profile_store.get(
+                f"class-{self._manufacturer}-{self._eojgc}-{self._eojcc}"
+            )
+        )
+        self._packer = BatchPacker(
+            edt_sizes={
+                int(epc): size
+                for epc, size in self._profile.get("edt_sizes", {}).items()
+            },
+            budget=self._profile.get("frame_budget"),
+            singletons=self._profile.get("singletons"),
+        )
+        self._push_reliability = PushReliability(
+            self._ntfPropertyMap,
+            {
+                int(epc): score
+                for epc, score in self._profile.get("push_scores", {}).items()
+            },
+        )
+
         # Build the full list of EPC codes to update
         self._make_update_flags_full_list()
         self._update_option_func.append(self._make_update_flags_full_list)
@@ -292,9 +441,60 @@ class ECHONETConnector(DataUpdateCoordinator[dict]):
         self._make_batch_request_flags()
         self._update_option_func.append(self._make_batch_request_flags)
 
-        _LOGGER.debug(f"UID for ECHONETLite instance at {self._host} is {self._uid}.")
-        if self._uid is None:
-            self._uid = f"{self._host}-{self._eojgc}-{self._eojcc}-{self._eojci}"
+        # Seed pychonet's cache and the coordinator with the values of the
+        # previous run, and keep saving them as they change
+        self._snapshot_store = await async_get_snapshot_store(self.hass)
+        await self._async_restore_snapshot(profile_key)
+        self._snapshot_store.register(profile_key, self._snapshot)
+        self._entry.async_on_unload(
+            partial(self._snapshot_store.unregister, profile_key)
+        )
+
+    def join_class_group(self) -> None:
+        """Take part in class-wide reads with the siblings on the host.
+
+        Only called for instances that have been set up: every class-wide
+        Get waits for all members to answer, so one that does not respond
+        would hold up its siblings' reads. Class-wide answers are collected by
+        the frame monitor, so nothing is joined while it is detached.
+        """
+        if not self._monitor.attached:
+            return
+        self._class_group.join(self._eojci, self._getPropertyMap)
+
+    async def _async_restore_snapshot(self, key: str):
+        """Start from the values saved for key, if there are any."""
+        epc_data = self._instance._epc_data
+        values = {
+            epc: edt
+            for epc, edt in self._snapshot_store.restore(key).items()
+            if epc in self._update_flags_full_list and epc_data.get(epc) is None
+        }
+        if not values:
+            return
+        epc_data.update(values)
+        restored = await self._instance.update(list(values), no_request=True)
+        if not isinstance(restored, dict):
+            restored = {next(iter(values)): restored}
+        self.data = {epc: value for epc, value in restored.items() if value is not None}
+        self.warm_starting = True
+        _LOGGER.debug(
+            "ECHONETLite %s-%s-%s at %s: restored %d value(s) from the last run",
+            self._eojgc,
+            self._eojcc,
+            self._eojci,
+            self._host,
+            len(self.data),
+        )
+
+    def _snapshot(self) -> tuple[float | None, dict[int, bytes]]:
+        """Return when data last arrived and the raw EDTs of the polled EPCs."""
+        epc_data = self._instance._epc_data
+        return self._received_at, {
+            epc: epc_data[epc]
+            for epc in self._update_flags_full_list
+            if isinstance(epc_data.get(epc), bytes)
+        }
 
     async def async_setup_data_fetch(self) -> dict[int, Any]:
         """Fetch initial data during setup using best-effort mode.
@@ -321,6 +521,28 @@ class ECHONETConnector(DataUpdateCoordinator[dict]):
             no_request=False, best_effort=True, include_ntf=True
         )
 
+    async def async_warm_start_fetch(self):
+        """Run the setup data fetch for an instance started from its snapshot.
+
+        Failures are left to the regular polling, which starts from the
+        restored values either way.
+        """
+        try:
+            fetched = await self.async_setup_data_fetch()
+        except Exception as err:
+            _LOGGER.debug(
+                "ECHONETLite %s-%s-%s at %s: background setup fetch failed: %s",
+                self._eojgc,
+                self._eojcc,
+                self._eojci,
+                self._host,
+                err,
+            )
+        else:
+            self.async_set_updated_data({**(self.data or {}), **fetched})
+        finally:
+            self.warm_starting = False
+
     async def _async_update_data(self) -> dict[int, Any]:
         """Fetch the latest data from the ECHONET device.
 
@@ -330,150 +552,172 @@ class ECHONETConnector(DataUpdateCoordinator[dict]):
         Raises:
             UpdateFailed: If device is offline or update fails.
         """
-        # Acquire the per-host semaphore before polling. This ensures only one
-        # ECHONETConnector instance polls a given host at a time, giving embedded
-        # devices breathing room between requests. Other instances on the same host
-        # wait their turn rather than sending concurrent bursts.
-        if self._host not in _host_semaphores:
-            _host_semaphores[self._host] = asyncio.Semaphore(1)
+        # No host-wide lock is held for the whole cycle. Each request frame
+        # takes the host scheduler's slot individually (see poll_pychonet), so
+        # writes can slip in between batches and instances sharing the host
+        # take turns batch by batch.
+        try:
+            if self._liveness.is_down(self._host):
+                # Fail fast instead of sitting out a timeout for every batch
+                raise UpdateFailed(
+                    f"Offline: {self._host} missed the last liveness probes"
+                )
+            _LOGGER.debug(f"Polling ECHONETLite Host {self._host}: %s")
+            new_data = await self.poll_pychonet(no_request=False)
+            # Merge with existing data so skipped batches retain their
+            # cached values rather than disappearing from coordinator.data.
+            # This matches 3.9.0 behaviour where self.data.update() was
+            # used rather than replacing the entire dict each cycle.
+            return {**(self.data or {}), **new_data}
+
+        except EchonetMaxOpcError as ex:
+            # Memory Pressure Control (MPC): Device rejected batch size, adjust and retry
+            # 1. Back off and cap the batch size at what the device answered
+            if not self._batch_sizer.record_max_opc(ex.args[0]):
+                raise UpdateFailed(
+                    f"MPC Error: Device at {self._host} rejected batch even at minimum size."
+                )
 
-        async with _host_semaphores[self._host]:
+            # 2. Persist new batch size for this instance only
+            self._save_profile()
+
+            # 3. Rebuild and retry
+            self._make_batch_request_flags()
             try:
-                _LOGGER.debug(f"Polling ECHONETLite Host {self._host}: %s")
                 new_data = await self.poll_pychonet(no_request=False)
-                # Merge with existing data so skipped batches retain their
-                # cached values rather than disappearing from coordinator.data.
-                # This matches 3.9.0 behaviour where self.data.update() was
-                # used rather than replacing the entire dict each cycle.
                 return {**(self.data or {}), **new_data}
-
-            except EchonetMaxOpcError as ex:
-                # Memory Pressure Control (MPC): Device rejected batch size, adjust and retry
-                # 1. Adjust batch size
-                batch_size_max = self._user_options.get(
-                    CONF_BATCH_SIZE_MAX, MAX_UPDATE_BATCH_SIZE
-                )
-                batch_data_len = max(
-                    ex.args[0], MIN_UPDATE_BATCH_SIZE, batch_size_max - 1
+            except Exception as err:
+                _LOGGER.error(
+                    "Failed to process ECHONETLite polling notification: %s", err
                 )
-
-                if batch_data_len >= batch_size_max:
-                    raise UpdateFailed(
-                        f"MPC Error: Device at {self._host} rejected batch even at minimum size."
+                raise UpdateFailed(f"Retry failed after MPC adjustment: {err}")
+
+        except DeviceTimeoutError as err:
+            # Check if host has been active recently via pychonet.
+            # pychonet tracks last received packet per host across ALL
+            # traffic — GET responses, INF notifications, anything.
+            # If any packet arrived within ACTIVITY_TIMEOUT, serve cached
+            # data rather than marking unavailable — transient failures
+            # under network load should not flash entities unavailable.
+            import time as _time
+
+            last = self._api.last_activity(self._host)
+            if last is not None:
+                elapsed = _time.monotonic() - last
+                if elapsed < ACTIVITY_TIMEOUT:
+                    _LOGGER.debug(
+                        "ECHONETLite %s-%s-%s at %s poll failed but host "
+                        "was active %.0fs ago — serving cached data",
+                        self._eojgc,
+                        self._eojcc,
+                        self._eojci,
+                        self._host,
+                        elapsed,
                     )
+                    return self.data or {}
+            elapsed_str = f"{(_time.monotonic() - last):.0f}s" if last else "never"
+            _LOGGER.warning(
+                "ECHONETLite %s-%s-%s at %s has been silent — last activity: %s",
+                self._eojgc,
+                self._eojcc,
+                self._eojci,
+                self._host,
+                elapsed_str,
+            )
+            raise UpdateFailed(f"Offline: {err}")
 
-                # 2. Persist new batch size
-                self._user_options[CONF_BATCH_SIZE_MAX] = batch_data_len
-                self.hass.config_entries.async_update_entry(
-                    self._entry,
-                    options={
-                        **self._entry.options,
-                        CONF_BATCH_SIZE_MAX: batch_data_len,
-                    },
-                )
-
-                # 3. Rebuild and retry — semaphore still held
-                self._make_batch_request_flags()
-                try:
-                    new_data = await self.poll_pychonet(no_request=False)
-                    return {**(self.data or {}), **new_data}
-                except Exception as err:
-                    _LOGGER.error(
-                        "Failed to process ECHONETLite polling notification: %s", err
-                    )
-                    raise UpdateFailed(f"Retry failed after MPC adjustment: {err}")
-
-            except DeviceTimeoutError as err:
-                # Check if host has been active recently via pychonet.
-                # pychonet tracks last received packet per host across ALL
-                # traffic — GET responses, INF notifications, anything.
-                # If any packet arrived within ACTIVITY_TIMEOUT, serve cached
-                # data rather than marking unavailable — transient failures
-                # under network load should not flash entities unavailable.
-                import time as _time
-
-                last = self._api.last_activity(self._host)
-                if last is not None:
-                    elapsed = _time.monotonic() - last
-                    if elapsed < ACTIVITY_TIMEOUT:
-                        _LOGGER.debug(
-                            "ECHONETLite %s-%s-%s at %s poll failed but host "
-                            "was active %.0fs ago — serving cached data",
-                            self._eojgc,
-                            self._eojcc,
-                            self._eojci,
-                            self._host,
-                            elapsed,
-                        )
-                        return self.data or {}
-                elapsed_str = f"{(_time.monotonic() - last):.0f}s" if last else "never"
-                _LOGGER.warning(
-                    "ECHONETLite %s-%s-%s at %s has been silent — last activity: %s",
-                    self._eojgc,
-                    self._eojcc,
-                    self._eojci,
-                    self._host,
-                    elapsed_str,
-                )
-                raise UpdateFailed(f"Offline: {err}")
-
-            except UpdateFailed:
-                raise
+        except UpdateFailed:
+            raise
 
-            except Exception as err:
-                # Catch-all to surface unexpected exceptions with full traceback.
-                # Without this, unhandled exceptions silently set last_update_success=False
-                # with no indication of what went wrong.
-                import traceback
+        except Exception as err:
+            # Catch-all to surface unexpected exceptions with full traceback.
+            # Without this, unhandled exceptions silently set last_update_success=False
+            # with no indication of what went wrong.
+            import traceback
 
-                _LOGGER.error(
-                    "Unexpected error polling %s-%s-%s at %s: %s\n%s",
-                    self._eojgc,
-                    self._eojcc,
-                    self._eojci,
-                    self._host,
-                    err,
-                    traceback.format_exc(),
-                )
-                raise UpdateFailed(f"Unexpected error: {err}") from err
+            _LOGGER.error(
+                "Unexpected error polling %s-%s-%s at %s: %s\n%s",
+                self._eojgc,
+                self._eojcc,
+                self._eojci,
+                self._host,
+                err,
+                traceback.format_exc(),
+            )
+            raise UpdateFailed(f"Unexpected error: {err}") from err
 
     async def async_update_callback(self, isPush: bool = False):
         """Handle push notifications from the device.
 
         When the device sends an unsolicited INF packet, pychonet fires this
-        callback. Rather than reading the entire _state for this instance
-        (which may contain None for EPCs not yet fetched in the current poll
-        cycle), we restrict the read to EPCs listed in _ntfPropertyMap — the
-        set of EPCs the device declared it will proactively notify about.
-        This prevents mid-poll push notifications from overwriting good cached
-        data with None for EPCs that haven't been batched yet.
+        callback. The frame monitor has already told us which EPCs the frame
+        carried (see _push_received), so only those are decoded from the
+        library's _state and merged. For other callbacks we restrict the read
+        to EPCs listed in _ntfPropertyMap — the set of EPCs the device
+        declared it will proactively notify about. Reading the entire _state
+        for this instance (which may contain None for EPCs not yet fetched in
+        the current poll cycle) could overwrite good cached data with None
+        for EPCs that haven't been batched yet.
+
+        With the push coalescing option set, pushes arriving within that many
+        milliseconds of each other are merged into one update, flushed at most
+        PUSH_COALESCE_MAX_LATENCY after the first of them.
 
         Args:
             isPush: Whether this update was triggered by a push notification.
         """
-        if not self._ntfPropertyMap:
-            # Device declared no notification EPCs — nothing useful to merge.
+        epcs = list(self._push_epcs) if isPush else []
+        self._push_epcs.clear()
+        if not epcs:
+            if not self._ntfPropertyMap:
+                # Device declared no notification EPCs — nothing useful to merge.
+                return
+            epcs = list(self._ntfPropertyMap)
+
+        window = self._user_options.get(CONF_PUSH_COALESCE_MS) if isPush else 0
+        if window:
+            now = time.monotonic()
+            if not self._coalesced_epcs:
+                self._coalesce_first = now
+            self._coalesced_epcs.update(epcs)
+            self._coalesce_due = min(
+                now + window / 1000,
+                self._coalesce_first + PUSH_COALESCE_MAX_LATENCY,
+            )
+            if self._coalesce_task is None or self._coalesce_task.done():
+                self._coalesce_task = self.hass.async_create_task(
+                    self._async_flush_pushes()
+                )
             return
-
+        await self._async_merge_cached(epcs)
+
+    async def _async_flush_pushes(self):
+        """Merge the coalesced pushes once the window has passed."""
+        while self._coalesced_epcs:
+            while (delay := self._coalesce_due - time.monotonic()) > 0:
+                await asyncio.sleep(delay)
+            epcs = list(self._coalesced_epcs)
+            self._coalesced_epcs.clear()
+            await self._async_merge_cached(epcs)
+
+    async def _async_merge_cached(self, epcs: list[int]):
+        """Merge pychonet's cached values of epcs and notify listeners."""
         try:
             _LOGGER.debug(
-                "Push notification for %s-%s-%s-%s, reading ntfmap EPCs: %s",
+                "Push notification for %s-%s-%s-%s, reading EPCs: %s",
                 self._host,
                 self._eojgc,
                 self._eojcc,
                 self._eojci,
-                self._ntfPropertyMap,
+                epcs,
             )
 
-            # Read only the EPCs the device declared it notifies about.
             # _instance.update() with no_request=True reads from the library's
             # internal _state cache — no network call is made.
             # Note: _state is written by echonetMessageReceived BEFORE the
             # callback is awaited (sequential within the same coroutine), so
             # there is no race condition here.
-            raw = await self._instance.update(
-                list(self._ntfPropertyMap), no_request=True
-            )
+            raw = await self._instance.update(epcs, no_request=True)
 
             if not raw:
                 return
@@ -481,8 +725,8 @@ class ECHONETConnector(DataUpdateCoordinator[dict]):
             # raw may be a dict (multiple EPCs) or a scalar (single EPC).
             if isinstance(raw, dict):
                 new_data = raw
-            elif len(self._ntfPropertyMap) == 1:
-                new_data = {self._ntfPropertyMap[0]: raw}
+            elif len(epcs) == 1:
+                new_data = {epcs[0]: raw}
             else:
                 return
 
@@ -496,12 +740,42 @@ class ECHONETConnector(DataUpdateCoordinator[dict]):
             _LOGGER.debug("Push notification data for %s: %s", self._host, new_data)
 
             # Merge into coordinator data and notify listeners.
-            self.data = {**(self.data or {}), **new_data}
+            if self.data is None:
+                self.data = new_data
+            else:
+                self.data.update(new_data)
             self.async_update_listeners()
 
         except Exception as err:
             _LOGGER.error("Failed to process ECHONETLite push notification: %s", err)
 
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify the entities whose EPCs changed since the last notification.
+
+        Entities register the EPCs they read as their listener context, see
+        EchonetEntity. Listeners without a context, and every listener when
+        last_update_success flips, are always notified.
+        """
+        data = self.data or {}
+        published = self._published
+        changed = {
+            epc
+            for epc in data.keys() | published.keys()
+            if epc not in data or epc not in published or data[epc] != published[epc]
+        }
+        self._published = dict(data)
+        if self.last_update_success and not self.warm_starting:
+            # Restored values are not news from the device
+            self._received_at = time.time()
+        if changed and self._snapshot_store is not None:
+            self._snapshot_store.async_schedule_save()
+        everyone = self.last_update_success != self._published_success
+        self._published_success = self.last_update_success
+        for update_callback, context in list(self._listeners.values()):
+            if everyone or context is None or not changed.isdisjoint(context):
+                update_callback()
+
     async def poll_pychonet(
         self,
         no_request: bool = False,
@@ -536,48 +810,58 @@ class ECHONETConnector(DataUpdateCoordinator[dict]):
         timed_out_batches = []
 
         # Use full batch list for setup (include_ntf=True) so all EPCs including
-        # STATMAP ones are fetched at least once. For regular polling use the
-        # pruned list (STATMAP EPCs served via push).
-        batches = self._update_flag_batches
+        # STATMAP ones are fetched at least once. For regular polling only the
+        # EPCs whose refresh tier is due this cycle are requested, taken from
+        # the pruned list (STATMAP EPCs served via push).
+        singletons = self._singleton_poll_epcs
         if include_ntf:
             # Build full batch list bypassing STATMAP prune
-            batch_size_max = self._user_options.get(
-                CONF_BATCH_SIZE_MAX, MAX_UPDATE_BATCH_SIZE
+            batches = self._chunk_batch_request(
+                [
+                    e
+                    for e in self._update_flags_full_list
+                    if e not in self._singleton_poll_epcs
+                ]
+            )
+        elif no_request:
+            batches = self._update_flag_batches
+        else:
+            due = self._refresh.start_cycle(self._poll_list + singletons)
+            # Push-served EPCs are only read once no INF or read has refreshed
+            # them for longer than the configured ceiling
+            due += [e for e in self._stale_push_epcs() if e not in due]
+            singletons = [e for e in singletons if e in due]
+            update_data = await self._async_class_read(
+                [e for e in due if e not in singletons]
+            )
+            batches = self._chunk_batch_request(
+                [e for e in due if e not in singletons and e not in update_data]
+            )
+            _LOGGER.debug(
+                "ECHONETLite %s-%s-%s poll cycle %d: %d of %d EPC(s) due",
+                self._eojgc,
+                self._eojcc,
+                self._eojci,
+                self._refresh.cycle,
+                len(due),
+                len(self._poll_list) + len(self._singleton_poll_epcs),
             )
-            full_list = [
-                e
-                for e in self._update_flags_full_list
-                if e not in self._singleton_poll_epcs
-            ]
-            batches = []
-            start = 0
-            while start + batch_size_max < len(full_list):
-                batches.append(full_list[start : start + batch_size_max])
-                start += batch_size_max
-            if full_list[start:]:
-                batches.append(full_list[start:])
-
-        for i, flags in enumerate(batches):
-            if i > 0 and not no_request:
-                # Back off longer after a timeout — device may need more time
-                # to recover between requests than after a successful response.
-                await asyncio.sleep(1.0 if timed_out_batches else 0.1)
 
+        # No sleeps between batches: the host scheduler paces frames from the
+        # measured round-trip time and backs off after a timeout.
+        for flags in batches:
             try:
-                batch_data = await self._instance.update(flags, no_request)
+                if no_request:
+                    batch_data = await self._instance.update(flags, no_request)
+                elif include_ntf:
+                    batch_data = await self._async_read(flags, PRIORITY_POLL)
+                else:
+                    batch_data = await self._async_poll_batch(flags)
             except TimeoutError:
                 # pychonet raises TimeoutError("Pychonet UDP request timeout.")
                 # when echonetMessage() returns False (genuine device non-response).
-                # Treat the same as a False return — skip this batch and continue.
-                if no_request:
-                    continue
-                _LOGGER.warning(
-                    "Device at %s did not respond to EPCs %s — skipping batch",
-                    self._host,
-                    flags,
-                )
-                timed_out_batches.append(flags)
-                continue
+                # Treat the same as a False return.
+                batch_data = False
 
             if batch_data is None:
                 # pychonet _waiting queue was busy — another request in flight.
@@ -592,6 +876,14 @@ class ECHONETConnector(DataUpdateCoordinator[dict]):
             if batch_data is False:
                 if no_request:
                     continue
+                if len(flags) > 1 and not best_effort and self._host_recently_active():
+                    # A device that is still talking to us most likely dropped
+                    # the request because the response would not fit its
+                    # buffer. Split the batch to salvage what it can answer.
+                    split_data, flags = await self._async_split_batch(flags)
+                    update_data.update(split_data)
+                    if not flags:
+                        continue
                 # Track timed out batches regardless of best_effort.
                 # If we got some data from other batches we return what we
                 # have rather than raising — partial data is better than
@@ -620,27 +912,28 @@ class ECHONETConnector(DataUpdateCoordinator[dict]):
             # Only raise DeviceTimeoutError if ALL batches failed — meaning
             # the device is genuinely offline. Partial failures serve cached
             # data for the missing EPCs rather than marking everything unavailable.
-            if not update_data and len(timed_out_batches) == len(
-                self._update_flag_batches
-            ):
+            if not update_data and len(timed_out_batches) == len(batches):
                 raise DeviceTimeoutError(
                     f"Device at {self._host} failed to respond to any EPCs"
                 )
 
         # Poll singleton EPCs individually after normal batches.
-        # Singletons get one retry after a short pause — they carry high-value
-        # data (e.g. 29-channel power lists) and a brief delay may allow the
-        # device to recover from momentary load before the second attempt.
-        for epc in self._singleton_poll_epcs:
+        # Singletons get one retry — they carry high-value data (e.g. 29-channel
+        # power lists). The scheduler's post-timeout backoff gives the device
+        # time to recover from momentary load before the second attempt.
+        for epc in singletons:
             if epc not in self._update_flags_full_list:
                 continue
-            if not no_request:
-                await asyncio.sleep(0.1)
 
             singleton_data = None
             for attempt in range(2):  # initial attempt + one retry
                 try:
-                    singleton_data = await self._instance.update([epc], no_request)
+                    if no_request:
+                        singleton_data = await self._instance.update([epc], no_request)
+                    else:
+                        singleton_data = (
+                            await self._async_read([epc], PRIORITY_POLL) or {}
+                        ).get(epc)
                     break  # success — exit retry loop
                 except TimeoutError:
                     if attempt == 0:
@@ -650,7 +943,6 @@ class ECHONETConnector(DataUpdateCoordinator[dict]):
                             self._host,
                             hex(epc),
                         )
-                        await asyncio.sleep(0.2)
                     else:
                         _LOGGER.warning(
                             "Device at %s did not respond to singleton EPC %s "
@@ -677,8 +969,263 @@ class ECHONETConnector(DataUpdateCoordinator[dict]):
                 # when called with a single EPC, so we must key it explicitly.
                 update_data[epc] = singleton_data
 
+        if not no_request:
+            # Only EPCs that actually answered count as refreshed - anything
+            # that timed out stays due for the next cycle.
+            self._refresh.mark_polled(list(update_data))
+            self._refresh.observe_all(update_data)
+
+            learned = self._record_edt_sizes(list(update_data))
+            if not include_ntf and self._check_push_reliability(update_data):
+                self._make_batch_request_flags()
+            if batches and self._batch_sizer.record_cycle(
+                max(len(b) for b in batches), bool(timed_out_batches)
+            ):
+                learned = True
+                self._make_batch_request_flags()
+            if learned:
+                self._save_profile()
+
         return update_data
 
+    async def _async_poll_batch(self, flags: list[int]) -> dict[int, Any] | None:
+        """Read one poll batch, by INF_REQ if that mode is enabled.
+
+        Falls back to a plain Get when the device does not announce the
+        batch. A device that never has is not asked by INF_REQ again until
+        the option is toggled.
+        """
+        if (
+            self._user_options.get(CONF_INF_REQ_POLLING)
+            and self._profile.get("inf_req") is not False
+            and self._monitor.attached
+        ):
+            values = await self._async_inf_read(flags)
+            if values is not None:
+                if self._profile.get("inf_req") is not True:
+                    self._profile["inf_req"] = True
+                    self._profile_store.async_schedule_save()
+                return values
+            batch_data = await self._async_read(flags, PRIORITY_POLL)
+            if batch_data and self._profile.get("inf_req") is None:
+                # The Get went through where the INF_REQ did not
+                _LOGGER.debug(
+                    "ECHONETLite: %s does not answer INF_REQ, polling with Get",
+                    self._name,
+                )
+                self._profile["inf_req"] = False
+                self._profile_store.async_schedule_save()
+            return batch_data
+        return await self._async_read(flags, PRIORITY_POLL)
+
+    async def _async_inf_read(self, epcs: list[int]) -> dict[int, Any] | None:
+        """Ask the device to announce epcs and take its INF as the answer.
+
+        The INF reaches every listener on the network and goes through the
+        regular push path, which decodes it into pychonet's cache.
+
+        Returns:
+            The announced values, or None if the device did not answer with
+            an INF.
+        """
+        payload = build_inf_req(
+            self._monitor.next_tid(),
+            (self._eojgc, self._eojcc, self._eojci),
+            epcs,
+        )
+        try:
+            async with self._scheduler.slot(PRIORITY_POLL, self._scheduler_key):
+                response = await self._monitor.async_exchange(
+                    self._host, payload, self._scheduler, forward=True
+                )
+        except TimeoutError:
+            return None
+        if response[ESV_OFFSET] != INF:
+            # INF_SNA: the device would not announce all of them
+            return None
+        announced = [epc for epc in parse_epcs(response) if epc in epcs]
+        if not announced:
+            return None
+        values = await self._instance.update(announced, no_request=True)
+        if not isinstance(values, dict):
+            values = {announced[0]: values}
+        return values
+
+    async def _async_split_batch(
+        self, flags: list[int]
+    ) -> tuple[dict[int, Any], list[int]]:
+        """Bisect an unanswered batch to find out what the device can answer.
+
+        Both halves are requested separately. If at least one is answered the
+        failed half is bisected further; if both are answered the packer
+        learns that the combined response was too much for the device.
+
+        Args:
+            flags: The batch the device did not answer.
+
+        Returns:
+            The data that was read and the EPCs that are still unanswered.
+        """
+        mid = len(flags) // 2
+        halves = (flags[:mid], flags[mid:])
+        results = []
+        for half in halves:
+            try:
+                results.append(await self._async_read(half, PRIORITY_POLL))
+            except TimeoutError:
+                results.append(False)
+
+        update_data = {}
+        unanswered = []
+        answered = [result not in (None, False) for result in results]
+        for half, result, ok in zip(halves, results, answered):
+            if ok:
+                update_data.update(result)
+            elif result is False and len(half) > 1 and any(answered):
+                split_data, split_unanswered = await self._async_split_batch(half)
+                update_data.update(split_data)
+                unanswered.extend(split_unanswered)
+            else:
+                unanswered.extend(half)
+
+        if all(answered):
+            if self._packer.record_overflow(flags):
+                self._save_profile()
+                self._make_batch_request_flags()
+            else:
+                # Nothing byte-related to learn - treat it as an OPC count
+                # problem and let the batch sizer back off.
+                if self._batch_sizer.record_cycle(len(flags), True):
+                    self._save_profile()
+                    self._make_batch_request_flags()
+        return update_data, unanswered
+
+    async def _async_class_read(self, epcs: list[int]) -> dict[int, Any]:
+        """Read the epcs shared with sibling instances class-wide.
+
+        Returns:
+            The decoded values that could be read this way; the rest are left
+            to the regular batches.
+        """
+        if not self._class_group.active or not self._class_group.is_member(self._eojci):
+            return {}
+        shared = [epc for epc in epcs if epc in self._class_group.shared_epcs]
+        # Siblings usually poll within one interval of each other; half of it
+        # keeps a value read for one of them fresh enough for the others.
+        max_age = self.update_interval.total_seconds() / 2
+        values = {}
+        for chunk in self._chunk_batch_request(shared):
+            values.update(
+                await self._class_group.async_read(self._eojci, chunk, max_age)
+            )
+        if not values:
+            return {}
+        self._mark_updated(list(values))
+        # Decode through pychonet's cache, as for any other read
+        self._instance._epc_data.update(values)
+        decoded = await self._instance.update(list(values), no_request=True)
+        if not isinstance(decoded, dict):
+            decoded = {next(iter(values)): decoded}
+        return decoded
+
+    def _mark_updated(self, epcs):
+        """Record that fresh values of epcs (or a dict's non-None EPCs) arrived."""
+        now = time.monotonic()
+        if isinstance(epcs, dict):
+            epcs = [epc for epc, value in epcs.items() if value is not None]
+        for epc in epcs:
+            self._updated_at[epc] = now
+        self._class_group.forget(self._eojci, epcs)
+
+    def _stale_push_epcs(self) -> list[int]:
+        """Return push-served EPCs that have not been refreshed for too long."""
+        max_age = self._user_options.get(
+            CONF_PUSH_MAX_AGE, MISC_OPTIONS[CONF_PUSH_MAX_AGE]["default"]
+        )
+        oldest = time.monotonic() - max_age * 60
+        stale = [
+            epc
+            for epc in self._update_flags_full_list
+            if epc not in self._poll_list
+            and epc not in self._singleton_poll_epcs
+            and self._updated_at.get(epc, float("-inf")) < oldest
+        ]
+        if stale:
+            _LOGGER.debug(
+                "ECHONETLite %s-%s-%s: refreshing push-served EPC(s) not updated "
+                "for %d min: %s",
+                self._eojgc,
+                self._eojcc,
+                self._eojci,
+                max_age,
+                [hex(epc) for epc in stale],
+            )
+        return stale
+
+    def _check_push_reliability(self, update_data: dict[int, Any]) -> bool:
+        """Look for STATMAP EPC changes that polling found but no INF announced.
+
+        Returns:
+            True if any EPC moved from push to polling.
+        """
+        previous = self.data or {}
+        changed = False
+        for epc, value in update_data.items():
+            if (
+                epc in self._ntfPropertyMap
+                and previous.get(epc) is not None
+                and value is not None
+                and value != previous[epc]
+            ):
+                changed |= self._push_reliability.record_unannounced(epc)
+        if changed:
+            self._save_push_scores()
+        return changed
+
+    def _save_push_scores(self):
+        """Persist the push reliability scores to the instance profile."""
+        self._profile["push_scores"] = {
+            str(epc): score for epc, score in self._push_reliability.scores.items()
+        }
+        self._profile_store.async_schedule_save()
+
+    @callback
+    def _host_alive_again(self):
+        """Refresh right away once the liveness probe hears from the host."""
+        if not self.last_update_success:
+            self.hass.async_create_task(self.async_request_refresh())
+
+    def _host_recently_active(self) -> bool:
+        """Return True if anything was received from the host this interval."""
+        last = self._api.last_activity(self._host)
+        return (
+            last is not None
+            and time.monotonic() - last < self.update_interval.total_seconds()
+        )
+
+    def _record_edt_sizes(self, epcs: list[int]) -> bool:
+        """Teach the packer the EDT lengths of freshly read EPCs.
+
+        pychonet keeps the raw EDT bytes of ordinary properties in its
+        per-instance state, so the lengths are available without decoding.
+
+        Returns:
+            True if any stored size changed.
+        """
+        state = (
+            self._api._state.get(self._host, {})
+            .get("instances", {})
+            .get(self._eojgc, {})
+            .get(self._eojcc, {})
+            .get(self._eojci, {})
+        )
+        changed = False
+        for epc in epcs:
+            edt = state.get(epc)
+            if isinstance(edt, (bytes, bytearray)):
+                changed |= self._packer.record_size(epc, len(edt))
+        return changed
+
     async def poll_pychonet_specific(self, epcs: list[int]) -> dict[int, Any]:
         """Fetch specific EPCs from the pychonet instance.
 
@@ -686,43 +1233,481 @@ class ECHONETConnector(DataUpdateCoordinator[dict]):
         verification of specific state changes.
         """
         _LOGGER.debug("Targeted poll for %s at %s", epcs, self._host)
-        update_data = {}
 
-        # We call the library update directly with the specific list
-        # No 'no_request' logic here because the whole point is a fresh network hit
-        batch_data = await self._instance.update(epcs)
-
-        if batch_data is False:
+        # No 'no_request' logic here because the whole point is a fresh network
+        # hit - only reads issued from now on may be shared.
+        try:
+            batch_data = await self._async_read(
+                epcs, PRIORITY_VERIFY, issued_after=time.monotonic()
+            )
+        except TimeoutError:
             # We don't necessarily want to raise UpdateFailed here and mark
             # the whole device unavailable just because a targeted sniff failed.
             _LOGGER.warning("Targeted poll failed for EPCs %s", epcs)
             return {}
 
-        if isinstance(batch_data, dict):
-            update_data.update(batch_data)
-        elif len(epcs) == 1:
-            # Handle the case where pychonet returns a single value
-            # instead of a dict for a single-EPC request
-            update_data[epcs[0]] = batch_data
+        return batch_data or {}
 
-        return update_data
+    async def _async_read(
+        self,
+        epcs: list[int],
+        priority: int,
+        issued_after: float | None = None,
+    ) -> dict[int, Any] | None:
+        """Read epcs from the device, sharing reads that are already in flight.
+
+        EPCs already covered by an outstanding read (poll batch, verify or
+        setup fetch) wait for that read's result instead of putting another
+        frame on the wire; only the rest are requested.
+
+        Args:
+            epcs: EPC codes to read.
+            priority: Scheduler priority for the new request, if one is needed.
+            issued_after: If set, only share reads issued at or after this
+                monotonic time, e.g. so a verify never sees pre-write data.
+
+        Returns:
+            EPC values, or None if pychonet returned nothing (queue busy).
+
+        Raises:
+            TimeoutError: If the device did not answer.
+        """
+        shared = {}
+        own = []
+        for epc in epcs:
+            inflight = self._inflight_reads.get(epc)
+            if inflight and (issued_after is None or inflight[0] >= issued_after):
+                shared[id(inflight[1])] = inflight[1]
+            else:
+                own.append(epc)
+
+        update_data = {}
+        if own:
+            fut = self.hass.loop.create_future()
+            for epc in own:
+                self._inflight_reads[epc] = (time.monotonic(), fut)
+            try:
+                result = await self.async_send(self._instance.update(own), priority)
+                if result is not None and not isinstance(result, dict):
+                    # update() returns the bare value for a single EPC
+                    result = {own[0]: result}
+                fut.set_result(result)
+                self._mark_updated(result or {})
+            except asyncio.CancelledError:
+                fut.cancel()
+                raise
+            except Exception as err:
+                fut.set_exception(err)
+                # Mark the exception as retrieved in case nobody shared it
+                fut.exception()
+                raise
+            finally:
+                for epc in own:
+                    if self._inflight_reads.get(epc, (0, None))[1] is fut:
+                        del self._inflight_reads[epc]
+            if result is None and not shared:
+                return None
+            update_data.update(result or {})
+
+        for fut in shared.values():
+            # Shield so our own cancellation does not cancel another caller's read
+            update_data.update(await asyncio.shield(fut) or {})
+        return {epc: update_data[epc] for epc in epcs if epc in update_data}
+
+    async def async_send(self, coro, priority: int = PRIORITY_WRITE) -> Any:
+        """Send a pychonet request through the host scheduler.
+
+        Entity commands must use this rather than awaiting pychonet setters
+        directly, so they are queued ahead of background poll batches instead
+        of colliding with them on the wire.
+
+        Overdue answers are handled by the frame monitor: the request is
+        retransmitted from the host's RTO and given up on after a few
+        attempts. A given-up read raises TimeoutError and a given-up write
+        returns False, the same way pychonet reports its own timeouts.
+
+        Args:
+            coro: The pychonet coroutine to run, e.g. _instance.setMessage(...).
+            priority: Scheduler priority, PRIORITY_WRITE for user commands.
+
+        Returns:
+            Whatever the pychonet coroutine returns.
+        """
+        try:
+            async with self._scheduler.slot(priority, self._scheduler_key):
+                try:
+                    result = await self._monitor.async_request(
+                        self._host, coro, self._scheduler
+                    )
+                except TimeoutError:
+                    self._scheduler.record_timeout()
+                    if priority == PRIORITY_WRITE:
+                        return False
+                    raise
+                if result is False:
+                    self._scheduler.record_timeout()
+                return result
+        finally:
+            # Close the coroutine if we were cancelled before it ever ran.
+            coro.close()
+
+    async def async_set_and_verify(self, epcs: list[int], setter, *args):
+        """
+        Executes the pychonet setter method with args and confirms epcs.
+        """
+        # 1. Capture what the setter would send
+        transaction = self.write_transaction()
+        await transaction.add(setter, *args)
+
+        # 2. Set and read back, in one SetGet or with a targeted background poll
+        await self.async_commit(transaction, verify=epcs)
+
+    def write_transaction(self) -> WriteTransaction:
+        """Return an empty write transaction for this instance."""
+        return WriteTransaction(self._instance)
+
+    async def async_commit(
+        self, transaction: WriteTransaction, verify: bool | list[int] = False
+    ) -> dict[int, bool]:
+        """Send a write transaction as a single frame.
+
+        Writes that are to be confirmed go out as a SetGet, which writes and
+        reads back in one exchange, unless the device is known not to support
+        it. Otherwise a SetC is sent and a verify read scheduled.
+
+        Args:
+            transaction: The properties to set, see write_transaction().
+            verify: True to confirm the written EPCs, or the EPCs to confirm.
+
+        Returns:
+            EPC -> True if the device accepted the property. EPCs that were
+            rejected, filtered out by the SETMAP or not answered are False.
+        """
+        epcs = transaction.epcs
+        if not epcs:
+            return {}
+        self._class_group.forget(self._eojci, epcs)
+        verify_epcs = epcs if verify is True else list(verify or [])
+        probing = False
+        if (
+            verify_epcs
+            and self._profile.get("setget") is not False
+            and self._monitor.attached
+        ):
+            accepted = await self._async_setget(transaction, verify_epcs)
+            if accepted is not None:
+                return accepted
+            # Only an untested device is demoted; one known to answer SetGet
+            # just lost this exchange
+            probing = self._profile.get("setget") is None
+
+        sent = time.monotonic()
+        result = await self.async_send(self._instance.setMessages(transaction.opc))
+        accepted = dict.fromkeys(epcs, False)
+        if result:
+            results = set_results(self._monitor.last_request(self._host, sent))
+            # No decodable answer to look at - trust pychonet's verdict.
+            accepted.update(results or dict.fromkeys(epcs, True))
+        if not all(accepted.values()):
+            _LOGGER.debug(
+                "ECHONETLite: %s rejected %s",
+                self._name,
+                [hex(epc) for epc, ok in accepted.items() if not ok],
+            )
+        if probing and any(accepted.values()):
+            # The SetC went through where the SetGet did not
+            _LOGGER.debug(
+                "ECHONETLite: %s does not support SetGet, using SetC and Get",
+                self._name,
+            )
+            self._profile["setget"] = False
+            self._profile_store.async_schedule_save()
+        if verify_epcs:
+            await self._async_confirm(
+                [epc for epc in verify_epcs if accepted.get(epc)],
+                [epc for epc in verify_epcs if not accepted.get(epc)],
+            )
+        return accepted
+
+    async def async_commit_latest(
+        self,
+        transaction: WriteTransaction,
+        optimistic: dict[int, Any] | None = None,
+    ) -> dict[int, bool] | None:
+        """Send transaction unless a newer write to the same EPCs replaces it.
+
+        Meant for sliders and other controls that fire a write per
+        intermediate value. While a write to the same set of EPCs is on the
+        wire, only the newest of the writes arriving behind it is kept; the
+        ones it replaces are never sent.
+
+        Args:
+            transaction: The properties to set, see write_transaction().
+            optimistic: Values to show in the entities right away.
+
+        Returns:
+            The result of async_commit(), or None if the write was replaced.
+        """
+        if optimistic:
+            self.data.update(optimistic)
+            self.async_update_listeners()
+        key = tuple(sorted(transaction.epcs))
+        waiter = self.hass.loop.create_future()
+        if (replaced := self._pending_writes.get(key)) is not None:
+            _LOGGER.debug(
+                "ECHONETLite: %s dropping superseded write to %s",
+                self._name,
+                [hex(epc) for epc in key],
+            )
+            if not replaced[1].done():
+                replaced[1].set_result(None)
+        self._pending_writes[key] = (transaction, waiter)
+        if key not in self._write_senders:
+            self._write_senders[key] = self.hass.async_create_task(
+                self._async_send_latest(key)
+            )
+        return await waiter
+
+    async def _async_send_latest(self, key: tuple[int, ...]):
+        """Send the newest pending write to key until none is left."""
+        try:
+            while (pending := self._pending_writes.pop(key, None)) is not None:
+                transaction, waiter = pending
+                try:
+                    result = await self.async_commit(transaction)
+                except Exception as err:
+                    if not waiter.done():
+                        waiter.set_exception(err)
+                else:
+                    if not waiter.done():
+                        waiter.set_result(result)
+        finally:
+            del self._write_senders[key]
+
+    async def async_group_written(self, opc: list[dict[str, Any]]):
+        """Reconcile a write that reached the instance in a group SetI.
+
+        SetI is not answered, so the written EDTs are cached the way pychonet
+        does on a Set_Res and the write is confirmed like an accepted SetC.
+        """
+        self._instance._epc_data.update(
+            {o["EPC"]: o["EDT"].to_bytes(o["PDC"], "big") for o in opc}
+        )
+        self._class_group.forget(self._eojci, [o["EPC"] for o in opc])
+        await self._async_confirm([o["EPC"] for o in opc], [])
+
+    async def _async_confirm(self, written: list[int], rejected: list[int]):
+        """Arrange for the result of a SetC to reach the entities.
 
-    async def async_set_and_verify(self, epcs: list[int], set_coro):
+        Accepted EPCs the device announces are confirmed by its INF within
+        the class's learned deadline. Everything else is read back after the
+        learned settle time, comparing the read with the written value.
+
+        Args:
+            written: EPCs the device accepted.
+            rejected: EPCs the device rejected or did not answer for.
         """
-        Executes the pychonet setter command, and schedules a targeted poll.
+        now = time.monotonic()
+        announced = [
+            epc
+            for epc in written
+            if self._timings.push_covered(epc, self._ntfPropertyMap)
+            and self._push_reliability.served_by_push(epc)
+        ]
+        polled = [epc for epc in written if epc not in announced]
+        if polled:
+            # pychonet cached the written EDTs on Set_Res
+            expected = await self._instance.update(polled, no_request=True)
+            if not isinstance(expected, dict):
+                expected = {polled[0]: expected}
+            for epc in polled:
+                before = (self.data or {}).get(epc)
+                self._verify_expected[epc] = (before, expected.get(epc))
+        for epc in announced:
+            self._push_pending[epc] = now
+        if announced and (self._push_task is None or self._push_task.done()):
+            self._push_task = self.hass.async_create_task(self._async_push_deadline())
+        if polled or rejected:
+            self._schedule_verify(polled + rejected)
+
+    @callback
+    def _push_received(self, epcs: list[int], solicited: bool = False):
+        """Note the EPCs an INF carries and confirm pending writes to them.
+
+        An INF answering our own INF_REQ says nothing about what the device
+        pushes unprompted, so it is kept out of the push reliability scores
+        and the learned announcement timings. Pending writes wait for the
+        device's own INF or their verify read.
+        """
+        self._push_epcs.update(epcs)
+        self._mark_updated(epcs)
+        if solicited:
+            return
+        if self._push_reliability is not None:
+            if any([self._push_reliability.record_push(epc) for epc in epcs]):
+                self._save_push_scores()
+                self._make_batch_request_flags()
+        now = time.monotonic()
+        confirmed = []
+        for epc in epcs:
+            if (written := self._push_pending.pop(epc, None)) is not None:
+                self._timings.record_push(epc, now - written)
+                confirmed.append(epc)
+        if confirmed:
+            self._profile_store.async_schedule_save()
+            # pychonet only calls back for values that differ from its cache,
+            # which already holds the written EDT. Publish once it has
+            # processed this frame.
+            self.hass.async_create_task(self._async_publish_cached(confirmed))
+
+    async def _async_publish_cached(self, epcs: list[int]):
+        """Push pychonet's cached values of epcs to the entities."""
+        cached = await self._instance.update(epcs, no_request=True)
+        if not isinstance(cached, dict):
+            cached = {epcs[0]: cached}
+        cached = {epc: value for epc, value in cached.items() if value is not None}
+        if cached:
+            self.data.update(cached)
+            self.async_update_listeners()
+
+    async def _async_push_deadline(self):
+        """Read back written EPCs whose announcement is overdue."""
+        while self._push_pending:
+            deadline = self._timings.deadline
+            oldest = min(self._push_pending.values())
+            if (delay := oldest + deadline - time.monotonic()) > 0:
+                await asyncio.sleep(delay)
+                continue
+            now = time.monotonic()
+            overdue = [
+                epc
+                for epc, written in self._push_pending.items()
+                if now - written >= deadline
+            ]
+            for epc in overdue:
+                del self._push_pending[epc]
+                self._timings.record_push_miss(epc)
+            _LOGGER.debug(
+                "ECHONETLite: %s did not announce %s, reading back",
+                self._name,
+                [hex(epc) for epc in overdue],
+            )
+            self._profile_store.async_schedule_save()
+            self._schedule_verify(overdue)
+
+    async def _async_setget(
+        self, transaction: WriteTransaction, epcs: list[int]
+    ) -> dict[int, bool] | None:
+        """Write transaction and read back epcs in one SetGet exchange.
+
+        Returns:
+            EPC -> accepted as async_commit(), or None if the SetGet got
+            nothing done and the caller should fall back to SetC and Get.
+            The fallback is only taken while SetGet support is unknown.
         """
-        # 1. Execute the set command
-        await set_coro
+        set_opc = [opc for opc in transaction.opc if opc["EPC"] in self._setPropertyMap]
+        if not set_opc:
+            return None
+        payload = build_setget(
+            self._monitor.next_tid(),
+            (self._eojgc, self._eojcc, self._eojci),
+            set_opc,
+            [epc for epc in epcs if epc in self._getPropertyMap],
+        )
+        try:
+            async with self._scheduler.slot(PRIORITY_WRITE, self._scheduler_key):
+                response = await self._monitor.async_exchange(
+                    self._host, payload, self._scheduler
+                )
+        except TimeoutError:
+            return None
+        if (parsed := parse_setget(response)) is None:
+            return None
+        results, values = parsed
+        if not any(results.values()) and not values:
+            if self._profile.get("setget") is True:
+                # The device answers SetGet, so it rejected these values;
+                # sending them again as SetC would only be rejected again
+                return {**dict.fromkeys(transaction.epcs, False), **results}
+            # Indistinguishable from a device that rejects SetGet outright
+            return None
+        if self._profile.get("setget") is not True:
+            self._profile["setget"] = True
+            self._profile_store.async_schedule_save()
+
+        accepted = dict.fromkeys(transaction.epcs, False)
+        accepted.update(results)
+        if values:
+            self._mark_updated(list(values))
+            # Decode through pychonet's cache, as for any other read
+            self._instance._epc_data.update(values)
+            confirmed = await self._instance.update(list(values), no_request=True)
+            if not isinstance(confirmed, dict):
+                confirmed = {next(iter(values)): confirmed}
+            self.data.update(confirmed)
+            self.async_update_listeners()
+        return accepted
+
+    def _schedule_verify(self, epcs: list[int]):
+        """Queue epcs for the next merged verify read.
 
-        # 2. Targeted Background Verification
-        async def verify():
-            await asyncio.sleep(0.8)
+        At most one verify task exists per instance. Writes arriving while it
+        is waiting for the device to settle join its read and push it back by
+        the learned settle time, up to VERIFY_MAX_DELAY after the first write.
+        Writes arriving while it is reading are picked up by a follow-up read
+        from the same task.
+        """
+        now = time.monotonic()
+        if not self._verify_epcs:
+            self._verify_first = now
+        self._verify_epcs.update(epcs)
+        self._verify_due = min(
+            now + self._timings.settle, self._verify_first + VERIFY_MAX_DELAY
+        )
+        if self._verify_task is None or self._verify_task.done():
+            self._verify_task = self.hass.async_create_task(self._async_verify())
+
+    async def _async_verify(self):
+        """Read back written EPCs once the device has settled."""
+        while self._verify_epcs:
+            while (delay := self._verify_due - time.monotonic()) > 0:
+                await asyncio.sleep(delay)
+            epcs = sorted(self._verify_epcs)
+            self._verify_epcs.clear()
             confirmed = await self.poll_pychonet_specific(epcs)
             if confirmed:
                 self.data.update(confirmed)
                 self.async_update_listeners()
+            self._learn_settle(epcs, confirmed)
 
-        self.hass.async_create_task(verify())
+    def _learn_settle(self, epcs: list[int], confirmed: dict[int, Any]):
+        """Tune the settle time from verify reads of written values.
+
+        A read that still returns the value from before the write means the
+        device had not applied it yet: the settle time grows and the EPC is
+        read once more. Reads returning the written value let it shrink.
+        """
+        stale = []
+        for epc in epcs:
+            if (expected := self._verify_expected.pop(epc, None)) is None:
+                continue
+            before, after = expected
+            if epc not in confirmed or before == after:
+                continue
+            if confirmed[epc] == after:
+                self._timings.record_settled(True)
+            elif confirmed[epc] == before:
+                stale.append(epc)
+        if stale:
+            self._timings.record_settled(False)
+            _LOGGER.debug(
+                "ECHONETLite: %s had not applied %s yet, settle time now %.2fs",
+                self._name,
+                [hex(epc) for epc in stale],
+                self._timings.settle,
+            )
+            self._schedule_verify(stale)
+        self._profile_store.async_schedule_save()
 
     def _make_update_flags_full_list(self) -> bool:
         """Build the complete list of EPC codes to poll.
@@ -785,27 +1770,32 @@ class ECHONETConnector(DataUpdateCoordinator[dict]):
         EPCs marked as SINGLETON_POLL in quirks are excluded from batches and
         polled individually to avoid device firmware buffer overflow issues.
 
-        If CONF_FORCE_POLLING is False (default), EPCs in STATMAP are also
-        excluded from ongoing batches — they are served via push notifications.
-        The initial setup fetch still polls all EPCs to populate self.data.
-        If CONF_FORCE_POLLING is True (fallback for unreliable multicast),
-        all GETMAP EPCs are polled regardless of STATMAP.
+        If CONF_FORCE_POLLING is False (default), STATMAP EPCs that have been
+        seen arriving by INF are also excluded from ongoing batches — they are
+        served via push notifications, see PushReliability. The initial setup
+        fetch still polls all EPCs to populate self.data.
+        If CONF_FORCE_POLLING is True, all GETMAP EPCs are polled regardless.
 
-        Args:
-            CONF_BATCH_SIZE_MAX: User-configurable maximum batch size (default 10).
+        Batch size comes from the instance's BatchSizer, see _make_batch_sizer.
         """
-        self._update_flag_batches = []
-        start_index = 0
 
-        # Prune STATMAP EPCs from ongoing poll batches if force_polling is off.
-        # These EPCs are covered by push notifications so polling them is redundant.
+        # Prune push-served STATMAP EPCs from ongoing poll batches if
+        # force_polling is off. Polling them is redundant.
         _force_polling = self._user_options.get(CONF_FORCE_POLLING, False)
-        _ntf_set = set(self._ntfPropertyMap) if not _force_polling else set()
+        _ntf_set = (
+            {
+                e
+                for e in self._ntfPropertyMap
+                if self._push_reliability.served_by_push(e)
+            }
+            if not _force_polling
+            else set()
+        )
 
         if _ntf_set:
             _pruned = [
                 e
-                for e in self._ntfPropertyMap
+                for e in sorted(_ntf_set)
                 if e in self._update_flags_full_list
                 and e not in self._singleton_poll_epcs
             ]
@@ -821,30 +1811,96 @@ class ECHONETConnector(DataUpdateCoordinator[dict]):
                 )
 
         # Exclude singleton EPCs and (optionally) STATMAP EPCs from batch list
-        batch_list = [
+        self._poll_list = [
             epc
             for epc in self._update_flags_full_list
             if epc not in self._singleton_poll_epcs and epc not in _ntf_set
         ]
-        full_list_length = len(batch_list)
+        self._update_flag_batches = self._chunk_batch_request(self._poll_list)
 
-        batch_size_max = self._user_options.get(
-            CONF_BATCH_SIZE_MAX, MAX_UPDATE_BATCH_SIZE
+        _LOGGER.debug(
+            f"Echonet device {self._host}-{self._eojgc}-{self._eojcc}-{self._eojci} "
+            f"batch request flags list: {self._update_flag_batches}"
         )
 
-        while start_index + batch_size_max < full_list_length:
-            self._update_flag_batches.append(
-                batch_list[start_index : start_index + batch_size_max]
-            )
-            start_index += batch_size_max
+    def _make_inf_req_mode(self) -> bool:
+        """Forget whether INF_REQ works once the polling mode is switched off.
 
-        # Add remaining flags as final batch
-        self._update_flag_batches.append(batch_list[start_index:full_list_length])
+        Returns:
+            False - the mode never requires a reload.
+        """
+        if not self._user_options.get(CONF_INF_REQ_POLLING):
+            self._profile.pop("inf_req", None)
+        return False
 
+    def _make_batch_sizer(self) -> bool:
+        """Create the batch size controller for this instance.
+
+        The learned size from the instance profile wins; CONF_BATCH_SIZE_MAX
+        only seeds the controller for instances that have not learned one
+        yet. Changing the option resets the learned size so users can still
+        intervene.
+
+        Returns:
+            False - the controller never requires a reload.
+        """
+        configured = self._user_options.get(CONF_BATCH_SIZE_MAX, MAX_UPDATE_BATCH_SIZE)
+        if self._profile.get("batch_size_option", configured) != configured:
+            _LOGGER.debug(
+                "ECHONETLite %s-%s-%s: batch size option changed, "
+                "discarding learned batch size",
+                self._eojgc,
+                self._eojcc,
+                self._eojci,
+            )
+            self._profile.pop("batch_size", None)
+            self._profile.pop("batch_limit", None)
+        self._profile["batch_size_option"] = configured
+
+        self._batch_sizer = BatchSizer(
+            initial=self._profile.get("batch_size", configured),
+            floor=MIN_UPDATE_BATCH_SIZE,
+            ceiling=MISC_OPTIONS[CONF_BATCH_SIZE_MAX]["max"],
+            limit=self._profile.get("batch_limit"),
+        )
+        return False
+
+    def _save_profile(self):
+        """Persist the learned batching parameters to the instance profile."""
         _LOGGER.debug(
-            f"Echonet device {self._host}-{self._eojgc}-{self._eojcc}-{self._eojci} "
-            f"batch request flags list: {self._update_flag_batches}"
+            "ECHONETLite %s-%s-%s at %s: batch size now %d (limit %s), "
+            "frame budget %d bytes, singletons %s",
+            self._eojgc,
+            self._eojcc,
+            self._eojci,
+            self._host,
+            self._batch_sizer.size,
+            self._batch_sizer.limit,
+            self._packer.budget,
+            [hex(epc) for epc in self._packer.singletons],
         )
+        self._profile["batch_size"] = self._batch_sizer.size
+        self._profile["batch_limit"] = self._batch_sizer.limit
+        self._profile["edt_sizes"] = {
+            str(epc): size for epc, size in self._packer.edt_sizes.items()
+        }
+        self._profile["frame_budget"] = self._packer.budget
+        self._profile["singletons"] = sorted(self._packer.singletons)
+        self._profile_store.async_schedule_save()
+
+    def _chunk_batch_request(self, epcs: list[int]) -> list[list[int]]:
+        """Split epcs into request batches.
+
+        Batches are limited both by the learned OPC count and by the expected
+        response size from the learned EDT lengths.
+
+        Args:
+            epcs: EPC codes to request, in order.
+
+        Returns:
+            A list of non-empty batches.
+        """
+        return self._packer.pack(epcs, self._batch_sizer.size)
 
     def register_async_update_callbacks(self, update_func: callable):
         """Register a callback function to be called on data updates.
@@ -872,66 +1928,38 @@ class ECHONETConnector(DataUpdateCoordinator[dict]):
         """Load device-specific quirks for manufacturer-specific behavior.
 
         Quirks are used to handle devices with non-standard EPC implementations
-        or proprietary extensions that require special handling.
-        """
-
-        def update(extention: Any):
-            """Apply quirk definitions to the instance."""
-            for epc in extention.QUIRKS:
-                if func := extention.QUIRKS[epc].get("EPC_FUNCTION"):
-                    op_code = extention.QUIRKS[epc].get("ENL_OP_CODE")
-                    self._instance.register_epc_function(epc, func, op_code)
-                    if op_code:
-                        self._enl_op_codes.update({epc: op_code})
-                if extention.QUIRKS[epc].get("SINGLETON_POLL"):
-                    if epc not in self._singleton_poll_epcs:
-                        self._singleton_poll_epcs.append(epc)
-                        _LOGGER.debug(
-                            "Echonet quirk: EPC %s will be polled individually "
-                            "(SINGLETON_POLL) for %s-%s-%s at %s",
-                            hex(epc),
-                            self._eojgc,
-                            self._eojcc,
-                            self._eojci,
-                            self._host,
-                        )
-            _LOGGER.debug(f"Echonet EPC_FUNCTIONS is: {self._instance.EPC_FUNCTIONS}")
-            _LOGGER.debug(f"Echonet _enl_op_codes is: {self._enl_op_codes}")
-
-        # Check for manufacturer-specific quirks
-        if self._manufacturer:
-            check = [
-                "quirks",
-                self._manufacturer,
-                "all",
-                "{:0>2X}".format(self._eojgc) + "{:0>2X}".format(self._eojcc),
-            ]
-            path = os.path.dirname(__file__) + "/" + "/".join(check) + ".py"
-            _LOGGER.debug(f"Echonet _load_quirk check path is: {path}")
-
-            if os.path.isfile(path):
-                mod = "." + ".".join(check)
-                _LOGGER.debug(f"Echonet import module is: {mod} of {__package__}")
-                extention = await self.hass.async_add_executor_job(
-                    partial(import_module, mod, package=__package__)
+        or proprietary extensions that require special handling. They are
+        looked up in the quirk index, so identical units share one loaded
+        Quirk instead of each searching and importing the quirk files.
+        """
+        quirk = await async_get_quirk(
+            self.hass,
+            self._manufacturer,
+            self._host_product_code,
+            self._eojgc,
+            self._eojcc,
+        )
+        if quirk is None:
+            return
+        if quirk.frame_gap:
+            # Device profile floor for the host's inter-frame gap
+            self._scheduler.set_gap_floor(quirk.frame_gap)
+        for epc, func in quirk.epc_functions.items():
+            op_code = quirk.op_codes.get(epc)
+            self._instance.register_epc_function(epc, func, op_code)
+            if op_code:
+                self._enl_op_codes.update({epc: op_code})
+        for epc in quirk.singleton_poll:
+            if epc not in self._singleton_poll_epcs:
+                self._singleton_poll_epcs.append(epc)
+                _LOGGER.debug(
+                    "Echonet quirk: EPC %s will be polled individually "
+                    "(SINGLETON_POLL) for %s-%s-%s at %s",
+                    hex(epc),
+                    self._eojgc,
+                    self._eojcc,
+                    self._eojci,
+                    self._host,
                 )
-                update(extention)
-
-            # Check for product-code-specific quirks
-            if self._host_product_code:
-                check = [
-                    "quirks",
-                    self._manufacturer,
-                    self._host_product_code,
-                    "{:0>2X}".format(self._eojgc) + "{:0>2X}".format(self._eojcc),
-                ]
-                path = os.path.dirname(__file__) + "/" + "/".join(check) + ".py"
-                _LOGGER.debug(f"Echonet _load_quirk check path is: {path}")
-
-                if os.path.isfile(path):
-                    mod = "." + ".".join(check)
-                    _LOGGER.debug(f"Echonet import module is: {mod} of {__package__}")
-                    extention = await self.hass.async_add_executor_job(
-                        partial(import_module, mod, package=__package__)
-                    )
-                    update(extention)
+        _LOGGER.debug(f"Echonet EPC_FUNCTIONS is: {self._instance.EPC_FUNCTIONS}")
+        _LOGGER.debug(f"Echonet _enl_op_codes is: {self._enl_op_codes}")
@@ -71,6 +71,9 @@ CONF_OTHER_MODE = "other_mode"
 CONF_FORCE_POLLING = "force_polling"
 CONF_ENABLE_SUPER_ENERGY = "super_energy"
 CONF_BATCH_SIZE_MAX = "batch_size_max"
+CONF_PUSH_COALESCE_MS = "push_coalesce_ms"
+CONF_PUSH_MAX_AGE = "push_max_age"
+CONF_INF_REQ_POLLING = "inf_req_polling"
 CONF_ON_VALUE = "on_val"
 CONF_OFF_VALUE = "off_val"
 CONF_DISABLED_DEFAULT = "disabled_default"
@@ -97,6 +100,11 @@ TYPE_DATA_ARRAY_WITH_DICT_ITEMS = "type_data_array_with_dict_items"
 TYPE_DATA_DICT_OVERRIDES = "type_data_dict_overrides"
 SERVICE_SET_ON_TIMER_TIME = "set_on_timer_time"
 SERVICE_SET_INT_1B = "set_value_int_1b"
+SERVICE_GROUP_WRITE = "group_write"
+SERVICE_GROUP_LIGHT = "group_light"
+SERVICE_GROUP_COVER = "group_cover"
+# Sent with the entry id once a deferred instance has been set up
+SIGNAL_INSTANCE_ADDED = f"{DOMAIN}_instance_added_{{}}"
 OPEN = "open"
 CLOSE = "close"
 STOP = "stop"
@@ -1520,4 +1528,7 @@ MISC_OPTIONS = {
         "default": [ENABLE_SUPER_ENERGY_DEFAULT, True],
     },
     CONF_BATCH_SIZE_MAX: {"type": int, "default": 10, "min": 1, "max": 30},
+    CONF_PUSH_COALESCE_MS: {"type": int, "default": 0, "min": 0, "max": 1000},
+    CONF_PUSH_MAX_AGE: {"type": int, "default": 15, "min": 1, "max": 1440},
+    CONF_INF_REQ_POLLING: {"type": bool, "default": False},
 }
@@ -1,5 +1,6 @@
 """Support for ECHONETLite covers."""
 
+from functools import partial
 import logging
 import math
 
@@ -13,15 +14,13 @@ from pychonet.lib.epc_functions import (
     DATA_STATE_CLOSING,
     DATA_STATE_FULLY_OPEN,
 )
-from .const import DOMAIN
-
 from homeassistant.components.cover import (
     ATTR_POSITION,
     ATTR_TILT_POSITION,
     CoverEntity,
     CoverEntityFeature,
 )
-from .base_entity import EchonetEntity
+from .base_entity import EchonetEntity, async_setup_instances
 
 from pychonet.ElectricBlind import (
     ENL_BLIND_ANGLE,
@@ -41,8 +40,17 @@ _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass, config_entry, async_add_devices):
     """Set up entry."""
+    await async_setup_instances(
+        hass,
+        config_entry,
+        partial(_async_add_instances, hass, config_entry, async_add_devices),
+    )
+
+
+async def _async_add_instances(hass, config_entry, async_add_devices, instances):
+    """Add the entities of instances."""
     entities = []
-    for entity in hass.data[DOMAIN][config_entry.entry_id]:
+    for entity in instances:
         if entity["instance"]["eojgc"] == 0x02 and entity["instance"]["eojcc"] in (
             0x60,
             0x61,
@@ -153,34 +161,47 @@ class EchonetCover(EchonetEntity, CoverEntity):
 
     async def async_close_cover(self, **kwargs: Any) -> None:
         """Close the cover."""
-        await self.coordinator._instance.setMessage(ENL_OPENSTATE, 0x42)
+        await self.coordinator.async_send(
+            self.coordinator._instance.setMessage(ENL_OPENSTATE, 0x42)
+        )
         self.coordinator.data[ENL_OPENSTATE] = DATA_STATE_CLOSE
 
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open the cover."""
-        await self.coordinator._instance.setMessage(ENL_OPENSTATE, 0x41)
+        await self.coordinator.async_send(
+            self.coordinator._instance.setMessage(ENL_OPENSTATE, 0x41)
+        )
         self.coordinator.data[ENL_OPENSTATE] = DATA_STATE_OPEN
 
     async def async_stop_cover(self, **kwargs: Any) -> None:
         """Stop the cover movement."""
-        await self.coordinator._instance.setMessage(ENL_OPENSTATE, 0x43)
+        await self.coordinator.async_send(
+            self.coordinator._instance.setMessage(ENL_OPENSTATE, 0x43)
+        )
         self.coordinator.data[ENL_OPENSTATE] = DATA_STATE_STOP
 
     async def async_set_cover_position(self, **kwargs: Any) -> None:
         """Set the cover position."""
         desired_position = kwargs[ATTR_POSITION]
         current_position = self.current_cover_position or 0
-        await self.coordinator._instance.setMessage(ENL_OPENING_LEVEL, desired_position)
-        self.coordinator.data[ENL_OPENING_LEVEL] = int(desired_position)
+        transaction = self.coordinator.write_transaction()
+        transaction.set(ENL_OPENING_LEVEL, desired_position)
+        await self.coordinator.async_commit_latest(
+            transaction, {ENL_OPENING_LEVEL: int(desired_position)}
+        )
 
     async def async_close_cover_tilt(self, **kwargs: Any) -> None:
         """Close the cover tilt."""
-        await self.coordinator._instance.setMessage(ENL_BLIND_ANGLE, 0)
+        await self.coordinator.async_send(
+            self.coordinator._instance.setMessage(ENL_BLIND_ANGLE, 0)
+        )
         self.coordinator.data[ENL_BLIND_ANGLE] = 0
 
     async def async_open_cover_tilt(self, **kwargs: Any) -> None:
         """Open the cover tilt."""
-        await self.coordinator._instance.setMessage(ENL_BLIND_ANGLE, 180)
+        await self.coordinator.async_send(
+            self.coordinator._instance.setMessage(ENL_BLIND_ANGLE, 180)
+        )
         self.coordinator.data[ENL_BLIND_ANGLE] = 180
 
     async def async_set_cover_tilt_position(self, **kwargs: Any) -> None:
@@ -188,5 +209,8 @@ class EchonetCover(EchonetEntity, CoverEntity):
         tilt = math.ceil(
             percentage_to_ranged_value(TILT_RANGE, kwargs[ATTR_TILT_POSITION])
         )
-        await self.coordinator._instance.setMessage(ENL_BLIND_ANGLE, tilt)
-        self.coordinator.data[ENL_BLIND_ANGLE] = int(tilt)
+        transaction = self.coordinator.write_transaction()
+        transaction.set(ENL_BLIND_ANGLE, tilt)
+        await self.coordinator.async_commit_latest(
+            transaction, {ENL_BLIND_ANGLE: int(tilt)}
+        )
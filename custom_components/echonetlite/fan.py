@@ -1,5 +1,6 @@
 """Support for ECHONETLite fans."""
 
+from functools import partial
 import logging
 
 from pychonet.HomeAirCleaner import FAN_SPEED
@@ -11,11 +12,10 @@ from pychonet.CeilingFan import (
     ENL_FAN_OSCILLATION,
 )
 from homeassistant.components.fan import FanEntity, FanEntityFeature
-from .base_entity import EchonetEntity
+from .base_entity import EchonetEntity, async_setup_instances
 
 from .const import (
     DATA_STATE_ON,
-    DOMAIN,
     ENL_FANSPEED,
 )
 
@@ -28,8 +28,17 @@ DEFAULT_FAN_MODES = list(
 
 async def async_setup_entry(hass, config_entry, async_add_devices):
     """Set up entry."""
+    await async_setup_instances(
+        hass,
+        config_entry,
+        partial(_async_add_instances, hass, config_entry, async_add_devices),
+    )
+
+
+async def _async_add_instances(hass, config_entry, async_add_devices, instances):
+    """Add the entities of instances."""
     entities = []
-    for entity in hass.data[DOMAIN][config_entry.entry_id]:
+    for entity in instances:
         if entity["instance"]["eojgc"] == 0x01 and (
             entity["instance"]["eojcc"] == 0x35
             # or entity["instance"]["eojcc"]
@@ -105,7 +114,9 @@ class EchonetFan(EchonetEntity, FanEntity):
 
     async def async_set_direction(self, direction: str) -> None:
         """Set the fan direction."""
-        await self.coordinator._instance.setFanDirection(direction)
+        await self.coordinator.async_send(
+            self.coordinator._instance.setFanDirection(direction)
+        )
 
     async def async_turn_on(
         self,
@@ -114,20 +125,26 @@ class EchonetFan(EchonetEntity, FanEntity):
         **kwargs,
     ) -> None:
         """Turn on the fan."""
-        await self.coordinator._instance.on()
+        await self.coordinator.async_send(self.coordinator._instance.on())
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn off the fan."""
-        await self.coordinator._instance.off()
+        await self.coordinator.async_send(self.coordinator._instance.off())
 
     async def async_oscillate(self, oscillating: bool) -> None:
         """Set the fan oscillation state."""
-        await self.coordinator._instance.setFanOscillation(oscillating)
+        await self.coordinator.async_send(
+            self.coordinator._instance.setFanOscillation(oscillating)
+        )
 
     async def async_set_percentage(self, percentage: int) -> None:
         """Set the speed percentage of the fan."""
-        await self.coordinator._instance.setFanSpeedPercent(percentage)
+        await self.coordinator.async_send(
+            self.coordinator._instance.setFanSpeedPercent(percentage)
+        )
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set new fan mode."""
-        await self.coordinator._instance.setFanSpeed(preset_mode)
+        await self.coordinator.async_send(
+            self.coordinator._instance.setFanSpeed(preset_mode)
+        )
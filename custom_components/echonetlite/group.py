@@ -0,0 +1,286 @@
+"""Group writes to many instances with as few SetI frames as possible."""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any
+
+import voluptuous as vol
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_platform
+from pychonet.ElectricBlind import ENL_OPENSTATE
+from pychonet.GeneralLighting import ENL_STATUS
+from pychonet.lib.const import ENL_MULTICAST_ADDRESS, ENL_OFF, ENL_ON, SETI
+from pychonet.lib.functions import buildEchonetMsg
+
+from .classread import ALL_INSTANCES
+from .const import (
+    CLOSE,
+    DOMAIN,
+    OPEN,
+    SERVICE_GROUP_COVER,
+    SERVICE_GROUP_LIGHT,
+    SERVICE_GROUP_WRITE,
+    STOP,
+)
+from .monitor import ECHONET_PORT, async_get_frame_monitor
+from .scheduler import PRIORITY_WRITE
+
+_LOGGER = logging.getLogger(__name__)
+
+ATTR_EPC = "epc"
+ATTR_VALUE = "value"
+ATTR_PDC = "pdc"
+ATTR_MULTICAST = "multicast"
+ATTR_STATE = "state"
+ATTR_ACTION = "action"
+
+COVER_ACTIONS = {OPEN: 0x41, CLOSE: 0x42, STOP: 0x43}
+
+TARGET_SCHEMA = {
+    vol.Required(ATTR_ENTITY_ID): cv.entity_ids,
+    vol.Optional(ATTR_MULTICAST, default=False): cv.boolean,
+}
+
+
+@dataclass
+class GroupFrame:
+    """One SetI frame of a group write and the instances it reaches."""
+
+    host: str | None
+    eoj: tuple[int, int, int]
+    opc: list[dict[str, Any]]
+    connectors: list = field(default_factory=list)
+
+    @property
+    def addr(self) -> tuple[str, int]:
+        """Return where the frame is sent, the multicast group if no host."""
+        return (self.host or ENL_MULTICAST_ADDRESS, ECHONET_PORT)
+
+
+def _configured_instances(hass: HomeAssistant) -> dict[tuple, dict[str, set]]:
+    """Return (group code, class code) -> host -> configured instance codes.
+
+    Taken from the config entries rather than the loaded connectors: an
+    instance whose setup was deferred still receives a frame sent to
+    instance code 0x00.
+    """
+    configured: dict[tuple, dict[str, set]] = {}
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        for instance in entry.data.get("instances", []):
+            configured.setdefault(
+                (instance["eojgc"], instance["eojcc"]), {}
+            ).setdefault(instance["host"], set()).add(instance["eojci"])
+    return configured
+
+
+def plan_group_write(
+    hass: HomeAssistant, writes: dict, multicast: bool = False
+) -> list[GroupFrame]:
+    """Work out the fewest SetI frames that carry writes.
+
+    Instances of one class that are written the same values share a frame.
+    When they are every configured instance of the class on their host the
+    frame goes to instance code 0x00 on that host. With multicast, a write
+    reaching every configured instance of the class on several hosts is sent
+    once to the ECHONET Lite multicast group instead.
+
+    Args:
+        hass: The Home Assistant instance.
+        writes: ECHONETConnector -> OPC list to write to its instance.
+        multicast: True to allow a single multicast frame per class.
+
+    Returns:
+        The frames to send.
+    """
+    # (group code, class code, written values) -> host -> connectors
+    shared: dict[tuple, dict[str, list]] = {}
+    for connector, opc in writes.items():
+        opc = [o for o in opc if o["EPC"] in connector._setPropertyMap]
+        if not opc:
+            _LOGGER.debug(
+                "ECHONETLite: %s cannot set any of the group write's EPCs",
+                connector._name,
+            )
+            continue
+        key = (
+            connector._eojgc,
+            connector._eojcc,
+            tuple((o["EPC"], o["PDC"], o["EDT"]) for o in opc),
+        )
+        shared.setdefault(key, {}).setdefault(connector._host, []).append(connector)
+
+    configured = _configured_instances(hass)
+    frames = []
+    for (eojgc, eojcc, values), hosts in shared.items():
+        opc = [{"EPC": epc, "PDC": pdc, "EDT": edt} for epc, pdc, edt in values]
+        everywhere = configured.get((eojgc, eojcc), {})
+        covered = {
+            host
+            for host, connectors in hosts.items()
+            if {c._eojci for c in connectors} == everywhere.get(host)
+        }
+        class_wide = (eojgc, eojcc, ALL_INSTANCES)
+        if multicast and len(hosts) > 1 and covered == everywhere.keys():
+            frames.append(GroupFrame(None, class_wide, opc, sum(hosts.values(), [])))
+            continue
+        for host, connectors in hosts.items():
+            if len(connectors) > 1 and host in covered:
+                frames.append(GroupFrame(host, class_wide, opc, connectors))
+            else:
+                frames.extend(
+                    GroupFrame(host, (eojgc, eojcc, c._eojci), opc, [c])
+                    for c in connectors
+                )
+    return frames
+
+
+async def async_group_write(
+    hass: HomeAssistant, writes: dict, multicast: bool = False
+) -> None:
+    """Send writes as SetI frames and reconcile every instance afterwards.
+
+    SetI is not answered, so frames to different hosts go out together and
+    each instance confirms its write like any other: from the INF the
+    device sends, or with a verify read.
+
+    Args:
+        hass: The Home Assistant instance.
+        writes: ECHONETConnector -> OPC list to write to its instance.
+        multicast: True to allow a single multicast frame per class.
+    """
+    frames = plan_group_write(hass, writes, multicast)
+    if not frames:
+        return
+    monitor = async_get_frame_monitor(hass)
+    _LOGGER.debug(
+        "ECHONETLite: group write to %d instance(s) in %d SetI frame(s)",
+        sum(len(frame.connectors) for frame in frames),
+        len(frames),
+    )
+
+    async def _async_send(frame: GroupFrame):
+        payload = buildEchonetMsg(
+            {
+                "TID": monitor.next_tid(),
+                "DEOJGC": frame.eoj[0],
+                "DEOJCC": frame.eoj[1],
+                "DEOJCI": frame.eoj[2],
+                "ESV": SETI,
+                "OPC": frame.opc,
+            }
+        )
+        if frame.host is None:
+            monitor.send_raw(payload, frame.addr)
+        else:
+            # Take the host's slot so the frame does not collide with a
+            # request that is waiting for its answer
+            scheduler = frame.connectors[0]._scheduler
+            async with scheduler.slot(PRIORITY_WRITE, "group"):
+                monitor.send_raw(payload, frame.addr)
+
+    await asyncio.gather(*(_async_send(frame) for frame in frames))
+    await asyncio.gather(
+        *(
+            connector.async_group_written(frame.opc)
+            for frame in frames
+            for connector in frame.connectors
+        )
+    )
+
+
+def _entities(hass: HomeAssistant, entity_ids: list[str], domain: str | None):
+    """Return this integration's entities among entity_ids."""
+    entities = []
+    for platform in entity_platform.async_get_platforms(hass, DOMAIN):
+        if domain is not None and platform.domain != domain:
+            continue
+        entities.extend(
+            entity
+            for entity_id, entity in platform.entities.items()
+            if entity_id in entity_ids
+        )
+    return entities
+
+
+def _value_fits(data: dict[str, Any]) -> dict[str, Any]:
+    """Check that the value can be sent in pdc bytes."""
+    if data[ATTR_VALUE] >= 1 << (8 * data[ATTR_PDC]):
+        raise vol.Invalid(
+            f"{data[ATTR_VALUE]} does not fit in {data[ATTR_PDC]} byte(s)"
+        )
+    return data
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the group write services once."""
+    if hass.services.has_service(DOMAIN, SERVICE_GROUP_WRITE):
+        return
+
+    async def _async_group_write(call: ServiceCall):
+        opc = [
+            {
+                "EPC": call.data[ATTR_EPC],
+                "PDC": call.data[ATTR_PDC],
+                "EDT": call.data[ATTR_VALUE],
+            }
+        ]
+        writes = {
+            entity.coordinator: opc
+            for entity in _entities(hass, call.data[ATTR_ENTITY_ID], None)
+        }
+        await async_group_write(hass, writes, call.data[ATTR_MULTICAST])
+
+    async def _async_group_light(call: ServiceCall):
+        edt = ENL_ON if call.data[ATTR_STATE] else ENL_OFF
+        writes = {
+            # Ceiling fan lights switch with their own EPC
+            entity.coordinator: [
+                {"EPC": entity._custom_options[ENL_STATUS], "PDC": 1, "EDT": edt}
+            ]
+            for entity in _entities(hass, call.data[ATTR_ENTITY_ID], "light")
+        }
+        await async_group_write(hass, writes, call.data[ATTR_MULTICAST])
+
+    async def _async_group_cover(call: ServiceCall):
+        edt = COVER_ACTIONS[call.data[ATTR_ACTION]]
+        writes = {
+            entity.coordinator: [{"EPC": ENL_OPENSTATE, "PDC": 1, "EDT": edt}]
+            for entity in _entities(hass, call.data[ATTR_ENTITY_ID], "cover")
+        }
+        await async_group_write(hass, writes, call.data[ATTR_MULTICAST])
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GROUP_WRITE,
+        _async_group_write,
+        vol.All(
+            vol.Schema(
+                {
+                    **TARGET_SCHEMA,
+                    vol.Required(ATTR_EPC): vol.All(
+                        vol.Coerce(int), vol.Range(min=0x80, max=0xFF)
+                    ),
+                    vol.Required(ATTR_VALUE): cv.positive_int,
+                    vol.Optional(ATTR_PDC, default=1): vol.All(
+                        vol.Coerce(int), vol.Range(min=1, max=8)
+                    ),
+                }
+            ),
+            _value_fits,
+        ),
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GROUP_LIGHT,
+        _async_group_light,
+        vol.Schema({**TARGET_SCHEMA, vol.Required(ATTR_STATE): cv.boolean}),
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GROUP_COVER,
+        _async_group_cover,
+        vol.Schema({**TARGET_SCHEMA, vol.Required(ATTR_ACTION): vol.In(COVER_ACTIONS)}),
+    )
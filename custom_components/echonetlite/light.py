@@ -1,5 +1,6 @@
 """Support for ECHONETLite lights."""
 
+from functools import partial
 import logging
 
 from pychonet.GeneralLighting import ENL_STATUS, ENL_BRIGHTNESS, ENL_COLOR_TEMP
@@ -23,9 +24,9 @@ from homeassistant.components.light import (
     ATTR_COLOR_TEMP_KELVIN,
 )
 from homeassistant.core import callback
-from .base_entity import EchonetEntity
+from .base_entity import EchonetEntity, async_setup_instances
 
-from .const import DATA_STATE_ON, DOMAIN
+from .const import DATA_STATE_ON
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -47,8 +48,17 @@ def _kelvin_to_mireds(kelvin):
 
 async def async_setup_entry(hass, config_entry, async_add_devices):
     """Set up entry."""
+    await async_setup_instances(
+        hass,
+        config_entry,
+        partial(_async_add_instances, hass, config_entry, async_add_devices),
+    )
+
+
+async def _async_add_instances(hass, config_entry, async_add_devices, instances):
+    """Add the entities of instances."""
     entities = []
-    for entity in hass.data[DOMAIN][config_entry.entry_id]:
+    for entity in instances:
         eojgc = entity["instance"]["eojgc"]
         eojcc = entity["instance"]["eojcc"]
         if (eojgc == 0x02 and eojcc in (0x90, 0x91, 0xA3)) or (
@@ -269,29 +279,34 @@ class EchonetLight(EchonetEntity, LightEntity):
         if ATTR_EFFECT in kwargs and kwargs[ATTR_EFFECT] in self._attr_effect_list:
             states[ATTR_EFFECT] = kwargs[ATTR_EFFECT]
 
+        # Power, brightness and color temperature in a single SetC frame
+        instance = self.coordinator._instance
+        transaction = self.coordinator.write_transaction()
+        optimistic = {self._custom_options[ENL_STATUS]: DATA_STATE_ON}
+        if states.get("brightness"):
+            optimistic[self._custom_options[ENL_BRIGHTNESS]] = states["brightness"]
+
         # Execute the appropriate method based on device capabilities
-        if hasattr(self.coordinator._instance, "setLightStates"):
-            return await self.coordinator._instance.setLightStates(states)
+        if hasattr(instance, "setLightStates"):
+            await transaction.add(instance.setLightStates, states)
         else:
-            """Turn on."""
-            result = await getattr(
-                self.coordinator._instance, self._custom_options["on"]
-            )()
-
-            if result:
-                if states.get("brightness"):
-                    result &= await self.coordinator._instance.setBrightness(
-                        states["brightness"]
-                    )
-
-                if states.get("color_temperature"):
-                    result &= await self.coordinator._instance.setColorTemperature(
-                        states["color_temperature"]
-                    )
+            await transaction.add(getattr(instance, self._custom_options["on"]))
+            if states.get("brightness"):
+                await transaction.add(instance.setBrightness, states["brightness"])
+            if states.get("color_temperature"):
+                await transaction.add(
+                    instance.setColorTemperature, states["color_temperature"]
+                )
+
+        # Dragging the brightness slider sends one write per step; only the
+        # newest one still waiting is sent
+        await self.coordinator.async_commit_latest(transaction, optimistic)
 
     async def async_turn_off(self, **kwargs):
         """Turn off the light."""
-        await getattr(self.coordinator._instance, self._custom_options["off"])()
+        await self.coordinator.async_send(
+            getattr(self.coordinator._instance, self._custom_options["off"])()
+        )
 
     @callback
     def _handle_coordinator_update(self) -> None:
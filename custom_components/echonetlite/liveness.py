@@ -0,0 +1,154 @@
+"""Fleet-wide liveness probing with a single multicast frame."""
+
+import asyncio
+import logging
+import time
+from datetime import timedelta
+from typing import Callable
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.event import async_track_time_interval
+from pychonet.lib.const import ENL_MULTICAST_ADDRESS, GET
+from pychonet.lib.functions import buildEchonetMsg
+
+from .const import DOMAIN
+from .monitor import ECHONET_PORT, FrameMonitor, async_get_frame_monitor
+
+_LOGGER = logging.getLogger(__name__)
+
+LIVENESS_INTERVAL = timedelta(seconds=60)
+# How long answers to a probe are collected after it was sent
+LIVENESS_WINDOW = 3.0
+# Probes a host may leave unanswered, while others answered them, before it
+# counts as down
+LIVENESS_MISSES = 2
+
+# Every node implements the node profile object
+NODE_PROFILE = (0x0E, 0xF0, 0x01)
+EPC_OPERATION_STATUS = 0x80
+
+
+class LivenessProbe:
+    """Check every configured host with one multicast Get of 0x80.
+
+    Each probe is a single Get of the node profile's operation status sent to
+    the ECHONET Lite multicast group. Every node answering it is known to be
+    alive without any per-host traffic; the answers are recorded as host
+    activity and kept from pychonet, which would otherwise treat unknown
+    senders as newly discovered nodes.
+
+    A host only counts as down once it has answered probes before, then left
+    LIVENESS_MISSES probes unanswered that other hosts did answer, and has
+    not been heard from at all since. Nodes that ignore multicast requests
+    are therefore never reported down by the probe.
+    """
+
+    def __init__(self, hass: HomeAssistant, monitor: FrameMonitor):
+        """Initialize the probe.
+
+        Args:
+            hass: The Home Assistant instance.
+            monitor: The frame monitor of the shared API client.
+        """
+        self._hass = hass
+        self._monitor = monitor
+        # host -> callbacks run when the host answers again after being down
+        self._watchers: dict[str, list[Callable[[], None]]] = {}
+        # host -> consecutive answered probes it missed, once it answered one
+        self._misses: dict[str, int] = {}
+        # host -> send time of the first probe in the current run of misses
+        self._missed_since: dict[str, float] = {}
+        self._unsub: Callable[[], None] | None = None
+
+    def watch(self, host: str, on_alive: Callable[[], None]) -> None:
+        """Include host in the probes and call on_alive when it comes back."""
+        self._watchers.setdefault(host, []).append(on_alive)
+        # Answers only reach the probe through the monitor's receive hook
+        if self._unsub is None and self._monitor.attached:
+            _LOGGER.debug("ECHONETLite: starting liveness probes")
+            self._unsub = async_track_time_interval(
+                self._hass, self._async_probe, LIVENESS_INTERVAL
+            )
+
+    def unwatch(self, host: str) -> None:
+        """Stop tracking host, and stop probing once no host is left."""
+        self._watchers.pop(host, None)
+        self._misses.pop(host, None)
+        self._missed_since.pop(host, None)
+        if not self._watchers and self._unsub is not None:
+            _LOGGER.debug("ECHONETLite: stopping liveness probes")
+            self._unsub()
+            self._unsub = None
+
+    def is_down(self, host: str) -> bool:
+        """Return True if the probes say host is not reachable."""
+        if self._misses.get(host, 0) < LIVENESS_MISSES:
+            return False
+        last = self._monitor.api.last_activity(host)
+        return last is None or last < self._missed_since[host]
+
+    async def _async_probe(self, now=None) -> None:
+        """Send one probe and fold the answers into the per-host state."""
+        tid = self._monitor.next_tid()
+        answered: set[str] = set()
+        payload = buildEchonetMsg(
+            {
+                "TID": tid,
+                "DEOJGC": NODE_PROFILE[0],
+                "DEOJCC": NODE_PROFILE[1],
+                "DEOJCI": NODE_PROFILE[2],
+                "ESV": GET,
+                "OPC": [{"EPC": EPC_OPERATION_STATUS}],
+            }
+        )
+        sent_at = time.monotonic()
+        self._monitor.collect(tid, lambda host, data: answered.add(host))
+        try:
+            self._monitor.send_raw(payload, (ENL_MULTICAST_ADDRESS, ECHONET_PORT))
+            await asyncio.sleep(LIVENESS_WINDOW)
+        finally:
+            self._monitor.stop_collecting(tid)
+
+        if not answered:
+            # Nobody answered: more likely our side of the network than
+            # every device at once, so nothing is learned from this probe.
+            _LOGGER.debug("ECHONETLite: liveness probe went unanswered")
+            return
+        _LOGGER.debug("ECHONETLite: liveness probe answered by %s", sorted(answered))
+
+        for host, watchers in self._watchers.items():
+            if host in answered:
+                # The answer itself already counts as activity, so go by
+                # the misses rather than is_down()
+                was_down = self._misses.get(host, 0) >= LIVENESS_MISSES
+                self._misses[host] = 0
+                if was_down:
+                    _LOGGER.info("ECHONETLite: %s answers again", host)
+                    for on_alive in watchers:
+                        on_alive()
+            elif host in self._misses:
+                if not self._misses[host]:
+                    self._missed_since[host] = sent_at
+                self._misses[host] += 1
+                if self._misses[host] == LIVENESS_MISSES:
+                    _LOGGER.debug(
+                        "ECHONETLite: %s missed %d liveness probes",
+                        host,
+                        LIVENESS_MISSES,
+                    )
+
+
+def async_get_liveness_probe(hass: HomeAssistant) -> LivenessProbe:
+    """Return the shared liveness probe, creating it on first use."""
+    monitor = async_get_frame_monitor(hass)
+    probe = hass.data[DOMAIN].get("liveness")
+    if probe is None or probe._monitor is not monitor:
+        probe = hass.data[DOMAIN]["liveness"] = LivenessProbe(hass, monitor)
+    return probe
+
+
+def async_release_liveness(hass: HomeAssistant, host: str) -> None:
+    """Stop probing host once it has been unregistered."""
+    probe = hass.data.get(DOMAIN, {}).get("liveness")
+    if probe is not None:
+        probe.unwatch(host)
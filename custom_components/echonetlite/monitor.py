@@ -0,0 +1,504 @@
+"""Raw ECHONET Lite frame monitoring on top of pychonet's UDP server."""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from homeassistant.core import HomeAssistant
+from pychonet import ECHONETAPIClient
+from pychonet.lib.const import (
+    INF,
+    INFC,
+    INFREQ,
+    SETC_SND,
+    SETGET,
+    SETGET_RES,
+    SETGET_SNA,
+    SETRES,
+)
+from pychonet.lib.functions import buildEchonetMsg, decodeEchonetMsg
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# EHD1 EHD2 TID(2) SEOJ(3) DEOJ(3) ESV OPC
+EHD = b"\x10\x81"
+ESV_OFFSET = 10
+# Request ESVs are 0x60-0x6F; responses, notifications and "not possible"
+# replies are 0x50-0x5F and 0x70-0x7F.
+REQUEST_ESV_RANGE = range(0x60, 0x70)
+
+OPC_OFFSET = 11
+ECHONET_PORT = 3610
+MAX_TID = 0xFFFF
+
+# Retransmissions of an unanswered request before it is given up on. The
+# wait before each one doubles, starting from the host's RTO.
+MAX_RETRANSMITS = 2
+
+# pychonet internals the monitor hooks into, checked against pychonet 2.8.1
+# (the version pinned in manifest.json). Recheck them when bumping the pin.
+API_INTERNALS = ("_server", "_message_list", "_next_tx_tid", "_last_activity")
+SERVER_INTERNALS = ("send", "_subscribers")
+
+
+@dataclass
+class Frame:
+    """A request frame sent to a host and what became of it."""
+
+    host: str
+    tid: int
+    esv: int
+    payload: bytes
+    addr: tuple[str, int]
+    sent_at: float
+    answered_at: float | None = None
+    response: bytes | None = None
+    retransmits: int = 0
+    duplicates: int = 0
+
+
+def _parse_header(data: bytes) -> tuple[int, int] | None:
+    """Return (TID, ESV) of an ECHONET Lite frame, or None if malformed."""
+    if len(data) <= ESV_OFFSET or data[:2] != EHD:
+        return None
+    return int.from_bytes(data[2:4], "big"), data[ESV_OFFSET]
+
+
+def set_results(frame: Frame | None) -> dict[int, bool]:
+    """Return which EPCs of a SetC request the device accepted.
+
+    A Set_Res accepts every property. A SetC_SNA echoes the rejected
+    properties with their EDT and the accepted ones with PDC 0.
+
+    Args:
+        frame: The request frame, as returned by FrameMonitor.last_request().
+
+    Returns:
+        EPC -> accepted, for the EPCs in the response. Empty if the frame was
+        not answered or the answer could not be decoded.
+    """
+    if frame is None or frame.response is None:
+        return {}
+    try:
+        message = decodeEchonetMsg(frame.response)
+    except Exception:
+        return {}
+    if message["ESV"] not in (SETRES, SETC_SND):
+        return {}
+    return {
+        opc["EPC"]: message["ESV"] == SETRES or opc["PDC"] == 0
+        for opc in message["OPC"]
+    }
+
+
+def parse_epcs(data: bytes) -> list[int]:
+    """Return the EPCs carried by a single-OPC-block frame such as an INF."""
+    epcs = []
+    pointer = OPC_OFFSET + 1
+    try:
+        for _ in range(data[OPC_OFFSET]):
+            epcs.append(data[pointer])
+            pointer += 2 + data[pointer + 1]
+    except IndexError:
+        pass
+    return epcs
+
+
+def build_setget(
+    tid: int,
+    eoj: tuple[int, int, int],
+    set_opc: list[dict[str, Any]],
+    get_epcs: list[int],
+) -> bytes:
+    """Build a SetGet frame: OPCSet properties followed by OPCGet properties.
+
+    Args:
+        tid: Transaction ID.
+        eoj: Destination (group code, class code, instance code).
+        set_opc: Properties to write, in pychonet's OPC format.
+        get_epcs: EPCs to read back in the same exchange.
+    """
+    message = buildEchonetMsg(
+        {
+            "TID": tid,
+            "DEOJGC": eoj[0],
+            "DEOJCC": eoj[1],
+            "DEOJCI": eoj[2],
+            "ESV": SETGET,
+            "OPC": set_opc,
+        }
+    )
+    message.append(len(get_epcs))
+    for epc in get_epcs:
+        message += bytes((epc, 0))
+    return bytes(message)
+
+
+def build_inf_req(tid: int, eoj: tuple[int, int, int], epcs: list[int]) -> bytes:
+    """Build an INF_REQ frame asking eoj to announce epcs in an INF."""
+    return bytes(
+        buildEchonetMsg(
+            {
+                "TID": tid,
+                "DEOJGC": eoj[0],
+                "DEOJCC": eoj[1],
+                "DEOJCI": eoj[2],
+                "ESV": INFREQ,
+                "OPC": [{"EPC": epc} for epc in epcs],
+            }
+        )
+    )
+
+
+def parse_setget(data: bytes) -> tuple[dict[int, bool], dict[int, bytes]] | None:
+    """Decode a SetGet_Res or SetGet_SNA frame.
+
+    Returns:
+        (EPC -> write accepted, EPC -> EDT read back) or None if data is not a
+        well-formed SetGet answer. EPCs the device could not read are left
+        out of the second dict.
+    """
+    header = _parse_header(data)
+    if header is None or header[1] not in (SETGET_RES, SETGET_SNA):
+        return None
+    accepted: dict[int, bool] = {}
+    values: dict[int, bytes] = {}
+    pointer = OPC_OFFSET
+    try:
+        for part in (accepted, values):
+            count = data[pointer]
+            pointer += 1
+            for _ in range(count):
+                epc, pdc = data[pointer], data[pointer + 1]
+                edt = data[pointer + 2 : pointer + 2 + pdc]
+                if len(edt) != pdc:
+                    return None
+                pointer += 2 + pdc
+                if part is accepted:
+                    # Accepted writes are echoed with PDC 0
+                    accepted[epc] = pdc == 0
+                elif pdc:
+                    values[epc] = edt
+    except IndexError:
+        return None
+    return accepted, values
+
+
+class FrameMonitor:
+    """Observe every frame pychonet sends and receives.
+
+    pychonet's request loop only knows "answered within message_timeout" or
+    not. The monitor sits between pychonet and its UDP server so the
+    integration can see when each request actually went out and when its
+    answer came back, retransmit a request whose answer is overdue, and keep
+    duplicate answers from those retransmissions away from pychonet.
+
+    This relies on pychonet internals, see API_INTERNALS. If the installed
+    pychonet lacks any of them the monitor stays detached: requests run as
+    plain pychonet requests, and exchanges, which need the receive hook,
+    raise TimeoutError as if unanswered. Check attached before relying on
+    features built on exchanges.
+    """
+
+    def __init__(self, api: ECHONETAPIClient):
+        """Attach the monitor to api's UDP server.
+
+        Args:
+            api: The shared pychonet API client.
+        """
+        self.api = api
+        self._server = getattr(api, "_server", None)
+        # Latest request frame sent to each host
+        self._sent: dict[str, Frame] = {}
+        # Answers awaited for frames the monitor sent itself, by (host, TID)
+        self._exchanges: dict[tuple[str, int], asyncio.Future] = {}
+        # Exchanges whose answer pychonet decodes like any other frame
+        self._forwarded: set[tuple[str, int]] = set()
+        # Notification listeners by (host, group code, class code, instance)
+        self._push_listeners: dict[tuple[str, int, int, int], Callable] = {}
+        # Collectors of the answers to multicast requests, by TID
+        self._collectors: dict[int, Callable[[str, bytes], None]] = {}
+        # Own TID counter, only used while detached
+        self._tid = 0
+        self.attached = False
+        missing = [name for name in API_INTERNALS if not hasattr(api, name)]
+        missing += [
+            f"_server.{name}"
+            for name in SERVER_INTERNALS
+            if self._server is not None and not hasattr(self._server, name)
+        ]
+        receiver_key = None if missing else self._find_receiver()
+        if missing or receiver_key is None:
+            _LOGGER.warning(
+                "ECHONETLite: this pychonet version does not provide %s; "
+                "falling back to plain pychonet requests without "
+                "retransmission, SetGet, INF_REQ polling or class-wide reads",
+                ", ".join(missing) or "the UDP server subscription",
+            )
+            self._send = getattr(self._server, "send", None)
+            return
+        self._send = self._server.send
+        self._server.send = self._monitored_send
+        # Replaced in place so it keeps its position in the subscriber order
+        self._receive = self._server._subscribers[receiver_key]
+        self._server._subscribers[receiver_key] = self._monitored_receive
+        self.attached = True
+
+    def _find_receiver(self):
+        """Return the key of pychonet's datagram handler, None if not found."""
+        for key, receiver in self._server._subscribers.items():
+            if getattr(receiver, "__self__", None) is self.api:
+                return key
+        return None
+
+    def _monitored_send(self, data: bytes, addr: tuple[str, int]) -> None:
+        header = _parse_header(data)
+        if header is not None and header[1] in REQUEST_ESV_RANGE:
+            self._sent[addr[0]] = Frame(
+                host=addr[0],
+                tid=header[0],
+                esv=header[1],
+                payload=bytes(data),
+                addr=addr,
+                sent_at=time.monotonic(),
+            )
+        self._send(data, addr)
+
+    async def _monitored_receive(self, data: bytes, addr: tuple[str, int]) -> None:
+        header = _parse_header(data)
+        frame = self._sent.get(addr[0])
+        if (
+            header is not None
+            and frame is not None
+            and header[0] == frame.tid
+            and header[1] not in REQUEST_ESV_RANGE
+        ):
+            if frame.answered_at is not None and frame.retransmits:
+                # Answer to a retransmission of an already answered request.
+                # pychonet would treat it as a push notification.
+                frame.duplicates += 1
+                return
+            if frame.answered_at is None:
+                frame.answered_at = time.monotonic()
+                frame.response = bytes(data)
+        if header is not None and header[1] in (INF, INFC):
+            listener = self._push_listeners.get((addr[0], *data[4:7]))
+            if listener is not None:
+                listener(
+                    parse_epcs(data),
+                    solicited=(addr[0], header[0]) in self._exchanges,
+                )
+        if (
+            header is not None
+            and header[0] in self._collectors
+            and header[1] not in REQUEST_ESV_RANGE
+        ):
+            # Answer to one of our multicast requests, possibly from a node
+            # pychonet has never seen; it must not trigger discovery.
+            self._collectors[header[0]](addr[0], bytes(data))
+            self.api._last_activity[addr[0]] = time.monotonic()
+            return
+        if header is not None and (addr[0], header[0]) in self._exchanges:
+            waiter = self._exchanges[(addr[0], header[0])]
+            if (addr[0], header[0]) in self._forwarded:
+                # Let pychonet store the values before the waiter resumes
+                await self._receive(data, addr)
+            # Otherwise pychonet cannot decode these; keep them to ourselves
+            if not waiter.done():
+                waiter.set_result(bytes(data))
+            self.api._last_activity[addr[0]] = time.monotonic()
+            return
+        await self._receive(data, addr)
+
+    def set_push_listener(
+        self, host: str, eoj: tuple[int, int, int], listener: Callable
+    ) -> None:
+        """Call listener with the EPCs of every INF/INFC from host's eoj.
+
+        The listener runs before pychonet processes the frame. Its solicited
+        keyword is True for an INF answering one of our INF_REQ exchanges.
+        Setting a listener for the same instance again replaces the previous
+        one.
+        """
+        self._push_listeners[(host, *eoj)] = listener
+
+    def collect(self, tid: int, collector: Callable[[str, bytes], None]) -> None:
+        """Pass every answer carrying tid to collector(host, data).
+
+        Meant for multicast requests, whose answers come from many hosts.
+        Collected answers are not passed on to pychonet.
+        """
+        self._collectors[tid] = collector
+
+    def stop_collecting(self, tid: int) -> None:
+        """Let answers carrying tid through to pychonet again."""
+        self._collectors.pop(tid, None)
+
+    def send_raw(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Send a frame without tracking it as a request to a host."""
+        if self._send is None:
+            _LOGGER.debug("ECHONETLite: cannot send raw frames with this pychonet")
+            return
+        self._send(data, addr)
+
+    def last_request(self, host: str, since: float) -> Frame | None:
+        """Return the latest request frame sent to host at or after since."""
+        frame = self._sent.get(host)
+        if frame is None or frame.sent_at < since:
+            return None
+        return frame
+
+    def retransmit(self, frame: Frame) -> None:
+        """Send frame again with its original TID.
+
+        Reusing the TID means whichever copy is answered first completes
+        pychonet's pending request; later copies are dropped as duplicates.
+        """
+        frame.retransmits += 1
+        _LOGGER.debug(
+            "ECHONETLite: no answer from %s for TID %s after %.2fs, retransmitting (%d)",
+            frame.host,
+            frame.tid,
+            time.monotonic() - frame.sent_at,
+            frame.retransmits,
+        )
+        self._send(frame.payload, frame.addr)
+
+    def abandon(self, frame: Frame) -> None:
+        """Forget pychonet's bookkeeping for a request that was given up on."""
+        self.api._message_list.pop(frame.tid, None)
+
+    def next_tid(self) -> int:
+        """Take a TID from pychonet's counter so our frames never collide."""
+        if not self.attached:
+            self._tid = self._tid % MAX_TID + 1
+            return self._tid
+        tid = self.api._next_tx_tid + 1
+        if tid > MAX_TID:
+            tid = 1
+        self.api._next_tx_tid = tid
+        return tid
+
+    async def _async_wait(self, host: str, waiter, started: float, scheduler):
+        """Wait for waiter, retransmitting the request sent after started.
+
+        Raises:
+            TimeoutError: After MAX_RETRANSMITS retransmissions went unanswered.
+        """
+        wait = scheduler.rto
+        while True:
+            done, _ = await asyncio.wait({waiter}, timeout=wait)
+            if done:
+                return
+            frame = self.last_request(host, started)
+            if frame is None or frame.answered_at is not None:
+                # Still queued inside pychonet, or answered and waiting
+                # for pychonet's next polling tick - nothing to resend.
+                wait = 0.1
+                continue
+            if frame.retransmits >= MAX_RETRANSMITS:
+                raise TimeoutError(
+                    f"No answer from {host} after {frame.retransmits} retransmissions"
+                )
+            self.retransmit(frame)
+            wait = scheduler.rto * 2**frame.retransmits
+
+    def _sample_rtt(self, host: str, started: float, scheduler) -> None:
+        frame = self.last_request(host, started)
+        if (
+            frame is not None
+            and frame.answered_at is not None
+            and not frame.retransmits
+        ):
+            # Karn's rule: only sample requests answered on first transmission
+            scheduler.record_rtt(frame.answered_at - frame.sent_at)
+
+    async def async_request(self, host: str, coro, scheduler) -> Any:
+        """Run a pychonet request with adaptive retransmission.
+
+        Once the answer is overdue by the host's RTO the same frame is sent
+        again, with the wait doubling each time. After MAX_RETRANSMITS the
+        request is given up on rather than sitting out pychonet's fixed
+        message_timeout.
+
+        Args:
+            host: Host the request is sent to.
+            coro: The pychonet request coroutine.
+            scheduler: The host's HostScheduler, for RTO and RTT samples.
+
+        Returns:
+            The result of coro.
+
+        Raises:
+            TimeoutError: If the request was given up on.
+        """
+        if not self.attached:
+            return await coro
+        started = time.monotonic()
+        task = asyncio.ensure_future(coro)
+        try:
+            await self._async_wait(host, task, started, scheduler)
+        except TimeoutError:
+            task.cancel()
+            # Let pychonet unwind its per-host queue before the
+            # scheduler hands the slot to the next request.
+            await asyncio.wait({task})
+            if (frame := self.last_request(host, started)) is not None:
+                self.abandon(frame)
+            raise
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+
+        result = task.result()
+        self._sample_rtt(host, started, scheduler)
+        return result
+
+    async def async_exchange(
+        self, host: str, payload: bytes, scheduler, forward: bool = False
+    ) -> bytes:
+        """Send a request pychonet cannot build and return the raw answer.
+
+        The frame is retransmitted like async_request() does. Its answer is
+        not passed on to pychonet unless forward is set.
+
+        Args:
+            host: Host the request is sent to.
+            payload: The complete frame, with a TID from next_tid().
+            scheduler: The host's HostScheduler, for RTO and RTT samples.
+            forward: True to have pychonet process the answer too, before
+                this returns.
+
+        Raises:
+            TimeoutError: If the request was given up on.
+        """
+        if not self.attached:
+            # No answer could ever be seen without the receive hook
+            raise TimeoutError("frame monitor is not attached to pychonet")
+        header = _parse_header(payload)
+        key = (host, header[0])
+        waiter = self._exchanges[key] = asyncio.get_running_loop().create_future()
+        if forward:
+            self._forwarded.add(key)
+        started = time.monotonic()
+        try:
+            self._monitored_send(payload, (host, ECHONET_PORT))
+            await self._async_wait(host, waiter, started, scheduler)
+        finally:
+            del self._exchanges[key]
+            self._forwarded.discard(key)
+        self._sample_rtt(host, started, scheduler)
+        return waiter.result()
+
+
+def async_get_frame_monitor(hass: HomeAssistant) -> FrameMonitor:
+    """Return the frame monitor for the shared API client, attaching it once."""
+    api = hass.data[DOMAIN]["api"]
+    monitor = hass.data[DOMAIN].get("monitor")
+    if monitor is None or monitor.api is not api:
+        monitor = hass.data[DOMAIN]["monitor"] = FrameMonitor(api)
+    return monitor
@@ -1,3 +1,4 @@
+from functools import partial
 import logging
 from homeassistant.const import (
     CONF_ICON,
@@ -8,12 +9,11 @@ from homeassistant.const import (
 )
 from homeassistant.exceptions import InvalidStateError
 from homeassistant.components.number import NumberEntity
-from .base_entity import EchonetEntity
+from .base_entity import EchonetEntity, async_setup_instances
 from pychonet.lib.eojx import EOJX_CLASS
 from . import get_name_by_epc_code
 from .const import (
     CONF_DISABLED_DEFAULT,
-    DOMAIN,
     CONF_AS_ZERO,
     CONF_MAX_OPC,
     CONF_BYTE_LENGTH,
@@ -25,8 +25,17 @@ _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(hass, config, async_add_entities, discovery_info=None):
+    await async_setup_instances(
+        hass,
+        config,
+        partial(_async_add_instances, hass, config, async_add_entities),
+    )
+
+
+async def _async_add_instances(hass, config, async_add_entities, instances):
+    """Add the entities of instances."""
     entities = []
-    for entity in hass.data[DOMAIN][config.entry_id]:
+    for entity in instances:
         eojgc = entity["instance"]["eojgc"]
         eojcc = entity["instance"]["eojcc"]
         _enl_op_codes = entity["echonetlite"]._enl_op_codes
@@ -52,7 +61,14 @@ class EchonetNumber(EchonetEntity, NumberEntity):
 
     def __init__(self, coordinator, config, options, epc_code):
         """Initialize the number."""
-        super().__init__(coordinator, config)
+        max_opc = options.get(CONF_MAX_OPC)
+        if isinstance(max_opc, list):
+            max_opc = max_opc[0]
+        super().__init__(
+            coordinator,
+            config,
+            epcs=[epc_code] if max_opc is None else [epc_code, max_opc],
+        )
         self._config = config
         self._code = epc_code
 
@@ -124,11 +140,13 @@ class EchonetNumber(EchonetEntity, NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
-        if await self.coordinator._instance.setMessage(
-            self._code, int(value + self._as_zero), self._byte_length
-        ):
-            pass
-        else:
+        transaction = self.coordinator.write_transaction()
+        transaction.set(self._code, int(value + self._as_zero), self._byte_length)
+        result = await self.coordinator.async_commit_latest(
+            transaction, {self._code: int(value + self._as_zero)}
+        )
+        # None: replaced by a newer value before it was sent
+        if result is not None and not result.get(self._code):
             raise InvalidStateError(
                 "The state setting is not supported or is an invalid value."
             )
@@ -0,0 +1,107 @@
+"""Setup coordination across the hosts of all config entries."""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Hosts initialising at the same time, None for no limit. Home Assistant
+# already sets up config entries concurrently; a cap only helps networks
+# that cannot take every host's setup burst at once.
+SETUP_PARALLEL_HOSTS = None
+
+
+class SetupSlotTimeout(Exception):
+    """A host was not granted its setup slot in time."""
+
+
+class SetupOrchestrator:
+    """Run instance initialisation for different hosts side by side.
+
+    Every config entry initialises its instances inside a host slot. Slots
+    for different hosts are granted concurrently, up to max_parallel at a
+    time if set, so startup with many single-instance hosts takes about as
+    long as the slowest of them rather than the sum. Instances on the same
+    host never initialise concurrently: embedded ECHONET stacks drop frames
+    when more than one request is outstanding.
+
+    The time each host spent inside its slot is kept in timings.
+    """
+
+    def __init__(self, max_parallel: int | None = SETUP_PARALLEL_HOSTS):
+        """Initialize the orchestrator.
+
+        Args:
+            max_parallel: How many hosts may initialise at the same time,
+                None for no limit.
+        """
+        self.max_parallel = max_parallel
+        self._running = 0
+        self._changed = asyncio.Condition()
+        # host -> lock held while one of its entries initialises
+        self._locks: dict[str, asyncio.Lock] = {}
+        # host -> seconds its last initialisation took
+        self.timings: dict[str, float] = {}
+
+    def _has_room(self) -> bool:
+        """Return True if another host may start initialising."""
+        return self.max_parallel is None or self._running < self.max_parallel
+
+    @asynccontextmanager
+    async def host(self, host: str, wait: float):
+        """Hold the setup slot of host.
+
+        Args:
+            host: IP address of the host.
+            wait: Longest time to queue for the slot, in seconds.
+
+        Yields:
+            The monotonic time the slot was granted. Setup budgets count from
+            there, so time spent queueing behind other hosts is not lost.
+
+        Raises:
+            SetupSlotTimeout: The slot was not granted within wait.
+        """
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        try:
+            async with asyncio.timeout(wait):
+                # Queue on the host first so a second entry for the same host
+                # does not hold one of the parallel slots while it waits
+                await lock.acquire()
+                try:
+                    async with self._changed:
+                        await self._changed.wait_for(self._has_room)
+                        self._running += 1
+                except BaseException:
+                    lock.release()
+                    raise
+        except TimeoutError as ex:
+            raise SetupSlotTimeout(
+                f"{host} waited more than {wait:.0f}s to initialise"
+            ) from ex
+        granted = time.monotonic()
+        try:
+            yield granted
+        finally:
+            self.timings[host] = time.monotonic() - granted
+            async with self._changed:
+                self._running -= 1
+                self._changed.notify_all()
+            lock.release()
+            _LOGGER.debug(
+                "ECHONETLite: initialised %s in %.1fs", host, self.timings[host]
+            )
+
+
+def async_get_setup_orchestrator(hass: HomeAssistant) -> SetupOrchestrator:
+    """Return the shared orchestrator, creating it on first use."""
+    orchestrator = hass.data[DOMAIN].get("orchestrator")
+    if orchestrator is None:
+        orchestrator = hass.data[DOMAIN]["orchestrator"] = SetupOrchestrator()
+    return orchestrator
@@ -0,0 +1,469 @@
+"""Polling policy for ECHONET Lite instances.
+
+The classes in this module hold no I/O. They decide *what* the connector
+should ask a device for on each poll cycle, based on what has been observed
+so far, and leave the sending to ECHONETConnector and the host scheduler.
+"""
+
+import logging
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+# Refresh tiers, expressed as "poll every N cycles" of the coordinator's
+# update_interval. TIER_STATIC is never re-polled once a value is known.
+TIER_FAST = 1
+TIER_NORMAL = 2
+TIER_SLOW = 10
+TIER_STATIC = 0
+
+# Consecutive unchanged reads before an EPC is demoted to the next tier.
+DEMOTE_TO_NORMAL_AFTER = 4
+DEMOTE_TO_SLOW_AFTER = 12
+
+# Super class properties that identify the device rather than describe its
+# state. They cannot change while the device is running, so reading them once
+# is enough. 0x82 standard version, 0x83 identification number, 0x8A-0x8E
+# manufacturer/business facility/product code/serial/production date and the
+# 0x9D-0x9F property maps.
+STATIC_EPCS = frozenset({0x82, 0x83, 0x8A, 0x8B, 0x8C, 0x8D, 0x8E, 0x9D, 0x9E, 0x9F})
+
+
+class RefreshPlanner:
+    """Assign each polled EPC a refresh tier from its observed change rate.
+
+    Every EPC starts in TIER_FAST. Each read that returns the same value as
+    the previous one counts towards demotion to TIER_NORMAL and then
+    TIER_SLOW; any change promotes it straight back to TIER_FAST. Settable
+    EPCs never drop below TIER_NORMAL because they can be changed from the
+    device's own remote or panel, and identity EPCs in STATIC_EPCS are read
+    only until a value is known.
+    """
+
+    def __init__(self, settable: list[int] | None = None):
+        """Initialize the planner.
+
+        Args:
+            settable: EPCs in the instance's SETMAP.
+        """
+        self._settable = set(settable or [])
+        self._values: dict[int, Any] = {}
+        self._unchanged: dict[int, int] = {}
+        self._last_polled: dict[int, int] = {}
+        self._cycle = 0
+
+    @property
+    def cycle(self) -> int:
+        """Return the number of the current poll cycle."""
+        return self._cycle
+
+    def tier(self, epc: int) -> int:
+        """Return the refresh tier currently assigned to epc."""
+        if epc in STATIC_EPCS:
+            return TIER_STATIC
+        unchanged = self._unchanged.get(epc, 0)
+        if unchanged >= DEMOTE_TO_SLOW_AFTER and epc not in self._settable:
+            return TIER_SLOW
+        if unchanged >= DEMOTE_TO_NORMAL_AFTER:
+            return TIER_NORMAL
+        return TIER_FAST
+
+    def is_due(self, epc: int) -> bool:
+        """Return True if epc should be requested in the current cycle."""
+        if self._values.get(epc) is None:
+            # Never read successfully - keep asking every cycle.
+            return True
+        tier = self.tier(epc)
+        if tier == TIER_STATIC:
+            return False
+        last = self._last_polled.get(epc)
+        return last is None or self._cycle - last >= tier
+
+    def start_cycle(self, epcs: list[int]) -> list[int]:
+        """Advance to the next poll cycle and return the EPCs due in it.
+
+        Args:
+            epcs: Candidate EPCs in polling order.
+
+        Returns:
+            The subset of epcs that are due, in the same order.
+        """
+        self._cycle += 1
+        return [epc for epc in epcs if self.is_due(epc)]
+
+    def mark_polled(self, epcs: list[int]) -> None:
+        """Record that epcs were requested in the current cycle."""
+        for epc in epcs:
+            self._last_polled[epc] = self._cycle
+
+    def observe(self, epc: int, value: Any) -> None:
+        """Record a freshly read value for epc and update its change history."""
+        if value is None:
+            return
+        if epc in self._values and self._values[epc] == value:
+            self._unchanged[epc] = self._unchanged.get(epc, 0) + 1
+        else:
+            if self._unchanged.get(epc, 0) >= DEMOTE_TO_NORMAL_AFTER:
+                _LOGGER.debug("EPC %s changed, promoting to fast refresh", hex(epc))
+            self._unchanged[epc] = 0
+        self._values[epc] = value
+
+    def observe_all(self, data: dict[int, Any]) -> None:
+        """Record every value in data, see observe()."""
+        for epc, value in data.items():
+            self.observe(epc, value)
+
+
+# Clean full-size cycles required before the batch size is probed upwards.
+PROBE_AFTER_CLEAN_CYCLES = 3
+
+
+class BatchSizer:
+    """Additive-increase/multiplicative-decrease control of the batch size.
+
+    The size grows by one OPC after PROBE_AFTER_CLEAN_CYCLES consecutive
+    cycles in which a full-size batch was answered completely, and is halved
+    on a timed-out batch or an EchonetMaxOpcError. A MaxOpc error also caps
+    future probing at the number of OPCs the device actually answered, since
+    that is a hard firmware limit rather than transient loss.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        floor: int,
+        ceiling: int,
+        limit: int | None = None,
+    ):
+        """Initialize the controller.
+
+        Args:
+            initial: Starting batch size (learned or configured).
+            floor: Smallest size the controller will back off to.
+            ceiling: Largest size the controller will probe up to.
+            limit: Previously learned MaxOpc limit, if any.
+        """
+        self.floor = floor
+        self.ceiling = ceiling
+        self.limit = limit
+        self.size = self._clamp(initial)
+        self._clean = 0
+
+    def _clamp(self, size: int) -> int:
+        upper = self.ceiling if self.limit is None else min(self.ceiling, self.limit)
+        return max(self.floor, min(size, upper))
+
+    def record_cycle(self, largest_batch: int, timed_out: bool) -> bool:
+        """Feed back the outcome of a poll cycle.
+
+        Args:
+            largest_batch: Length of the largest batch sent in the cycle.
+            timed_out: True if any batch in the cycle went unanswered.
+
+        Returns:
+            True if the batch size changed.
+        """
+        previous = self.size
+        if timed_out:
+            self._clean = 0
+            if largest_batch > 1:
+                self.size = self._clamp(min(self.size, largest_batch) // 2)
+        elif largest_batch >= self.size:
+            self._clean += 1
+            if self._clean >= PROBE_AFTER_CLEAN_CYCLES:
+                self._clean = 0
+                self.size = self._clamp(self.size + 1)
+        return self.size != previous
+
+    def record_max_opc(self, answered: int) -> bool:
+        """Feed back an EchonetMaxOpcError.
+
+        Args:
+            answered: Number of OPCs the device included in its response.
+
+        Returns:
+            True if the batch size changed.
+        """
+        previous = self.size
+        self._clean = 0
+        if answered > 0:
+            self.limit = max(self.floor, answered)
+        self.size = self._clamp(self.size // 2)
+        return self.size != previous
+
+
+# ECHONET Lite frame layout: EHD1 EHD2 TID(2) SEOJ(3) DEOJ(3) ESV OPC, then
+# EPC PDC EDT for every property.
+FRAME_HEADER_BYTES = 12
+PROPERTY_HEADER_BYTES = 2
+# EDT length assumed for properties that have not been read yet.
+DEFAULT_EDT_BYTES = 4
+# Response size the packer aims for until a device shows it needs less.
+# Several embedded stacks are built around 256 byte UDP buffers.
+DEFAULT_FRAME_BUDGET = 256
+MIN_FRAME_BUDGET = 64
+
+
+class BatchPacker:
+    """Pack EPCs into request batches by expected response size.
+
+    The packer remembers the EDT length each EPC returned and fills a batch
+    until either the OPC count from BatchSizer or the device's response
+    frame budget would be exceeded. When a batch goes unanswered but its two
+    halves are answered separately the device evidently cannot build the
+    combined response: for a pair of EPCs the larger one is marked to be
+    polled alone from then on, for larger batches that came close to the
+    budget the budget shrinks to below that batch's size.
+    """
+
+    def __init__(
+        self,
+        edt_sizes: dict[int, int] | None = None,
+        budget: int | None = None,
+        singletons: list[int] | None = None,
+    ):
+        """Initialize the packer from previously learned values.
+
+        Args:
+            edt_sizes: Last seen EDT length per EPC.
+            budget: Learned response frame budget in bytes.
+            singletons: EPCs learned to only answer when requested alone.
+        """
+        self.edt_sizes = dict(edt_sizes or {})
+        self.budget = budget or DEFAULT_FRAME_BUDGET
+        self.singletons = set(singletons or [])
+
+    def property_bytes(self, epc: int) -> int:
+        """Return the expected response bytes contributed by epc."""
+        return PROPERTY_HEADER_BYTES + self.edt_sizes.get(epc, DEFAULT_EDT_BYTES)
+
+    def frame_bytes(self, epcs: list[int]) -> int:
+        """Return the expected size of a response frame carrying epcs."""
+        return FRAME_HEADER_BYTES + sum(self.property_bytes(epc) for epc in epcs)
+
+    def pack(self, epcs: list[int], max_count: int) -> list[list[int]]:
+        """Split epcs into batches that fit both max_count and the budget.
+
+        Args:
+            epcs: EPC codes to request, in order.
+            max_count: Maximum number of OPCs per batch.
+
+        Returns:
+            A list of non-empty batches. Learned singletons get their own.
+        """
+        batches = []
+        current: list[int] = []
+        current_bytes = FRAME_HEADER_BYTES
+        for epc in epcs:
+            if epc in self.singletons:
+                batches.append([epc])
+                continue
+            cost = self.property_bytes(epc)
+            if current and (
+                len(current) >= max_count or current_bytes + cost > self.budget
+            ):
+                batches.append(current)
+                current = []
+                current_bytes = FRAME_HEADER_BYTES
+            current.append(epc)
+            current_bytes += cost
+        if current:
+            batches.append(current)
+        return batches
+
+    def record_size(self, epc: int, size: int) -> bool:
+        """Remember the EDT length epc returned.
+
+        Returns:
+            True if the stored size changed.
+        """
+        if self.edt_sizes.get(epc) == size:
+            return False
+        self.edt_sizes[epc] = size
+        return True
+
+    def record_overflow(self, epcs: list[int]) -> bool:
+        """Learn from a batch that failed while both its halves succeeded.
+
+        Args:
+            epcs: The batch the device did not answer.
+
+        Returns:
+            True if the budget or the singleton set changed.
+        """
+        if len(epcs) == 2:
+            epc = max(epcs, key=self.property_bytes)
+            _LOGGER.debug(
+                "EPC %s only answers when requested alone, polling it singly",
+                hex(epc),
+            )
+            self.singletons.add(epc)
+            return True
+        frame_bytes = self.frame_bytes(epcs)
+        if frame_bytes <= self.budget // 2:
+            # Far below the budget - more likely too many OPCs than too many
+            # bytes, which is BatchSizer's business.
+            return False
+        budget = max(MIN_FRAME_BUDGET, frame_bytes - 1)
+        if budget >= self.budget:
+            return False
+        _LOGGER.debug(
+            "Response frame budget lowered from %d to %d bytes", self.budget, budget
+        )
+        self.budget = budget
+        return True
+
+
+# How long a write waits for the device to announce the new value before it
+# is read back instead, until the class's push latency has been measured.
+PUSH_DEADLINE_INITIAL = 1.0
+PUSH_DEADLINE_MIN = 0.3
+PUSH_DEADLINE_MAX = 3.0
+# Missed announcements after which an EPC is verified by reading it back,
+# whatever the notification property map says.
+PUSH_MISSES_BEFORE_POLLING = 3
+# Delay between a write and its verify read. Grows when the read still
+# returns the old value and shrinks slowly while reads come back settled.
+SETTLE_INITIAL = 0.8
+SETTLE_MIN = 0.2
+SETTLE_MAX = 2.4
+SETTLE_GROWTH = 1.5
+SETTLE_DECAY = 0.9
+
+
+class VerifyTimings:
+    """Learned write confirmation timings for one device class.
+
+    The state lives in a profile dict shared by every instance of the same
+    manufacturer and class, so what one air conditioner teaches applies to
+    its siblings and survives restarts. Push latency is smoothed the same way
+    HostScheduler smooths round-trip times.
+    """
+
+    def __init__(self, profile: dict[str, Any]):
+        """Initialize from a (possibly empty) class profile.
+
+        Args:
+            profile: The class profile dict, updated in place.
+        """
+        self._profile = profile
+        self._misses: dict[int, int] = {}
+
+    @property
+    def deadline(self) -> float:
+        """Return how long to wait for a push before reading back."""
+        srtt = self._profile.get("push_srtt")
+        if srtt is None:
+            return PUSH_DEADLINE_INITIAL
+        deadline = srtt + 4 * self._profile.get("push_rttvar", srtt / 2)
+        return max(PUSH_DEADLINE_MIN, min(PUSH_DEADLINE_MAX, deadline))
+
+    @property
+    def settle(self) -> float:
+        """Return the delay before a verify read."""
+        return self._profile.get("settle", SETTLE_INITIAL)
+
+    def push_covered(self, epc: int, ntfmap: list[int]) -> bool:
+        """Return True if a write to epc is confirmed by waiting for a push."""
+        return epc in ntfmap and epc not in self._profile.get("push_silent", [])
+
+    def record_push(self, epc: int, latency: float) -> None:
+        """Feed back an announcement arriving latency seconds after a write."""
+        self._misses.pop(epc, None)
+        srtt = self._profile.get("push_srtt")
+        if srtt is None:
+            self._profile["push_srtt"] = latency
+            self._profile["push_rttvar"] = latency / 2
+            return
+        rttvar = self._profile.get("push_rttvar", srtt / 2)
+        self._profile["push_rttvar"] = 0.75 * rttvar + 0.25 * abs(srtt - latency)
+        self._profile["push_srtt"] = 0.875 * srtt + 0.125 * latency
+
+    def record_push_miss(self, epc: int) -> bool:
+        """Feed back a write to epc that was not announced by the deadline.
+
+        Returns:
+            True if epc is no longer considered push covered.
+        """
+        self._misses[epc] = self._misses.get(epc, 0) + 1
+        if self._misses[epc] < PUSH_MISSES_BEFORE_POLLING:
+            return False
+        del self._misses[epc]
+        _LOGGER.debug("EPC %s is not announced after writes, reading it back", hex(epc))
+        self._profile["push_silent"] = sorted(
+            {*self._profile.get("push_silent", []), epc}
+        )
+        return True
+
+    def record_settled(self, settled: bool) -> None:
+        """Feed back whether a verify read returned the written value."""
+        if settled:
+            settle = max(SETTLE_MIN, self.settle * SETTLE_DECAY)
+        else:
+            settle = min(SETTLE_MAX, self.settle * SETTLE_GROWTH)
+        self._profile["settle"] = round(settle, 3)
+
+
+# Push reliability scores. An INF carrying an EPC adds one, a change that
+# polling found but no INF announced costs PUSH_MISS_PENALTY. EPCs scoring
+# above zero are left to push notifications.
+PUSH_SCORE_MAX = 5
+PUSH_MISS_PENALTY = 3
+
+
+class PushReliability:
+    """Judge which notification EPCs of an instance really arrive by INF.
+
+    A device declaring an EPC in its STATMAP does not mean its INF frames
+    reach Home Assistant - multicast is routinely lost on mesh Wi-Fi and
+    across VLANs. Every EPC starts out polled. Once an INF for it is seen it
+    is left to push notifications, and if polling later finds a change no
+    INF announced, its score drops and it is polled again until INF frames
+    prove themselves once more.
+    """
+
+    def __init__(self, ntfmap: list[int], scores: dict[int, int] | None = None):
+        """Initialize the judgement.
+
+        Args:
+            ntfmap: EPCs the instance declares it notifies.
+            scores: Previously learned scores.
+        """
+        self._ntfmap = set(ntfmap)
+        self.scores = {
+            epc: score for epc, score in (scores or {}).items() if epc in self._ntfmap
+        }
+
+    def served_by_push(self, epc: int) -> bool:
+        """Return True if epc can be left to push notifications."""
+        return self.scores.get(epc, 0) > 0
+
+    def _update(self, epc: int, delta: int) -> bool:
+        if epc not in self._ntfmap:
+            return False
+        served = self.served_by_push(epc)
+        score = self.scores.get(epc, 0) + delta
+        self.scores[epc] = max(-PUSH_SCORE_MAX, min(PUSH_SCORE_MAX, score))
+        if self.served_by_push(epc) == served:
+            return False
+        if served:
+            _LOGGER.debug("EPC %s misses push notifications, polling it", hex(epc))
+        else:
+            _LOGGER.debug("EPC %s arrives by push, no longer polling it", hex(epc))
+        return True
+
+    def record_push(self, epc: int) -> bool:
+        """Feed back an INF carrying epc.
+
+        Returns:
+            True if epc is now served by push rather than polled.
+        """
+        return self._update(epc, 1)
+
+    def record_unannounced(self, epc: int) -> bool:
+        """Feed back a change of epc found by polling that no INF announced.
+
+        Returns:
+            True if epc is now polled rather than served by push.
+        """
+        return self._update(epc, -PUSH_MISS_PENALTY)
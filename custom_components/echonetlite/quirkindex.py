@@ -0,0 +1,122 @@
+"""Index of the quirk files shipped under quirks/."""
+
+import logging
+import os
+from dataclasses import dataclass, field
+from importlib import import_module
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+QUIRKS_DIR = os.path.join(os.path.dirname(__file__), "quirks")
+# Directory holding the quirks of every product of a manufacturer
+ALL_PRODUCTS = "all"
+
+
+@dataclass
+class Quirk:
+    """Quirk definitions of one (manufacturer, product code, EOJ) combination.
+
+    The file for all products of the manufacturer is applied first and the
+    product code's own file on top of it. Every instance of the combination
+    shares the same object.
+    """
+
+    epc_functions: dict[int, Any] = field(default_factory=dict)
+    op_codes: dict[int, dict] = field(default_factory=dict)
+    singleton_poll: list[int] = field(default_factory=list)
+    frame_gap: float | None = None
+
+    def apply(self, extention: Any) -> None:
+        """Merge the QUIRKS and FRAME_GAP of a quirk module."""
+        if frame_gap := getattr(extention, "FRAME_GAP", None):
+            self.frame_gap = max(frame_gap, self.frame_gap or 0)
+        for epc, quirk in extention.QUIRKS.items():
+            if func := quirk.get("EPC_FUNCTION"):
+                self.epc_functions[epc] = func
+                if op_code := quirk.get("ENL_OP_CODE"):
+                    self.op_codes[epc] = op_code
+            if quirk.get("SINGLETON_POLL") and epc not in self.singleton_poll:
+                self.singleton_poll.append(epc)
+
+
+# (manufacturer, product code or ALL_PRODUCTS, "GGCC") -> module name
+_index: dict[tuple[str, str, str], str] | None = None
+# (manufacturer, product code, group code, class code) -> Quirk, None if none
+_quirks: dict[tuple, Quirk | None] = {}
+
+
+def _build_index() -> dict[tuple[str, str, str], str]:
+    """Walk QUIRKS_DIR once and map every quirk file to its module."""
+    index = {}
+    for manufacturer in os.listdir(QUIRKS_DIR):
+        manufacturer_dir = os.path.join(QUIRKS_DIR, manufacturer)
+        if not os.path.isdir(manufacturer_dir):
+            continue
+        for product in os.listdir(manufacturer_dir):
+            product_dir = os.path.join(manufacturer_dir, product)
+            if not os.path.isdir(product_dir):
+                continue
+            for name in os.listdir(product_dir):
+                eoj, ext = os.path.splitext(name)
+                if ext == ".py":
+                    index[(manufacturer, product, eoj.upper())] = (
+                        f".quirks.{manufacturer}.{product}.{eoj}"
+                    )
+    _LOGGER.debug("Echonet quirk index: %s", index)
+    return index
+
+
+def _load_quirk(key: tuple) -> Quirk | None:
+    """Import the quirk modules for key and merge them.
+
+    Runs in the executor: the first call reads the quirks directory and
+    every call may import modules.
+    """
+    global _index
+    if _index is None:
+        _index = _build_index()
+    manufacturer, product_code, eojgc, eojcc = key
+    eoj = "{:0>2X}".format(eojgc) + "{:0>2X}".format(eojcc)
+    products = [ALL_PRODUCTS, product_code] if product_code else [ALL_PRODUCTS]
+    modules = [
+        _index[(manufacturer, product, eoj)]
+        for product in products
+        if (manufacturer, product, eoj) in _index
+    ]
+    if not modules:
+        return None
+    quirk = Quirk()
+    for mod in modules:
+        _LOGGER.debug(f"Echonet import module is: {mod} of {__package__}")
+        quirk.apply(import_module(mod, package=__package__))
+    return quirk
+
+
+async def async_get_quirk(
+    hass: HomeAssistant,
+    manufacturer: str | None,
+    product_code: str | None,
+    eojgc: int,
+    eojcc: int,
+) -> Quirk | None:
+    """Return the quirks of a device, loading them only the first time.
+
+    Args:
+        hass: The Home Assistant instance.
+        manufacturer: Manufacturer name of the node.
+        product_code: Product code of the node, if known.
+        eojgc: Group code of the instance.
+        eojcc: Class code of the instance.
+
+    Returns:
+        The merged quirks, or None if the device has none.
+    """
+    if not manufacturer:
+        return None
+    key = (manufacturer, product_code, eojgc, eojcc)
+    if key not in _quirks:
+        _quirks[key] = await hass.async_add_executor_job(_load_quirk, key)
+    return _quirks[key]
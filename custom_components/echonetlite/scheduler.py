@@ -0,0 +1,222 @@
+"""Per-host request scheduling for ECHONET Lite traffic."""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Request priorities - lower values are granted first. User writes and the
+# targeted reads that confirm them jump ahead of background poll batches, so a
+# command never waits behind the poll cycles of every instance on the host.
+PRIORITY_WRITE = 0
+PRIORITY_VERIFY = 1
+PRIORITY_POLL = 2
+PRIORITIES = (PRIORITY_WRITE, PRIORITY_VERIFY, PRIORITY_POLL)
+
+# Round-trip time estimation follows RFC 6298: smoothed RTT and RTT variance
+# with gains of 1/8 and 1/4, and a retransmit timeout of SRTT + 4 * RTTVAR.
+RTT_ALPHA = 0.125
+RTT_BETA = 0.25
+RTO_INITIAL = 1.0
+RTO_MIN = 0.2
+RTO_MAX = 15.0
+
+# Idle gap between the end of one request and the start of the next. A device
+# that answers quickly can take the next frame almost immediately; a slow one
+# gets a gap in proportion to how long it takes to answer.
+FRAME_GAP_DEFAULT_FLOOR = 0.02
+FRAME_GAP_MAX = 0.5
+# Longest pause after a request went unanswered.
+TIMEOUT_BACKOFF_MAX = 1.0
+
+
+class HostScheduler:
+    """Own all request traffic to one ECHONET Lite node (IP address).
+
+    Embedded ECHONET devices have limited UDP stacks and drop frames when more
+    than one request is outstanding, which pychonet reports as a "queue busy"
+    None result. The scheduler grants a single request slot at a time. Waiting
+    requests are served by priority first and then round-robin across the
+    instances sharing the host (SmartCosmo panels, WTY2001 adapters, ...) so
+    one instance's poll cycle cannot starve its siblings.
+    """
+
+    def __init__(self, host: str):
+        """Initialize the scheduler.
+
+        Args:
+            host: IP address of the node whose traffic this scheduler owns.
+        """
+        self.host = host
+        self._busy = False
+        # RTT estimator state, None until the first sample arrives
+        self.srtt: float | None = None
+        self.rttvar: float | None = None
+        # Smallest inter-frame gap allowed, raised by device profiles (quirks)
+        self.gap_floor = FRAME_GAP_DEFAULT_FLOOR
+        self._ready_at = 0.0
+        self._timed_out = False
+        # priority -> owner -> FIFO of waiting futures. OrderedDict keeps the
+        # round-robin order of owners within each priority level.
+        self._waiters: dict[int, OrderedDict[str, deque[asyncio.Future]]] = {
+            priority: OrderedDict() for priority in PRIORITIES
+        }
+
+    @property
+    def pending(self) -> int:
+        """Return the number of requests waiting for a slot."""
+        return sum(
+            len(waiters)
+            for queue in self._waiters.values()
+            for waiters in queue.values()
+        )
+
+    @property
+    def rto(self) -> float:
+        """Return the current retransmit timeout in seconds."""
+        if self.srtt is None:
+            return RTO_INITIAL
+        return min(RTO_MAX, max(RTO_MIN, self.srtt + 4 * self.rttvar))
+
+    @property
+    def gap(self) -> float:
+        """Return the idle gap to leave after an answered request."""
+        if self.srtt is None:
+            return max(self.gap_floor, 0.1)
+        return max(self.gap_floor, min(FRAME_GAP_MAX, self.srtt))
+
+    def record_rtt(self, sample: float) -> None:
+        """Feed a measured round-trip time into the estimator.
+
+        Only requests that were answered on their first transmission may be
+        sampled (Karn's rule), otherwise the response cannot be matched to a
+        send time.
+        """
+        if sample < 0:
+            return
+        if self.srtt is None:
+            self.srtt = sample
+            self.rttvar = sample / 2
+        else:
+            self.rttvar = (1 - RTT_BETA) * self.rttvar + RTT_BETA * abs(
+                self.srtt - sample
+            )
+            self.srtt = (1 - RTT_ALPHA) * self.srtt + RTT_ALPHA * sample
+
+    def record_timeout(self) -> None:
+        """Note that the current request went unanswered."""
+        self._timed_out = True
+
+    def set_gap_floor(self, floor: float) -> None:
+        """Raise the minimum inter-frame gap for this host."""
+        if floor > self.gap_floor:
+            _LOGGER.debug(
+                "ECHONETLite: inter-frame gap floor for %s set to %.3fs",
+                self.host,
+                floor,
+            )
+            self.gap_floor = floor
+
+    @asynccontextmanager
+    async def slot(self, priority: int, owner: str):
+        """Hold the host's request slot for the duration of the block.
+
+        The slot is only handed out once the inter-frame gap since the
+        previous request has passed, so callers never need to sleep between
+        requests themselves.
+
+        Args:
+            priority: One of the PRIORITY_* constants.
+            owner: Key identifying the requesting instance, used for
+                round-robin fairness between instances on the same host.
+        """
+        await self._acquire(priority, owner)
+        try:
+            delay = self._ready_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._timed_out = False
+            yield
+        finally:
+            if self._timed_out:
+                # Give a device that just dropped a frame time to recover.
+                pause = min(TIMEOUT_BACKOFF_MAX, max(self.gap, self.rto))
+            else:
+                pause = self.gap
+            self._ready_at = time.monotonic() + pause
+            self._release()
+
+    async def _acquire(self, priority: int, owner: str) -> None:
+        """Wait until the request slot is granted to the caller."""
+        if not self._busy:
+            self._busy = True
+            return
+
+        fut = asyncio.get_running_loop().create_future()
+        self._waiters[priority].setdefault(owner, deque()).append(fut)
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # The slot was handed over just as we were cancelled - pass
+                # it on so the host does not stay locked.
+                self._release()
+            else:
+                self._discard(priority, owner, fut)
+            raise
+
+    def _discard(self, priority: int, owner: str, fut: asyncio.Future) -> None:
+        """Remove an abandoned waiter from its queue."""
+        queue = self._waiters[priority]
+        waiters = queue.get(owner)
+        if waiters is None:
+            return
+        try:
+            waiters.remove(fut)
+        except ValueError:
+            pass
+        if not waiters:
+            del queue[owner]
+
+    def _release(self) -> None:
+        """Hand the slot to the next waiter, or mark the host idle."""
+        for queue in self._waiters.values():
+            while queue:
+                owner, waiters = next(iter(queue.items()))
+                fut = waiters.popleft()
+                if waiters:
+                    # Round-robin: this owner goes to the back of the line.
+                    queue.move_to_end(owner)
+                else:
+                    del queue[owner]
+                if not fut.done():
+                    fut.set_result(None)
+                    return
+        self._busy = False
+
+
+def async_get_host_scheduler(hass: HomeAssistant, host: str) -> HostScheduler:
+    """Return the shared scheduler for host, creating it on first use."""
+    schedulers = hass.data[DOMAIN].setdefault("schedulers", {})
+    if host not in schedulers:
+        _LOGGER.debug("ECHONETLite: creating request scheduler for %s", host)
+        schedulers[host] = HostScheduler(host)
+    return schedulers[host]
+
+
+def async_release_host_scheduler(hass: HomeAssistant, host: str) -> None:
+    """Drop the scheduler for host once the host has been unregistered.
+
+    Requests already waiting on the old scheduler still complete; the next
+    setup of the host starts from a fresh scheduler.
+    """
+    schedulers = hass.data.get(DOMAIN, {}).get("schedulers", {})
+    if schedulers.pop(host, None) is not None:
+        _LOGGER.debug("ECHONETLite: released request scheduler for %s", host)
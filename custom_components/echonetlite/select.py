@@ -1,7 +1,8 @@
+from functools import partial
 import logging
 from homeassistant.const import CONF_ICON, CONF_NAME
 from homeassistant.components.select import SelectEntity
-from .base_entity import EchonetEntity
+from .base_entity import EchonetEntity, async_setup_instances
 from pychonet.HomeAirConditioner import (
     ENL_AIR_HORZ,
     ENL_AIR_VERT,
@@ -13,7 +14,6 @@ from pychonet.HomeAirConditioner import (
 from . import get_name_by_epc_code, get_device_name
 from .const import (
     CONF_DISABLED_DEFAULT,
-    DOMAIN,
     CONF_ICONS,
     TYPE_SELECT,
     NON_SETUP_SINGLE_ENTITY,
@@ -24,8 +24,17 @@ _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(hass, config, async_add_entities, discovery_info=None):
+    await async_setup_instances(
+        hass,
+        config,
+        partial(_async_add_instances, hass, config, async_add_entities),
+    )
+
+
+async def _async_add_instances(hass, config, async_add_entities, instances):
+    """Add the entities of instances."""
     entities = []
-    for entity in hass.data[DOMAIN][config.entry_id]:
+    for entity in instances:
         eojgc = entity["instance"]["eojgc"]
         eojcc = entity["instance"]["eojcc"]
         _enl_op_codes = entity["echonetlite"]._enl_op_codes
@@ -83,7 +92,7 @@ class EchonetSelect(EchonetEntity, SelectEntity):
 
     def __init__(self, coordinator, config, options, epc_code):
         """Initialize the select."""
-        super().__init__(coordinator, config)
+        super().__init__(coordinator, config, epcs=[epc_code])
         self._config = config
         self._code = epc_code
         self._optimistic = False
@@ -153,8 +162,8 @@ class EchonetSelect(EchonetEntity, SelectEntity):
     async def async_select_option(self, option: str):
         self._attr_current_option = option
         # self.async_schedule_update_ha_state()
-        if not await self.coordinator._instance.setMessage(
-            self._code, self._options[option]
+        if not await self.coordinator.async_send(
+            self.coordinator._instance.setMessage(self._code, self._options[option])
         ):
             # Restore previous state
             self._attr_current_option = self.coordinator.data.get(self._code)
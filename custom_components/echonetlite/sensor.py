@@ -1,5 +1,6 @@
 """Support for ECHONETLite sensors."""
 
+from functools import partial
 import logging
 import voluptuous as vol
 from abc import ABC, abstractmethod
@@ -17,7 +18,7 @@ from homeassistant.helpers import config_validation as cv, entity_platform
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
-from .base_entity import EchonetEntity
+from .base_entity import EchonetEntity, async_setup_instances
 from homeassistant.exceptions import InvalidStateError, NoEntitySpecifiedError
 
 from pychonet.lib.epc_functions import EPC_SUPER_FUNCTIONS
@@ -32,7 +33,6 @@ from .connectors import (
     regist_as_binary_sensor,
 )
 from .const import (
-    DOMAIN,
     ENABLE_SUPER_ENERGY_DEFAULT,
     ENL_OP_CODES,
     CONF_STATE_CLASS,
@@ -58,6 +58,7 @@ from .const import (
     CONF_ICON_NEGATIVE,
     CONF_ICON_ZERO,
 )
+from .scheduler import PRIORITY_VERIFY
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -192,9 +193,18 @@ class IconProcessor(ValueProcessor):
 
 
 async def async_setup_entry(hass, config, async_add_entities, discovery_info=None):
-    entities = []
     platform = entity_platform.async_get_current_platform()
-    for entity in hass.data[DOMAIN][config.entry_id]:
+    await async_setup_instances(
+        hass,
+        config,
+        partial(_async_add_instances, hass, config, async_add_entities, platform),
+    )
+
+
+async def _async_add_instances(hass, config, async_add_entities, platform, instances):
+    """Add the entities of instances."""
+    entities = []
+    for entity in instances:
         _LOGGER.debug(f"Configuring ECHONETLite sensor {entity}")
         _LOGGER.debug(
             f"Update flags for this sensor are {entity['echonetlite']._update_flags_full_list}"
@@ -310,8 +320,9 @@ async def async_setup_entry(hass, config, async_add_entities, discovery_info=Non
                     array_size_op_code = _enl_op_codes[op_code][
                         TYPE_DATA_ARRAY_WITH_SIZE_OPCODE
                     ]
-                    array_max_size = await entity["echonetlite"]._instance.update(
-                        array_size_op_code
+                    array_max_size = await entity["echonetlite"].async_send(
+                        entity["echonetlite"]._instance.update(array_size_op_code),
+                        PRIORITY_VERIFY,
                     )
                     for x in range(0, array_max_size):
                         attr = _enl_op_codes[op_code].copy()
@@ -332,8 +343,9 @@ async def async_setup_entry(hass, config, async_add_entities, discovery_info=Non
                     array_size_op_code = _enl_op_codes[op_code][
                         TYPE_DATA_ARRAY_WITH_SIZE_OPCODE
                     ]
-                    array_max_size = await entity["echonetlite"]._instance.update(
-                        array_size_op_code
+                    array_max_size = await entity["echonetlite"].async_send(
+                        entity["echonetlite"]._instance.update(array_size_op_code),
+                        PRIORITY_VERIFY,
                     )
                     type_data = _enl_op_codes.get(op_code, {}).get(TYPE_DATA_DICT)
                     dict_overrides = _enl_op_codes.get(op_code, {}).get(
@@ -409,7 +421,19 @@ class EchonetSensor(EchonetEntity, SensorEntity):
             attributes: Sensor configuration attributes.
             hass: Home Assistant instance (optional).
         """
-        super().__init__(coordinator, config)
+        super().__init__(
+            coordinator,
+            config,
+            epcs=[
+                epc_code,
+                # The value is scaled by these EPCs' values, see MultiplierProcessor
+                *(
+                    attributes[key]
+                    for key in (CONF_MULTIPLIER_OPCODE, CONF_MULTIPLIER_OPTIONAL_OPCODE)
+                    if key in attributes
+                ),
+            ],
+        )
 
         name = get_device_name(coordinator, config)
         self._op_code = epc_code
@@ -494,7 +518,9 @@ class EchonetSensor(EchonetEntity, SensorEntity):
     async def async_set_on_timer_time(self, timer_time):
         val = str(timer_time).split(":")
         mes = {"EPC": 0x91, "PDC": 0x02, "EDT": int(val[0]) * 256 + int(val[1])}
-        if await self.coordinator._instance.setMessages([mes]):
+        if await self.coordinator.async_send(
+            self.coordinator._instance.setMessages([mes])
+        ):
             pass
         else:
             raise InvalidStateError(
@@ -504,7 +530,9 @@ class EchonetSensor(EchonetEntity, SensorEntity):
     async def async_set_value_int_1b(self, value, epc=None):
         if epc:
             value = int(value)
-            if await self.coordinator._instance.setMessage(epc, value):
+            if await self.coordinator.async_send(
+                self.coordinator._instance.setMessage(epc, value)
+            ):
                 pass
             else:
                 raise InvalidStateError(
@@ -0,0 +1,166 @@
+"""Persistent per-instance device profiles learned at runtime."""
+
+import asyncio
+import logging
+import time
+from typing import Any, Callable
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.profiles"
+# Learned values change slowly, so coalesce writes to disk.
+SAVE_DELAY = 30
+
+SNAPSHOT_STORAGE_KEY = f"{DOMAIN}.snapshots"
+# Property values change all the time; write them out at most once a minute.
+SNAPSHOT_SAVE_DELAY = 60
+# A snapshot older than this says little about the device any more.
+SNAPSHOT_MAX_AGE = 24 * 3600
+
+
+class ProfileStore:
+    """Store what the integration has learned about each device instance.
+
+    Profiles are plain dicts keyed by the instance's uidi so they survive
+    restarts and IP address changes. Connectors hold a reference to their
+    profile dict, update it in place and call async_schedule_save().
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        """Initialize the store.
+
+        Args:
+            hass: The Home Assistant instance.
+        """
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._profiles: dict[str, dict[str, Any]] = {}
+        self._load_task: asyncio.Task | None = None
+        self._hass = hass
+
+    async def async_load(self) -> None:
+        """Load stored profiles once; concurrent callers share the same load."""
+        if self._load_task is None:
+            self._load_task = self._hass.async_create_task(self._async_load())
+        await self._load_task
+
+    async def _async_load(self) -> None:
+        data = await self._store.async_load()
+        if data:
+            self._profiles = data.get("profiles", {})
+        _LOGGER.debug("ECHONETLite: loaded %d device profile(s)", len(self._profiles))
+
+    def get(self, key: str) -> dict[str, Any]:
+        """Return the mutable profile for key, creating an empty one if needed."""
+        return self._profiles.setdefault(key, {})
+
+    def async_schedule_save(self) -> None:
+        """Schedule a delayed write of all profiles."""
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {"profiles": self._profiles}
+
+
+class SnapshotStore:
+    """Store the last known raw property values of each device instance.
+
+    Connectors register a callable returning when they last received data
+    and their current raw EDTs. It is only called when the store is written,
+    so frequent value changes cost a single delayed write instead of a copy
+    per change. A snapshot is stamped with when its values were received,
+    not when it was written, so an offline device's values age out. At startup the
+    snapshot seeds the connector so entities come up with the last known
+    values before the device has been read.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        """Initialize the store.
+
+        Args:
+            hass: The Home Assistant instance.
+        """
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, SNAPSHOT_STORAGE_KEY
+        )
+        self._snapshots: dict[str, dict[str, Any]] = {}
+        self._sources: dict[
+            str, Callable[[], tuple[float | None, dict[int, bytes]]]
+        ] = {}
+        self._load_task: asyncio.Task | None = None
+        self._hass = hass
+
+    async def async_load(self) -> None:
+        """Load stored snapshots once; concurrent callers share the same load."""
+        if self._load_task is None:
+            self._load_task = self._hass.async_create_task(self._async_load())
+        await self._load_task
+
+    async def _async_load(self) -> None:
+        data = await self._store.async_load()
+        if data:
+            self._snapshots = data.get("snapshots", {})
+        _LOGGER.debug("ECHONETLite: loaded %d value snapshot(s)", len(self._snapshots))
+
+    def restore(self, key: str) -> dict[int, bytes]:
+        """Return the raw EDTs saved for key, or nothing if too old."""
+        snapshot = self._snapshots.get(key)
+        if snapshot is None or time.time() - snapshot["saved"] > SNAPSHOT_MAX_AGE:
+            return {}
+        return {int(epc): bytes.fromhex(edt) for epc, edt in snapshot["values"].items()}
+
+    def register(
+        self, key: str, source: Callable[[], tuple[float | None, dict[int, bytes]]]
+    ) -> None:
+        """Save what source returns for key whenever the store is written.
+
+        source returns the wall-clock time its values were last received,
+        None if never, and the raw EDTs.
+        """
+        self._sources[key] = source
+
+    def unregister(self, key: str) -> None:
+        """Stop saving key; its last snapshot is kept for the next start."""
+        self._sources.pop(key, None)
+
+    def async_schedule_save(self) -> None:
+        """Schedule a delayed write of all snapshots."""
+        self._store.async_delay_save(self._data_to_save, SNAPSHOT_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        for key, source in self._sources.items():
+            received, values = source()
+            if received is None or not values:
+                continue
+            saved = self._snapshots.get(key, {}).get("saved")
+            if saved is not None and saved >= received:
+                # Nothing arrived since the snapshot was taken
+                continue
+            self._snapshots[key] = {
+                "saved": received,
+                "values": {str(epc): edt.hex() for epc, edt in values.items()},
+            }
+        return {"snapshots": self._snapshots}
+
+
+async def async_get_profile_store(hass: HomeAssistant) -> ProfileStore:
+    """Return the shared, loaded profile store."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (store := domain_data.get("profiles")) is None:
+        store = domain_data["profiles"] = ProfileStore(hass)
+    await store.async_load()
+    return store
+
+
+async def async_get_snapshot_store(hass: HomeAssistant) -> SnapshotStore:
+    """Return the shared, loaded snapshot store."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (store := domain_data.get("snapshots")) is None:
+        store = domain_data["snapshots"] = SnapshotStore(hass)
+    await store.async_load()
+    return store
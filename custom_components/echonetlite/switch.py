@@ -1,14 +1,14 @@
 """Support for ECHONETLite switches."""
 
+from functools import partial
 import asyncio
 import logging
 from homeassistant.const import CONF_ICON, CONF_SERVICE_DATA, CONF_NAME
 from homeassistant.components.switch import SwitchEntity
-from .base_entity import EchonetEntity
+from .base_entity import EchonetEntity, async_setup_instances
 from . import get_name_by_epc_code
 from .const import (
     CONF_DISABLED_DEFAULT,
-    DOMAIN,
     CONF_ON_VALUE,
     CONF_OFF_VALUE,
     NON_SETUP_SINGLE_ENTITY,
@@ -25,8 +25,17 @@ _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass, config, async_add_entities, discovery_info=None):
     """Set up the ECHONETLite switch platform."""
+    await async_setup_instances(
+        hass,
+        config,
+        partial(_async_add_instances, hass, config, async_add_entities),
+    )
+
+
+async def _async_add_instances(hass, config, async_add_entities, instances):
+    """Add the entities of instances."""
     entities = []
-    for entity in hass.data[DOMAIN][config.entry_id]:
+    for entity in instances:
         eojgc = entity["instance"]["eojgc"]
         eojcc = entity["instance"]["eojcc"]
         set_enl_status = False
@@ -114,7 +123,7 @@ class EchonetSwitch(EchonetEntity, SwitchEntity):
             options: Configuration options for this switch entity.
         """
         # Initialize coordinator first - must call parent before setting other properties
-        super().__init__(coordinator, config)
+        super().__init__(coordinator, config, epcs=[epc_code])
 
         self._code = epc_code
         self._options = options
@@ -192,23 +201,33 @@ class EchonetSwitch(EchonetEntity, SwitchEntity):
         if CONF_ENSURE_ON in self._options:
             main_sw_code = self._options[CONF_ENSURE_ON]
 
-        # Turn on the specified switch
-        if main_sw_code is not None and coordinator.data.get(main_sw_code) != "on":
-            if not await coordinator._instance.setMessage(
-                main_sw_code, SWITCH_POWER["on"]
-            ):
-                # Can't turn on main switch
-                return
-            # Wait about 2 seconds until the On state is stabilized on the device side
-            await asyncio.sleep(2)
-
+        on_value = self._options[CONF_SERVICE_DATA]["on"]
         if main_sw_code is None or coordinator.data.get(main_sw_code) == "on":
-            await coordinator._instance.setMessage(
-                self._code, self._options[CONF_SERVICE_DATA]["on"]
+            await coordinator.async_send(
+                coordinator._instance.setMessage(self._code, on_value)
+            )
+            return
+
+        # Turn on the main switch and the specified switch in one frame
+        transaction = coordinator.write_transaction()
+        transaction.set(main_sw_code, SWITCH_POWER["on"])
+        transaction.set(self._code, on_value)
+        accepted = await coordinator.async_commit(transaction)
+        if not accepted.get(main_sw_code):
+            # Can't turn on main switch
+            return
+        if not accepted.get(self._code):
+            # The device only accepts it once the On state is stabilized,
+            # which takes about 2 seconds
+            await asyncio.sleep(2)
+            await coordinator.async_send(
+                coordinator._instance.setMessage(self._code, on_value)
             )
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn switch off."""
-        await self.coordinator._instance.setMessage(
-            self._code, self._options[CONF_SERVICE_DATA]["off"]
+        await self.coordinator.async_send(
+            self.coordinator._instance.setMessage(
+                self._code, self._options[CONF_SERVICE_DATA]["off"]
+            )
         )
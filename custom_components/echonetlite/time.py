@@ -1,14 +1,14 @@
+from functools import partial
 import logging
 import datetime
 from datetime import time
 from homeassistant.const import CONF_ICON, CONF_NAME
 from homeassistant.components.time import TimeEntity
 from homeassistant.exceptions import InvalidStateError
-from .base_entity import EchonetEntity
+from .base_entity import EchonetEntity, async_setup_instances
 from . import get_name_by_epc_code
 from .const import (
     CONF_DISABLED_DEFAULT,
-    DOMAIN,
     CONF_FORCE_POLLING,
     ENL_SUPER_CODES,
     NON_SETUP_SINGLE_ENTITY,
@@ -20,8 +20,17 @@ _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(hass, config, async_add_entities, discovery_info=None):
+    await async_setup_instances(
+        hass,
+        config,
+        partial(_async_add_instances, hass, config, async_add_entities),
+    )
+
+
+async def _async_add_instances(hass, config, async_add_entities, instances):
+    """Add the entities of instances."""
     entities = []
-    for entity in hass.data[DOMAIN][config.entry_id]:
+    for entity in instances:
         eojgc = entity["instance"]["eojgc"]
         eojcc = entity["instance"]["eojcc"]
         _enl_op_codes = entity["echonetlite"]._enl_op_codes | ENL_SUPER_CODES
@@ -61,7 +70,7 @@ class EchonetTime(EchonetEntity, TimeEntity):
             code: EPC operation code for this time entity.
             options: Entity configuration options including icon and name.
         """
-        super().__init__(coordinator, config)
+        super().__init__(coordinator, config, epcs=[epc_code])
 
         self._config = config
         self._code = epc_code
@@ -102,7 +111,9 @@ class EchonetTime(EchonetEntity, TimeEntity):
         m = int(value.minute)
         mes = {"EPC": self._code, "PDC": 0x02, "EDT": h * 256 + m}
 
-        if await self.coordinator._instance.setMessages([mes]):
+        if await self.coordinator.async_send(
+            self.coordinator._instance.setMessages([mes])
+        ):
             pass
         else:
             raise InvalidStateError(
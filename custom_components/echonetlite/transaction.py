@@ -0,0 +1,98 @@
+"""Multi-property write transactions for ECHONET Lite instances."""
+
+import copy
+import logging
+from typing import Any
+
+from pychonet.lib.const import SETC
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _RecordingAPI:
+    """Stand-in for ECHONETAPIClient that records SetC properties.
+
+    Everything except echonetMessage is delegated to the real client, so
+    pychonet setters that look at cached state behave as usual.
+    """
+
+    def __init__(self, api, opc: list[dict[str, Any]]):
+        self._api = api
+        self._opc = opc
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._api, name)
+
+    async def echonetMessage(self, host, deojgc, deojcc, deojci, esv, opc) -> bool:
+        if esv != SETC:
+            raise ValueError(f"ESV {hex(esv)} cannot be part of a write transaction")
+        self._opc.extend(opc)
+        return True
+
+
+class WriteTransaction:
+    """Collect property writes for an instance and send them as one SetC.
+
+    Properties are added either directly with set() or by running one of
+    pychonet's setter methods with add(), which captures the EPC/EDT pairs
+    the setter would have sent instead of sending them. A later write to the
+    same EPC replaces the earlier one but keeps its position in the frame, so
+    e.g. the operation status set first stays first.
+
+    Send the transaction with ECHONETConnector.async_commit().
+    """
+
+    def __init__(self, instance):
+        """Initialize an empty transaction.
+
+        Args:
+            instance: The pychonet EchonetInstance the properties are set on.
+        """
+        self._instance = instance
+        self._opc: dict[int, dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._opc)
+
+    @property
+    def epcs(self) -> list[int]:
+        """Return the EPCs in the transaction, in frame order."""
+        return list(self._opc)
+
+    @property
+    def opc(self) -> list[dict[str, Any]]:
+        """Return the OPC list to send, in pychonet's format."""
+        return list(self._opc.values())
+
+    def set(self, epc: int, edt: Any, pdc: int = 1) -> None:
+        """Add a raw property write, see EchonetInstance.setMessage()."""
+        self._opc[epc] = {"EPC": epc, "PDC": pdc, "EDT": edt}
+
+    async def add(self, setter, *args, **kwargs) -> None:
+        """Add the properties a pychonet setter would send.
+
+        Args:
+            setter: A setter method bound to the transaction's instance, e.g.
+                instance.setMode.
+            *args: Positional arguments for the setter.
+            **kwargs: Keyword arguments for the setter.
+
+        Raises:
+            ValueError: If setter is not bound to the instance, or sends
+                anything other than a SetC.
+        """
+        if getattr(setter, "__self__", None) is not self._instance:
+            raise ValueError(f"{setter!r} is not a method of {self._instance!r}")
+        recorded: list[dict[str, Any]] = []
+        # Run the setter's function on a shallow copy whose API records
+        # instead of sending; the instance itself is left untouched.
+        proxy = copy.copy(self._instance)
+        proxy._api = _RecordingAPI(self._instance._api, recorded)
+        await setter.__func__(proxy, *args, **kwargs)
+        for opc in recorded:
+            self._opc[opc["EPC"]] = opc
+        _LOGGER.debug(
+            "ECHONETLite: write transaction captured %s from %s",
+            [hex(opc["EPC"]) for opc in recorded],
+            setter.__name__,
+        )